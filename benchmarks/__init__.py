@@ -0,0 +1,109 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the IMPROVER plugins, run with airspeed velocity (asv).
+
+The inputs are synthetic cubes built with improver.synthetic_data, so the
+benchmarks need no data files or network access. Each benchmark is
+parametrised by the name of a grid from GRID_SHAPES, which range up to the
+size of the UK domain, so that the scaling with grid size can be seen.
+Benchmarks are run from the top of the repository with::
+
+    asv run --python=same
+"""
+
+from typing import Tuple
+
+import numpy as np
+from iris.cube import Cube
+
+from improver.synthetic_data.set_up_test_cubes import (
+    set_up_probability_cube,
+    set_up_variable_cube,
+)
+
+# Number of y and x points in each benchmarked grid, at 2 km grid spacing
+GRID_SHAPES = {
+    "quarter_uk": (261, 243),
+    "half_uk": (521, 485),
+    "uk": (1042, 970),
+}
+
+# Number of realizations for ensemble inputs
+N_REALIZATIONS = 12
+
+
+def grid_shape(grid: str) -> Tuple[int, int]:
+    """Return the shape of a named benchmark grid."""
+    return GRID_SHAPES[grid]
+
+
+def field_data(grid: str, n_leading: int, offset: float = 0.0) -> np.ndarray:
+    """Create smoothly varying random data with a leading dimension.
+
+    Args:
+        grid:
+            Name of the grid in GRID_SHAPES.
+        n_leading:
+            Length of the leading dimension.
+        offset:
+            Value added to the data.
+
+    Returns:
+        Float32 array of data with values around zero plus the offset.
+    """
+    rng = np.random.default_rng(0)
+    ny, nx = grid_shape(grid)
+    y, x = np.meshgrid(
+        np.linspace(0, 4 * np.pi, ny), np.linspace(0, 4 * np.pi, nx), indexing="ij"
+    )
+    data = 5 * np.sin(y) * np.cos(x) + rng.normal(0, 1, (n_leading, ny, nx))
+    return (data + offset).astype(np.float32)
+
+
+def temperature_cube(grid: str, n_realizations: int = N_REALIZATIONS) -> Cube:
+    """Set up an ensemble air temperature cube on a 2 km equal area grid.
+
+    Args:
+        grid:
+            Name of the grid in GRID_SHAPES.
+        n_realizations:
+            Number of realizations.
+
+    Returns:
+        Cube of air temperature in K with realization, y and x dimensions.
+    """
+    return set_up_variable_cube(
+        field_data(grid, n_realizations, offset=280),
+        spatial_grid="equalarea",
+        x_grid_spacing=2000,
+        y_grid_spacing=2000,
+    )
+
+
+def probability_cube(grid: str, n_thresholds: int = 3, **kwargs) -> Cube:
+    """Set up a cube of probabilities of air temperature exceeding
+    thresholds on a 2 km equal area grid.
+
+    Args:
+        grid:
+            Name of the grid in GRID_SHAPES.
+        n_thresholds:
+            Number of thresholds.
+        kwargs:
+            Further arguments for set_up_probability_cube, e.g. frt.
+
+    Returns:
+        Cube of probabilities with threshold, y and x dimensions.
+    """
+    data = np.clip(field_data(grid, n_thresholds, offset=0.5) / 10 + 0.5, 0, 1)
+    thresholds = np.linspace(275, 285, n_thresholds, dtype=np.float32)
+    return set_up_probability_cube(
+        np.sort(data, axis=0)[::-1],
+        thresholds,
+        spatial_grid="equalarea",
+        x_grid_spacing=2000,
+        y_grid_spacing=2000,
+        **kwargs,
+    )
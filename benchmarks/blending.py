@@ -0,0 +1,49 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for blending."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from improver.blending.calculate_weights_and_blend import WeightAndBlend
+
+from . import GRID_SHAPES, probability_cube
+
+
+class WeightAndBlendSuite:
+    """Benchmark WeightAndBlend of probabilities from consecutive cycles of
+    a model, with and without spatial weights from a partly masked cycle."""
+
+    params = [list(GRID_SHAPES), [2, 6], [False, True]]
+    param_names = ["grid", "n_cycles", "spatial_weights"]
+
+    def setup(self, grid, n_cycles, spatial_weights):
+        time = datetime(2018, 9, 10, 12)
+        frts = [time - timedelta(hours=6 + i) for i in range(n_cycles)]
+        self.cubes = [
+            probability_cube(grid, time=time, frt=frt, standard_grid_metadata="uk_det")
+            for frt in frts
+        ]
+        if spatial_weights:
+            # mask part of the latest cycle so that the weights vary in space
+            cube = self.cubes[0]
+            mask = np.zeros(cube.shape, dtype=bool)
+            mask[..., : cube.shape[-1] // 4] = True
+            cube.data = np.ma.masked_array(cube.data, mask=mask)
+        self.cycletime = frts[0].strftime("%Y%m%dT%H%MZ")
+        self.plugin = WeightAndBlend(
+            "forecast_reference_time", "linear", y0val=1, ynval=1
+        )
+
+    def time_process(self, grid, n_cycles, spatial_weights):
+        self.plugin(
+            self.cubes, cycletime=self.cycletime, spatial_weights=spatial_weights
+        )
+
+    def peakmem_process(self, grid, n_cycles, spatial_weights):
+        self.plugin(
+            self.cubes, cycletime=self.cycletime, spatial_weights=spatial_weights
+        )
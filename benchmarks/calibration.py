@@ -0,0 +1,148 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for ensemble calibration."""
+
+import numpy as np
+from iris.cube import CubeList
+
+from improver.calibration.ensemble_calibration import (
+    ContinuousRankedProbabilityScoreMinimisers,
+)
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+# Number of days of historic forecasts and the shape of the grid used to
+# estimate the coefficients
+N_DAYS = 30
+TRAINING_SHAPE = (100, 100)
+
+
+class CRPSMinimisationSuite:
+    """Benchmark estimating a single set of EMOS coefficients by minimising
+    the CRPS with each minimisation method, using the ensemble mean as the
+    predictor."""
+
+    params = [
+        ["norm", "truncnorm"],
+        ContinuousRankedProbabilityScoreMinimisers.MINIMISATION_METHODS,
+    ]
+    param_names = ["distribution", "method"]
+
+    def setup(self, distribution, method):
+        rng = np.random.default_rng(0)
+        shape = (N_DAYS, *TRAINING_SHAPE)
+        offset = 280 if distribution == "norm" else 5
+        mean = rng.normal(offset, 3, shape).astype(np.float32)
+        if distribution == "truncnorm":
+            mean = np.abs(mean)
+        variance = rng.uniform(0.5, 2, shape).astype(np.float32)
+        truth = mean + 0.5 + rng.normal(0, 1.5, shape).astype(np.float32)
+        if distribution == "truncnorm":
+            truth = np.abs(truth)
+
+        def cube(data):
+            return set_up_variable_cube(
+                data, spatial_grid="equalarea", x_grid_spacing=2000, y_grid_spacing=2000
+            )
+
+        self.mean = cube(mean)
+        self.variance = cube(variance)
+        self.truth = cube(truth)
+        self.plugin = ContinuousRankedProbabilityScoreMinimisers(
+            "mean", tolerance=1e-4, minimisation_method=method
+        )
+
+    def time_process(self, distribution, method):
+        self.plugin(
+            np.array([0, 1, 0, 1], dtype=np.float64),
+            CubeList([self.mean.copy()]),
+            self.truth.copy(),
+            self.variance.copy(),
+            distribution,
+        )
+
+
+class PointByPointSuite:
+    """Benchmark estimating EMOS coefficients independently for each point
+    of a grid, minimising each point in turn or all points at once."""
+
+    params = [[400, 2500], ["L-BFGS-B", "batched"]]
+    param_names = ["n_points", "method"]
+    timeout = 600
+
+    def setup(self, n_points, method):
+        rng = np.random.default_rng(0)
+        side = int(np.sqrt(n_points))
+        shape = (N_DAYS, side, side)
+        mean = rng.normal(280, 3, shape).astype(np.float32)
+        variance = rng.uniform(0.5, 2, shape).astype(np.float32)
+        truth = mean + 0.5 + rng.normal(0, 1.5, shape).astype(np.float32)
+        self.mean, self.variance, self.truth = [
+            set_up_variable_cube(data) for data in (mean, variance, truth)
+        ]
+        self.initial_guess = np.broadcast_to(
+            np.array([0, 1, 0, 1], dtype=np.float64), (side * side, 4)
+        )
+        self.plugin = ContinuousRankedProbabilityScoreMinimisers(
+            "mean", tolerance=1e-4, point_by_point=True, minimisation_method=method
+        )
+
+    def time_process(self, n_points, method):
+        self.plugin(
+            self.initial_guess,
+            CubeList([self.mean.copy()]),
+            self.truth.copy(),
+            self.variance.copy(),
+            "norm",
+        )
+
+
+class WarmStartSuite:
+    """Benchmark estimating EMOS coefficients starting from the default
+    initial guess or from the coefficients estimated from the previous
+    cycle's training data."""
+
+    params = [["Nelder-Mead", "L-BFGS-B"]]
+    param_names = ["method"]
+
+    def setup(self, method):
+        rng = np.random.default_rng(0)
+        shape = (N_DAYS + 1, *TRAINING_SHAPE)
+        mean = rng.normal(280, 3, shape).astype(np.float32)
+        variance = rng.uniform(0.5, 2, shape).astype(np.float32)
+        truth = mean + 0.5 + rng.normal(0, 1.5, shape).astype(np.float32)
+        # The previous cycle's training data overlaps all but one day.
+        self.cycles = [
+            [set_up_variable_cube(data[days]) for data in (mean, truth, variance)]
+            for days in (slice(0, N_DAYS), slice(1, N_DAYS + 1))
+        ]
+        self.default_guess = np.array([0, 1, 0, 1], dtype=np.float64)
+        self.previous_coefficients = self._minimise(method, self.default_guess, 0)[0]
+
+    def _minimise(self, method, initial_guess, cycle):
+        """Minimise for a cycle, returning the coefficients and the number
+        of iterations taken."""
+        mean, truth, variance = self.cycles[cycle]
+        plugin = ContinuousRankedProbabilityScoreMinimisers(
+            "mean", tolerance=1e-4, minimisation_method=method
+        )
+        coefficients = plugin(
+            initial_guess,
+            CubeList([mean.copy()]),
+            truth.copy(),
+            variance.copy(),
+            "norm",
+        )
+        return coefficients, plugin.iterations
+
+    def time_cold_start(self, method):
+        self._minimise(method, self.default_guess, 1)
+
+    def time_warm_start(self, method):
+        self._minimise(method, self.previous_coefficients, 1)
+
+    def track_iterations_saved(self, method):
+        _, cold = self._minimise(method, self.default_guess, 1)
+        _, warm = self._minimise(method, self.previous_coefficients, 1)
+        return cold - warm
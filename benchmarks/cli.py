@@ -0,0 +1,23 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for starting the command line interface."""
+
+import subprocess  # nosec
+import sys
+
+
+class StartupSuite:
+    """Benchmark starting a fresh interpreter and running a command which
+    does no processing, as in a batch of many short commands."""
+
+    params = [["threshold --help", "--dry-run threshold [ nbhood input.nc ] -o o.nc"]]
+    param_names = ["command"]
+
+    def time_startup(self, command):
+        subprocess.run(  # nosec
+            [sys.executable, "-m", "improver.cli", *command.split()],
+            check=True,
+            capture_output=True,
+        )
@@ -0,0 +1,40 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for ensemble copula coupling."""
+
+import numpy as np
+
+from improver.ensemble_copula_coupling.ensemble_copula_coupling import (
+    ResamplePercentiles,
+)
+from improver.synthetic_data.set_up_test_cubes import set_up_percentile_cube
+
+from . import GRID_SHAPES, field_data
+
+
+class ResamplePercentilesSuite:
+    """Benchmark ResamplePercentiles from 12 temperature percentiles to
+    different numbers of percentiles."""
+
+    params = [list(GRID_SHAPES), [12, 50]]
+    param_names = ["grid", "no_of_percentiles"]
+
+    def setup(self, grid, no_of_percentiles):
+        data = np.sort(field_data(grid, 12, offset=280), axis=0)
+        percentiles = np.linspace(5, 95, 12, dtype=np.float32)
+        self.cube = set_up_percentile_cube(
+            data,
+            percentiles,
+            spatial_grid="equalarea",
+            x_grid_spacing=2000,
+            y_grid_spacing=2000,
+        )
+        self.plugin = ResamplePercentiles()
+
+    def time_process(self, grid, no_of_percentiles):
+        self.plugin(self.cube, no_of_percentiles=no_of_percentiles)
+
+    def peakmem_process(self, grid, no_of_percentiles):
+        self.plugin(self.cube, no_of_percentiles=no_of_percentiles)
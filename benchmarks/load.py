@@ -0,0 +1,47 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for loading many small files."""
+
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from improver.synthetic_data.set_up_test_cubes import set_up_probability_cube
+from improver.utilities.load import load_cubelist
+from improver.utilities.save import save_netcdf
+
+
+class LoadManyFilesSuite:
+    """Benchmark loading 100 files of probabilities at successive lead
+    times, with iris or with the fast loader."""
+
+    params = [[False, True]]
+    param_names = ["fast_load"]
+
+    def setup(self, fast_load):
+        self.directory = tempfile.mkdtemp()
+        frt = datetime(2018, 9, 10, 0)
+        data = np.ones((3, 100, 100), dtype=np.float32)
+        self.paths = []
+        for hour in range(1, 101):
+            cube = set_up_probability_cube(
+                data,
+                [275.0, 280.0, 285.0],
+                spatial_grid="equalarea",
+                time=frt + timedelta(hours=hour),
+                frt=frt,
+            )
+            path = str(Path(self.directory) / f"{hour:03d}.nc")
+            save_netcdf(cube, path)
+            self.paths.append(path)
+
+    def teardown(self, fast_load):
+        shutil.rmtree(self.directory)
+
+    def time_load(self, fast_load):
+        load_cubelist(self.paths, fast_load=fast_load)
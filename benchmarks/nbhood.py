@@ -0,0 +1,159 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for neighbourhood processing."""
+
+import numpy as np
+
+from improver.nbhood.nbhood import (
+    GeneratePercentilesFromANeighbourhood,
+    NeighbourhoodProcessing,
+    circular_kernel,
+)
+from improver.nbhood.recursive_filter import RecursiveFilter
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.neighbourhood_tools import blocked_boxsum, boxsum, chordsum
+
+from . import GRID_SHAPES, field_data, grid_shape, probability_cube
+
+
+class NeighbourhoodProcessingSuite:
+    """Benchmark NeighbourhoodProcessing over probabilities at 3 thresholds."""
+
+    params = [list(GRID_SHAPES), ["square", "circular"], [10000, 50000]]
+    param_names = ["grid", "method", "radius"]
+
+    def setup(self, grid, method, radius):
+        self.cube = probability_cube(grid)
+        self.plugin = NeighbourhoodProcessing(method, radius)
+
+    def time_process(self, grid, method, radius):
+        self.plugin(self.cube)
+
+    def peakmem_process(self, grid, method, radius):
+        self.plugin(self.cube)
+
+
+class MultiThresholdNeighbourhoodSuite:
+    """Benchmark NeighbourhoodProcessing over probabilities at many
+    thresholds, where the cost of handling each x-y slice is significant."""
+
+    params = [["quarter_uk", "uk"], ["square", "circular"], [10, 40]]
+    param_names = ["grid", "method", "thresholds"]
+
+    def setup(self, grid, method, thresholds):
+        self.cube = probability_cube(grid, n_thresholds=thresholds)
+        self.plugin = NeighbourhoodProcessing(method, 20000)
+
+    def time_process(self, grid, method, thresholds):
+        self.plugin(self.cube)
+
+    def peakmem_process(self, grid, method, thresholds):
+        self.plugin(self.cube)
+
+
+class AccumulationSuite:
+    """Benchmark neighbourhood totals of float32 temperatures at 3
+    thresholds, from a float64 copy of the data or from cumulative sums of
+    the float32 data in float64 blocks, which needs no full size float64
+    array."""
+
+    params = [list(GRID_SHAPES), ["square", "circular"], ["float64", "blocked"]]
+    param_names = ["grid", "method", "accumulation"]
+
+    def setup(self, grid, method, accumulation):
+        self.data = field_data(grid, 3, offset=280)
+        self.kernel = circular_kernel(10, weighted_mode=False)
+
+    def calculate(self, method, accumulation):
+        data = self.data
+        if accumulation == "float64":
+            data = data.astype(np.float64)
+        if method == "square":
+            boxsum_method = boxsum if accumulation == "float64" else blocked_boxsum
+            result = boxsum_method(data, 21, mode="constant")
+        else:
+            result = chordsum(data, self.kernel, blocked=accumulation == "blocked")
+        return result.astype(np.float32, copy=False)
+
+    def time_totals(self, grid, method, accumulation):
+        self.calculate(method, accumulation)
+
+    def peakmem_totals(self, grid, method, accumulation):
+        self.calculate(method, accumulation)
+
+
+class NeighbourhoodPercentilesSuite:
+    """Benchmark calculating percentiles from a circular neighbourhood about
+    each point of one realization, either sliding the neighbourhood along
+    each row (which requires numba) or gathering every neighbourhood."""
+
+    params = [["quarter_uk", "uk"], [2, 5, 10], ["sliding", "window"]]
+    param_names = ["grid", "radius_in_cells", "method"]
+
+    def setup(self, grid, radius_in_cells, method):
+        self.data = field_data(grid, 1, offset=280)[0]
+        self.kernel = circular_kernel(radius_in_cells, weighted_mode=False)
+        self.percentiles = np.array([10, 25, 50, 75, 90], dtype=np.float32)
+        if method == "sliding":
+            # Compile the numba function before timing.
+            self.calculate(method)
+
+    def calculate(self, method):
+        if method == "sliding":
+            GeneratePercentilesFromANeighbourhood._sliding_percentiles(
+                self.data, self.kernel, self.percentiles
+            )
+        else:
+            out = np.empty((len(self.percentiles),) + self.data.shape, np.float32)
+            GeneratePercentilesFromANeighbourhood._window_percentiles(
+                self.data, self.kernel, self.percentiles, out
+            )
+
+    def time_percentiles(self, grid, radius_in_cells, method):
+        self.calculate(method)
+
+    def peakmem_percentiles(self, grid, radius_in_cells, method):
+        self.calculate(method)
+
+
+class RecursiveFilterSuite:
+    """Benchmark RecursiveFilter over probabilities at 3 thresholds with
+    uniform smoothing coefficients. All thresholds are filtered in one call
+    of a compiled recursion where numba is available."""
+
+    params = [list(GRID_SHAPES), [1, 4]]
+    param_names = ["grid", "iterations"]
+
+    def setup(self, grid, iterations):
+        self.cube = probability_cube(grid)
+        self.smoothing_coefficients = [
+            self._smoothing_coefficients(grid, axis) for axis in ("x", "y")
+        ]
+        self.plugin = RecursiveFilter(iterations=iterations)
+        # Compile the numba function, if available, before timing.
+        self.plugin(self.cube, self.smoothing_coefficients)
+
+    @staticmethod
+    def _smoothing_coefficients(grid, axis):
+        """Set up a cube of smoothing coefficients on the grid of points
+        midway between adjacent points along the axis."""
+        cube = set_up_variable_cube(
+            np.full(grid_shape(grid), 0.5, dtype=np.float32),
+            name=f"smoothing_coefficient_{axis}",
+            units="1",
+            spatial_grid="equalarea",
+            x_grid_spacing=2000,
+            y_grid_spacing=2000,
+        )
+        points = cube.coord(axis=axis).points
+        cube = cube[:-1] if axis == "y" else cube[:, :-1]
+        cube.coord(axis=axis).points = (points[:-1] + points[1:]) / 2
+        return cube
+
+    def time_process(self, grid, iterations):
+        self.plugin(self.cube, self.smoothing_coefficients)
+
+    def peakmem_process(self, grid, iterations):
+        self.plugin(self.cube, self.smoothing_coefficients)
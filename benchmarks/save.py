@@ -0,0 +1,49 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for reading saved outputs with different chunking."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from netCDF4 import Dataset
+
+from improver.utilities.save import save_netcdf
+
+from . import probability_cube
+
+
+class ChunkedReadSuite:
+    """Benchmark reading a UK grid of probabilities at 20 thresholds, saved
+    with each chunking option, either as whole fields or as the values at
+    all thresholds for a set of points."""
+
+    params = [["field", "series", "balanced"]]
+    param_names = ["chunking"]
+
+    def setup(self, chunking):
+        self.directory = tempfile.mkdtemp()
+        self.path = Path(self.directory) / f"{chunking}.nc"
+        cube = probability_cube("uk", n_thresholds=20)
+        save_netcdf(cube, self.path, chunking=chunking)
+        rng = np.random.default_rng(0)
+        ny, nx = cube.shape[1:]
+        self.points = list(zip(rng.integers(0, ny, 100), rng.integers(0, nx, 100)))
+
+    def teardown(self, chunking):
+        shutil.rmtree(self.directory)
+
+    def time_read_fields(self, chunking):
+        with Dataset(self.path) as dataset:
+            data = dataset.variables["probability_of_air_temperature_above_threshold"]
+            for i in range(data.shape[0]):
+                data[i]
+
+    def time_read_points(self, chunking):
+        with Dataset(self.path) as dataset:
+            data = dataset.variables["probability_of_air_temperature_above_threshold"]
+            for y, x in self.points:
+                data[:, y, x]
@@ -0,0 +1,54 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for spot data extraction."""
+
+import numpy as np
+
+from improver.metadata.utilities import create_coordinate_hash
+from improver.spotdata.build_spotdata_cube import build_spotdata_cube
+from improver.spotdata.spot_extraction import SpotExtraction
+
+from . import GRID_SHAPES, grid_shape, temperature_cube
+
+
+class SpotExtractionSuite:
+    """Benchmark SpotExtraction of ensemble temperatures at randomly placed
+    sites."""
+
+    params = [list(GRID_SHAPES), [1000, 20000]]
+    param_names = ["grid", "n_sites"]
+
+    def setup(self, grid, n_sites):
+        self.cube = temperature_cube(grid)
+        rng = np.random.default_rng(0)
+        ny, nx = grid_shape(grid)
+        indices = np.stack(
+            [
+                rng.integers(0, nx, n_sites),
+                rng.integers(0, ny, n_sites),
+                np.zeros(n_sites),
+            ]
+        ).astype(np.float32)
+        self.neighbour_cube = build_spotdata_cube(
+            indices[np.newaxis],
+            "grid_neighbours",
+            1,
+            rng.uniform(0, 1000, n_sites).astype(np.float32),
+            rng.uniform(49, 61, n_sites).astype(np.float32),
+            rng.uniform(-10, 2, n_sites).astype(np.float32),
+            [f"{i:05d}" for i in range(n_sites)],
+            grid_attributes=["x_index", "y_index", "vertical_displacement"],
+            neighbour_methods=["nearest"],
+        )
+        self.neighbour_cube.attributes["model_grid_hash"] = create_coordinate_hash(
+            self.cube
+        )
+        self.plugin = SpotExtraction()
+
+    def time_process(self, grid, n_sites):
+        self.plugin(self.neighbour_cube, self.cube)
+
+    def peakmem_process(self, grid, n_sites):
+        self.plugin(self.neighbour_cube, self.cube)
@@ -0,0 +1,31 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for thresholding."""
+
+from improver.threshold import Threshold
+
+from . import GRID_SHAPES, temperature_cube
+
+
+class ThresholdSuite:
+    """Benchmark Threshold of ensemble temperatures, with and without
+    fuzzy bounds and collapsing the realizations."""
+
+    params = [list(GRID_SHAPES), [1, 10], [None, 0.99]]
+    param_names = ["grid", "n_thresholds", "fuzzy_factor"]
+
+    def setup(self, grid, n_thresholds, fuzzy_factor):
+        self.cube = temperature_cube(grid)
+        self.plugin = Threshold(
+            threshold_values=[275.0 + i for i in range(n_thresholds)],
+            fuzzy_factor=fuzzy_factor,
+            collapse_coord="realization",
+        )
+
+    def time_process(self, grid, n_thresholds, fuzzy_factor):
+        self.plugin(self.cube)
+
+    def peakmem_process(self, grid, n_thresholds, fuzzy_factor):
+        self.plugin(self.cube)
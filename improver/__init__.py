@@ -32,6 +32,10 @@ class BasePlugin(ABC):
         Returns:
             Output of self.process()
         """
+        from improver.telemetry import record_call, telemetry_filename
+
+        if telemetry_filename() is not None:
+            return record_call(self, self.process, args, kwargs)
         return self.process(*args, **kwargs)
 
     @abstractmethod
@@ -35,6 +35,7 @@ from improver.calibration.utilities import (
     create_unified_frt_coord,
     filter_non_matching_cubes,
     flatten_ignoring_masked_data,
+    flatten_spatial_dimensions,
     forecast_coords_match,
     merge_land_and_sea,
 )
@@ -51,7 +52,78 @@ from improver.metadata.utilities import (
     create_new_diagnostic_cube,
     generate_mandatory_attributes,
 )
+from improver.telemetry import telemetry_count
 from improver.utilities.cube_manipulation import collapsed, enforce_coordinate_ordering
+from improver.utilities.parallel import (
+    SharedArrays,
+    attach_shared_arrays,
+    process_map,
+    shared_memory_available,
+)
+
+# The inputs for minimising points in a worker process, set by
+# _init_point_worker.
+_POINT_WORKER = {}
+
+
+def _init_point_worker(
+    minimiser: "ContinuousRankedProbabilityScoreMinimisers",
+    function_name: str,
+    handles: Dict[str, Tuple],
+    sqrt_pi: float,
+) -> None:
+    """Prepare a worker process to minimise points, attaching to the input
+    arrays held in shared memory.
+
+    Args:
+        minimiser:
+            The plugin performing the minimisation.
+        function_name:
+            Name of the plugin's method to minimise.
+        handles:
+            Handles of the shared arrays, as created by
+            ContinuousRankedProbabilityScoreMinimisers._minimise_points_in_processes.
+        sqrt_pi:
+            Square root of pi for minimisation.
+    """
+    blocks, arrays = attach_shared_arrays(handles)
+    n_predictors = len(arrays) - 3
+    _POINT_WORKER.update(
+        minimiser=minimiser,
+        minimisation_function=getattr(minimiser, function_name),
+        blocks=blocks,
+        initial_guess=arrays["initial_guess"],
+        forecast_predictors=[arrays[f"predictor{i}"] for i in range(n_predictors)],
+        truth=arrays["truth"],
+        forecast_var=arrays["forecast_var"],
+        sqrt_pi=sqrt_pi,
+    )
+
+
+def _minimise_point_chunk(indices: range) -> List[Tuple[ndarray, bool, int]]:
+    """Minimise a chunk of points in a worker process prepared by
+    _init_point_worker.
+
+    Args:
+        indices:
+            Indices of the points along the flattened spatial dimensions.
+
+    Returns:
+        The result of _minimise_point for each point.
+    """
+    state = _POINT_WORKER
+    return [
+        state["minimiser"]._minimise_point(
+            state["minimisation_function"],
+            index,
+            state["initial_guess"],
+            state["forecast_predictors"],
+            state["truth"],
+            state["forecast_var"],
+            state["sqrt_pi"],
+        )
+        for index in indices
+    ]
 
 
 class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
@@ -64,10 +136,16 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
     The number of coefficients that will be optimised depend upon the initial
     guess. The coefficients will be calculated either using all points provided
     or coefficients will be calculated separately for each point.
-    Minimisation is performed using the Nelder-Mead algorithm for 200
-    iterations to limit the computational expense.
+    By default, minimisation is performed using the Nelder-Mead algorithm
+    with a limited number of iterations to limit the computational expense.
     Note that the BFGS algorithm was initially trialled but had a bug
-    in comparison to comparative results generated in R.
+    in comparison to comparative results generated in R. The BFGS and
+    L-BFGS-B algorithms can now be selected, using the analytic gradient of
+    the CRPS with respect to the coefficients rather than a finite difference
+    approximation, which typically needs far fewer evaluations of the CRPS.
+    When coefficients are calculated separately for each point, the
+    "batched" method advances the coefficients of every point together
+    using BFGS steps computed with array operations.
 
     """
 
@@ -75,6 +153,22 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
     # performing the minimisation.
     TOLERATED_PERCENTAGE_CHANGE = 5
 
+    # The supported minimisation methods. All except Nelder-Mead use the
+    # analytic gradient of the CRPS. All except "batched" are methods of
+    # scipy.optimize.minimize, while "batched" minimises every point at once.
+    MINIMISATION_METHODS = ["Nelder-Mead", "BFGS", "L-BFGS-B", "batched"]
+
+    # The CRPS depends on gamma and delta only through their squares, so its
+    # gradient with respect to either is zero where it is zero. Gradient
+    # methods therefore start with gamma and delta at least this far from
+    # zero, so that they are not held at zero.
+    MIN_SCALE_COEFFICIENT = 1e-4
+
+    # The sufficient decrease condition and the maximum number of times the
+    # step is halved in the line search of the batched minimisation.
+    ARMIJO_CONDITION = 1e-4
+    MAX_STEP_HALVINGS = 30
+
     # An arbitrary value set if an infinite value is detected
     # as part of the minimisation.
     BAD_VALUE = np.float64(999999)
@@ -85,6 +179,9 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         tolerance: float = 0.02,
         max_iterations: int = 1000,
         point_by_point: bool = False,
+        n_workers: int = 1,
+        minimisation_method: str = "Nelder-Mead",
+        gradient_tolerance: float = 1e-5,
     ) -> None:
         """
         Initialise class for performing minimisation of the Continuous
@@ -117,7 +214,38 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 If True, coefficients are calculated independently for each
                 point within the input cube by minimising each point
                 independently.
+            n_workers:
+                Number of processes used to minimise the points when
+                point_by_point is True. The points are divided into chunks,
+                and the inputs are placed in shared memory for the worker
+                processes. The coefficients do not depend on the number of
+                processes. The points are minimised in turn if shared memory
+                is not available, which requires Python 3.8 or later. The
+                "batched" minimisation method already minimises every point
+                at once, so cannot be combined with more than one worker.
+            minimisation_method:
+                The method of scipy.optimize.minimize used to minimise the
+                CRPS, one of "Nelder-Mead", "BFGS", "L-BFGS-B" or "batched".
+                The other methods use the analytic gradient of the CRPS and
+                terminate once the largest component of the gradient is
+                within the gradient_tolerance. The "batched" method applies
+                BFGS to the coefficients of every point at once using array
+                operations, which is much faster than minimising each point
+                in turn when point_by_point is True.
+            gradient_tolerance:
+                The tolerance for the largest component of the gradient of
+                the CRPS with respect to the coefficients, used by the
+                "BFGS", "L-BFGS-B" and "batched" minimisation methods in
+                place of the tolerance for the CRPS. The gradient
+                with respect to beta scales with the magnitude of the
+                predictors, so this is much tighter than the tolerance for
+                the CRPS.
 
+        Raises:
+            ValueError: If n_workers is less than 1.
+            ValueError: If the minimisation method is not supported.
+            ValueError: If the "batched" minimisation method is requested
+                with more than one worker.
         """
         # Dictionary containing the functions that will be minimised,
         # depending upon the distribution requested. The names of these
@@ -126,11 +254,47 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             "norm": self.calculate_normal_crps,
             "truncnorm": self.calculate_truncated_normal_crps,
         }
+        # Dictionary containing the gradient of each function that can be
+        # minimised, keyed by the name of the function.
+        self.gradient_dict = {
+            "calculate_normal_crps": self.calculate_normal_crps_gradient,
+            "calculate_truncated_normal_crps": (
+                self.calculate_truncated_normal_crps_gradient
+            ),
+        }
+        # Dictionary containing the functions that calculate the CRPS at
+        # each point and its derivatives, keyed by the name of the function
+        # that can be minimised.
+        self.crps_derivatives_dict = {
+            "calculate_normal_crps": self._normal_crps_derivatives,
+            "calculate_truncated_normal_crps": (
+                self._truncated_normal_crps_derivatives
+            ),
+        }
+        if minimisation_method not in self.MINIMISATION_METHODS:
+            msg = (
+                f"Minimisation method {minimisation_method} is not supported. "
+                f"Supported methods are {self.MINIMISATION_METHODS}"
+            )
+            raise ValueError(msg)
+        self.minimisation_method = minimisation_method
         self.predictor = check_predictor(predictor)
         self.tolerance = tolerance
+        self.gradient_tolerance = gradient_tolerance
         # Maximum iterations for minimisation using Nelder-Mead.
         self.max_iterations = max_iterations
         self.point_by_point = point_by_point
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+        if minimisation_method == "batched" and n_workers > 1:
+            msg = (
+                "The batched minimisation method minimises every point at "
+                f"once, so cannot be used with n_workers={n_workers}."
+            )
+            raise ValueError(msg)
+        self.n_workers = n_workers
+        # Total number of iterations taken by the last minimisation.
+        self.iterations = 0
 
     def _normal_crps_preparation(
         self,
@@ -290,6 +454,222 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             result = self.BAD_VALUE
         return result
 
+    def _crps_gradient(
+        self,
+        initial_guess: ndarray,
+        forecast_predictor: ndarray,
+        forecast_var: ndarray,
+        sigma: ndarray,
+        crps_mu: ndarray,
+        crps_sigma: ndarray,
+    ) -> ndarray:
+        """
+        Calculate the gradient of the mean CRPS with respect to the
+        coefficients from the derivatives of the CRPS at each point with
+        respect to the location and scale parameters.
+
+        Args:
+            initial_guess:
+                List of coefficients.
+                Order of coefficients is [alpha, beta, gamma, delta].
+            forecast_predictor:
+                Data to be used as the predictor.
+            forecast_var:
+                Ensemble variance data.
+            sigma:
+                The scale parameter at each point.
+            crps_mu:
+                Derivative of the CRPS at each point with respect to the
+                location parameter.
+            crps_sigma:
+                Derivative of the CRPS at each point with respect to the
+                scale parameter.
+
+        Returns:
+            Gradient of the mean CRPS, with one value for each coefficient.
+        """
+        gamma, delta = initial_guess[-2], initial_guess[-1]
+        all_data = np.column_stack((np.ones(sigma.shape), forecast_predictor))
+        gradient_a_b = np.nanmean(all_data * crps_mu[:, np.newaxis], axis=0)
+        if self.predictor == "realizations":
+            # The realizations are weighted by the square of each beta.
+            gradient_a_b[1:] *= 2 * initial_guess[1:-2]
+        gradient_gamma = np.nanmean(crps_sigma * gamma / sigma)
+        gradient_delta = np.nanmean(crps_sigma * delta * forecast_var / sigma)
+        return np.array(
+            [*gradient_a_b, gradient_gamma, gradient_delta], dtype=np.float64
+        )
+
+    @staticmethod
+    def _normal_crps_derivatives(
+        mu: ndarray, sigma: ndarray, truth: ndarray, sqrt_pi: float
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """
+        Calculate the CRPS for a normal distribution at each point, as in
+        calculate_normal_crps, and its derivatives with respect to the
+        location parameter (mu) and scale parameter (sigma), which are
+        1 - 2 * CDF(xz) and 2 * PDF(xz) - 1 / sqrt(pi), where xz is the
+        normalised prediction error.
+
+        Args:
+            mu:
+                The location parameter at each point.
+            sigma:
+                The scale parameter at each point.
+            truth:
+                Data to be used as truth.
+            sqrt_pi:
+                Square root of Pi
+
+        Returns:
+            The CRPS at each point and its derivatives with respect to mu
+            and sigma.
+        """
+        xz = (truth - mu) / sigma
+        normal_cdf = norm.cdf(xz)
+        normal_pdf = norm.pdf(xz)
+        crps = sigma * (xz * (2 * normal_cdf - 1) + 2 * normal_pdf - 1 / sqrt_pi)
+        return crps, 1 - 2 * normal_cdf, 2 * normal_pdf - 1 / sqrt_pi
+
+    @staticmethod
+    def _truncated_normal_crps_derivatives(
+        mu: ndarray, sigma: ndarray, truth: ndarray, sqrt_pi: float
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """
+        Calculate the CRPS for a truncated normal distribution with zero as
+        the lower bound at each point, as in calculate_truncated_normal_crps,
+        and its derivatives with respect to the location parameter (mu) and
+        scale parameter (sigma).
+
+        The CRPS is written as sigma * h(xz, x0), where xz is the normalised
+        prediction error and x0 = mu / sigma, so that the derivatives with
+        respect to mu and sigma follow from the partial derivatives of h.
+
+        Args:
+            mu:
+                The location parameter at each point.
+            sigma:
+                The scale parameter at each point.
+            truth:
+                Data to be used as truth.
+            sqrt_pi:
+                Square root of Pi
+
+        Returns:
+            The CRPS at each point and its derivatives with respect to mu
+            and sigma.
+        """
+        xz = (truth - mu) / sigma
+        x0 = mu / sigma
+        normal_cdf = norm.cdf(xz)
+        normal_pdf = norm.pdf(xz)
+        normal_cdf_0 = norm.cdf(x0)
+        normal_pdf_0 = norm.pdf(x0)
+        normal_cdf_root_two = norm.cdf(np.sqrt(2) * x0)
+        normal_pdf_root_two = norm.pdf(np.sqrt(2) * x0)
+
+        cdf_0_squared = normal_cdf_0 * normal_cdf_0
+        # h and its partial derivatives with respect to xz and x0.
+        h_xz = (2 * normal_cdf + normal_cdf_0 - 2) / normal_cdf_0
+        h = (
+            xz * h_xz
+            + 2 * normal_pdf / normal_cdf_0
+            - normal_cdf_root_two / (sqrt_pi * cdf_0_squared)
+        )
+        error_terms = xz * (2 * normal_cdf - 2) + 2 * normal_pdf
+        truncation_terms = 2 * normal_cdf_root_two / (sqrt_pi * normal_cdf_0)
+        h_x0 = (
+            normal_pdf_0 * (truncation_terms - error_terms)
+            - np.sqrt(2) * normal_pdf_root_two / sqrt_pi
+        ) / cdf_0_squared
+        return sigma * h, h_x0 - h_xz, h - xz * h_xz - x0 * h_x0
+
+    def calculate_normal_crps_gradient(
+        self,
+        initial_guess: ndarray,
+        forecast_predictor: ndarray,
+        truth: ndarray,
+        forecast_var: ndarray,
+        sqrt_pi: float,
+    ) -> ndarray:
+        """
+        Calculate the gradient of the CRPS for a normal distribution, as
+        calculated by calculate_normal_crps, with respect to the coefficients.
+
+        Args:
+            initial_guess:
+                List of coefficients.
+                Order of coefficients is [alpha, beta, gamma, delta].
+            forecast_predictor:
+                Data to be used as the predictor.
+            truth:
+                Data to be used as truth.
+            forecast_var:
+                Ensemble variance data.
+            sqrt_pi:
+                Square root of Pi
+
+        Returns:
+            Gradient of the mean CRPS, with one value for each coefficient.
+            The gradient is zero where calculate_normal_crps returns
+            BAD_VALUE.
+        """
+        mu, sigma, *_ = self._normal_crps_preparation(
+            initial_guess, forecast_predictor, truth, forecast_var
+        )
+        if not np.isfinite(np.min(mu / sigma)):
+            return np.zeros(len(initial_guess), dtype=np.float64)
+        _, crps_mu, crps_sigma = self._normal_crps_derivatives(
+            mu, sigma, truth, sqrt_pi
+        )
+        return self._crps_gradient(
+            initial_guess, forecast_predictor, forecast_var, sigma, crps_mu, crps_sigma
+        )
+
+    def calculate_truncated_normal_crps_gradient(
+        self,
+        initial_guess: ndarray,
+        forecast_predictor: ndarray,
+        truth: ndarray,
+        forecast_var: ndarray,
+        sqrt_pi: float,
+    ) -> ndarray:
+        """
+        Calculate the gradient of the CRPS for a truncated normal distribution
+        with zero as the lower bound, as calculated by
+        calculate_truncated_normal_crps, with respect to the coefficients.
+
+        Args:
+            initial_guess:
+                List of coefficients.
+                Order of coefficients is [alpha, beta, gamma, delta].
+            forecast_predictor:
+                Data to be used as the predictor.
+            truth:
+                Data to be used as truth.
+            forecast_var:
+                Ensemble variance data.
+            sqrt_pi:
+                Square root of Pi
+
+        Returns:
+            Gradient of the mean CRPS, with one value for each coefficient.
+            The gradient is zero where calculate_truncated_normal_crps
+            returns BAD_VALUE.
+        """
+        mu, sigma, *_ = self._normal_crps_preparation(
+            initial_guess, forecast_predictor, truth, forecast_var
+        )
+        x0 = mu / sigma
+        if not (np.isfinite(np.min(x0)) or (np.min(x0) >= -3)):
+            return np.zeros(len(initial_guess), dtype=np.float64)
+        _, crps_mu, crps_sigma = self._truncated_normal_crps_derivatives(
+            mu, sigma, truth, sqrt_pi
+        )
+        return self._crps_gradient(
+            initial_guess, forecast_predictor, forecast_var, sigma, crps_mu, crps_sigma
+        )
+
     def _calculate_percentage_change_in_last_iteration(
         self, allvecs: List[ndarray]
     ) -> None:
@@ -349,16 +729,73 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             A single set of coefficients with the order [alpha, beta, gamma, delta].
 
         """
-        optimised_coeffs = minimize(
+        if self.minimisation_method == "batched":
+            # Minimise the points together as a batch of one.
+            predictors = np.reshape(forecast_predictor_data, (len(truth_data), -1))
+            coeffs, converged, iterations = self._minimise_batched(
+                minimisation_function,
+                np.atleast_2d(initial_guess),
+                predictors.T[np.newaxis],
+                truth_data[np.newaxis],
+                forecast_var_data[np.newaxis],
+                sqrt_pi,
+            )
+            return OptimizeResult(
+                x=coeffs[0],
+                success=bool(converged[0]),
+                nit=int(iterations[0]),
+                message="Batched minimisation finished.",
+            )
+
+        args = (forecast_predictor_data, truth_data, forecast_var_data, sqrt_pi)
+        if self.minimisation_method == "Nelder-Mead":
+            return minimize(
+                minimisation_function,
+                initial_guess,
+                args=args,
+                method="Nelder-Mead",
+                tol=self.tolerance,
+                options={"maxiter": self.max_iterations, "return_all": True},
+            )
+
+        options = {"maxiter": self.max_iterations, "gtol": self.gradient_tolerance}
+        if self.minimisation_method == "BFGS":
+            options["return_all"] = True
+        else:
+            # By default, L-BFGS-B also stops once the relative reduction of
+            # the CRPS is small, which happens long before the gradient
+            # tolerance is met along the narrow valley in alpha and beta.
+            options["ftol"] = np.finfo(np.float64).eps
+        return minimize(
             minimisation_function,
-            initial_guess,
-            args=(forecast_predictor_data, truth_data, forecast_var_data, sqrt_pi),
-            method="Nelder-Mead",
-            tol=self.tolerance,
-            options={"maxiter": self.max_iterations, "return_all": True},
+            self._offset_scale_coefficients(initial_guess),
+            args=args,
+            method=self.minimisation_method,
+            jac=self.gradient_dict[minimisation_function.__name__],
+            options=options,
         )
 
-        return optimised_coeffs
+    def _offset_scale_coefficients(self, initial_guess: ndarray) -> ndarray:
+        """Move gamma and delta in the initial guess at least
+        MIN_SCALE_COEFFICIENT from zero, keeping their sign, as the gradient
+        of the CRPS with respect to each is zero where it is zero.
+
+        Args:
+            initial_guess:
+                Initial guess, with the coefficients in the last dimension in
+                the order [alpha, beta, gamma, delta].
+
+        Returns:
+            A copy of the initial guess with gamma and delta offset from zero.
+        """
+        initial_guess = np.array(initial_guess, dtype=np.float64)
+        scale = initial_guess[..., -2:]
+        initial_guess[..., -2:] = np.where(
+            np.abs(scale) < self.MIN_SCALE_COEFFICIENT,
+            np.copysign(self.MIN_SCALE_COEFFICIENT, scale),
+            scale,
+        )
+        return initial_guess
 
     def _prepare_forecasts(self, forecast_predictors: CubeList) -> ndarray:
         """Prepare forecasts to be a consistent shape for minimisation by
@@ -369,6 +806,24 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             forecast_predictors:
                 The forecast predictors to be reshaped.
 
+        Returns:
+            Reshaped array with a first dimension representing the flattened
+            spatiotemporal dimensions and an optional second dimension for
+            flattened non-spatiotemporal dimensions (e.g. realizations).
+        """
+        return self._flatten_predictors(
+            broadcast_data_to_time_coord(forecast_predictors)
+        )
+
+    def _flatten_predictors(self, forecast_predictors: List[ndarray]) -> ndarray:
+        """Flatten the data of each forecast predictor, ignoring masked data,
+        and stack the predictors as described in _prepare_forecasts.
+
+        Args:
+            forecast_predictors:
+                The data of each forecast predictor, broadcast to the same
+                shape.
+
         Returns:
             Reshaped array with a first dimension representing the flattened
             spatiotemporal dimensions and an optional second dimension for
@@ -376,7 +831,6 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         """
         preserve_leading_dimension = self.predictor == "realizations"
 
-        forecast_predictors = broadcast_data_to_time_coord(forecast_predictors)
         flattened_forecast_predictors = []
         for fp_data in forecast_predictors:
             flattened_forecast_predictors.append(
@@ -405,6 +859,10 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         can be either gridded (i.e. separate dimensions for x and y) or for a
         list of sites where x and y share a common dimension.
 
+        The data are reshaped once so that the spatial points lie along the
+        last dimension, and the data for each point are then selected by
+        index, so the time taken grows linearly with the number of points.
+
         Args:
             minimisation_function:
                 Function to use when minimising.
@@ -421,46 +879,79 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             Multiple beta values can be provided if either realizations
             are provided as the predictor, or if additional predictors
             are provided.
+
+        Raises:
+            ValueError: If the spatial coordinates of the forecast predictors
+                or variance do not match those of the truth.
+
+        Warns:
+            Warning: If the minimisation did not converge for any points.
         """
         fp_template = forecast_predictors[0]
-        sindex = [fp_template.coord(axis="y"), fp_template.coord(axis="x")]
-
-        y_name = truth.coord(axis="y").name()
-        x_name = truth.coord(axis="x").name()
-
-        optimised_coeffs = []
-        for index, (truth_slice, fv_slice) in enumerate(
-            zip(truth.slices_over(sindex), forecast_var.slices_over(sindex))
-        ):
-            # Extract forecast predictor cubelist to match truth and variance cubes
-            constr = iris.Constraint(
-                coord_values={
-                    y_name: lambda cell: any(
-                        np.isclose(cell.point, truth_slice.coord(axis="y").points)
-                    ),
-                    x_name: lambda cell: any(
-                        np.isclose(cell.point, truth_slice.coord(axis="x").points)
-                    ),
-                }
+        for cube in [*forecast_predictors, forecast_var]:
+            for axis in ["y", "x"]:
+                if not np.allclose(
+                    cube.coord(axis=axis).points, truth.coord(axis=axis).points
+                ):
+                    msg = (
+                        f"The {axis} coordinate of the {cube.name()} cube does "
+                        "not match that of the truth cube. The spatial points "
+                        "must match to estimate coefficients for each point."
+                    )
+                    raise ValueError(msg)
+
+        forecast_predictors_data = [
+            flatten_spatial_dimensions(cube, data)
+            for cube, data in zip(
+                forecast_predictors, broadcast_data_to_time_coord(forecast_predictors)
             )
-            forecast_predictors_slice = forecast_predictors.extract(constr)
-            forecast_predictor_data = self._prepare_forecasts(forecast_predictors_slice)
+        ]
+        truth_data = flatten_spatial_dimensions(truth)
+        forecast_var_data = flatten_spatial_dimensions(forecast_var)
+        n_points = truth_data.shape[-1]
 
-            if all(np.isnan(truth_slice.data)):
-                optimised_coeffs.append(
-                    np.array(initial_guess[index], dtype=np.float32)
-                )
-            else:
-                optimised_coeffs.append(
-                    self._minimise_caller(
-                        minimisation_function,
-                        initial_guess[index],
-                        forecast_predictor_data.T,
-                        truth_slice.data,
-                        fv_slice.data,
-                        sqrt_pi,
-                    ).x.astype(np.float32)
+        if self.minimisation_method == "batched":
+            results = self._minimise_points_batched(
+                minimisation_function,
+                initial_guess,
+                forecast_predictors_data,
+                truth_data,
+                forecast_var_data,
+                sqrt_pi,
+            )
+        elif self.n_workers > 1 and n_points > 1 and shared_memory_available():
+            results = self._minimise_points_in_processes(
+                minimisation_function,
+                initial_guess,
+                forecast_predictors_data,
+                truth_data,
+                forecast_var_data,
+                sqrt_pi,
+            )
+        else:
+            results = [
+                self._minimise_point(
+                    minimisation_function,
+                    index,
+                    initial_guess,
+                    forecast_predictors_data,
+                    truth_data,
+                    forecast_var_data,
+                    sqrt_pi,
                 )
+                for index in range(n_points)
+            ]
+        optimised_coeffs = [coeffs for coeffs, _, _ in results]
+        self.iterations = sum(iterations for _, _, iterations in results)
+
+        n_unconverged = sum(not converged for _, converged, _ in results)
+        if n_unconverged:
+            msg = (
+                "Minimisation did not result in convergence after "
+                f"{self.max_iterations} iterations for {n_unconverged} of "
+                f"{n_points} points."
+            )
+            warnings.warn(msg)
 
         y_coord = fp_template.coord(axis="y")
         x_coord = fp_template.coord(axis="x")
@@ -477,6 +968,408 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 )
             )
 
+    def _minimise_point(
+        self,
+        minimisation_function: Callable,
+        index: int,
+        initial_guess: ndarray,
+        forecast_predictors_data: List[ndarray],
+        truth_data: ndarray,
+        forecast_var_data: ndarray,
+        sqrt_pi: float,
+    ) -> Tuple[ndarray, bool, int]:
+        """Minimise one point, selected by index from inputs with the spatial
+        dimensions flattened into the last dimension. If the truth is NaN at
+        every time for the point, the initial guess is returned.
+
+        Args:
+            minimisation_function:
+                Function to use when minimising.
+            index:
+                Index of the point along the flattened spatial dimensions.
+            initial_guess:
+                Initial guess for each point.
+            forecast_predictors_data:
+                Data of each forecast predictor.
+            truth_data:
+                Data to be used as truth.
+            forecast_var_data:
+                Ensemble variance data.
+            sqrt_pi:
+                Square root of pi for minimisation.
+
+        Returns:
+            - The optimised coefficients for the point.
+            - Whether the minimisation converged.
+            - The number of iterations of the minimisation.
+        """
+        truth_point = truth_data[..., index]
+        if all(np.isnan(truth_point)):
+            return np.array(initial_guess[index], dtype=np.float32), True, 0
+        forecast_predictor_data = self._flatten_predictors(
+            [data[..., index] for data in forecast_predictors_data]
+        )
+        optimised_coeffs = self._minimise_caller(
+            minimisation_function,
+            initial_guess[index],
+            forecast_predictor_data.T,
+            truth_point,
+            forecast_var_data[..., index],
+            sqrt_pi,
+        )
+        return (
+            optimised_coeffs.x.astype(np.float32),
+            bool(optimised_coeffs.success),
+            int(optimised_coeffs.nit),
+        )
+
+    def _batched_crps(
+        self,
+        crps_derivatives: Callable,
+        coefficients: ndarray,
+        predictors: ndarray,
+        truth: ndarray,
+        forecast_var: ndarray,
+        sqrt_pi: float,
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Calculate the mean CRPS for each of a batch of points and its
+        gradient with respect to the coefficients for that point.
+
+        Args:
+            crps_derivatives:
+                Function returning the CRPS and its derivatives with respect
+                to the location and scale parameters, as
+                _normal_crps_derivatives.
+            coefficients:
+                Coefficients of shape (points, coefficients), each in the
+                order [alpha, beta, gamma, delta].
+            predictors:
+                Predictor data of shape (points, predictors, samples).
+            truth:
+                Truth of shape (points, samples), which is NaN for samples
+                to be ignored.
+            forecast_var:
+                Ensemble variance of shape (points, samples).
+            sqrt_pi:
+                Square root of Pi
+
+        Returns:
+            - The mean CRPS for each point, which is infinite where the
+              location or scale parameters are not valid, as for BAD_VALUE,
+              or where the scale parameter would be zero if calculated from
+              the coefficients stored as float32.
+            - The gradient of the mean CRPS for each point, of shape
+              (points, coefficients).
+        """
+        alpha = coefficients[:, :1]
+        beta = coefficients[:, 1:-2]
+        gamma = coefficients[:, -2:-1]
+        delta = coefficients[:, -1:]
+        if self.predictor == "realizations":
+            mu = alpha + np.einsum("sp,spt->st", beta * beta, predictors)
+        else:
+            mu = alpha + np.einsum("sp,spt->st", beta, predictors)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            sigma = np.sqrt(gamma * gamma + delta * delta * forecast_var)
+            crps, crps_mu, crps_sigma = crps_derivatives(mu, sigma, truth, sqrt_pi)
+            gradient_beta = np.nanmean(crps_mu[:, np.newaxis] * predictors, axis=-1)
+            if self.predictor == "realizations":
+                gradient_beta *= 2 * beta
+            gradient = np.column_stack(
+                (
+                    np.nanmean(crps_mu, axis=-1),
+                    gradient_beta,
+                    np.nanmean(crps_sigma * gamma / sigma, axis=-1),
+                    np.nanmean(crps_sigma * delta * forecast_var / sigma, axis=-1),
+                )
+            )
+            # The CRPS decreases as sigma tends to zero where the truth is a
+            # linear function of the predictors, so the coefficients must be
+            # kept from reaching values that give a zero sigma once stored.
+            gamma_32, delta_32 = np.float32(gamma), np.float32(delta)
+            sigma_32 = np.sqrt(
+                gamma_32 * gamma_32
+                + delta_32 * delta_32 * forecast_var.astype(np.float32)
+            )
+            bad = ~np.all(np.isfinite(mu / sigma) & (sigma_32 > 0), axis=-1)
+            return np.where(bad, np.inf, np.nanmean(crps, axis=-1)), gradient
+
+    def _minimise_batched(
+        self,
+        minimisation_function: Callable,
+        initial_guess: ndarray,
+        predictors: ndarray,
+        truth: ndarray,
+        forecast_var: ndarray,
+        sqrt_pi: float,
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """
+        Minimise the CRPS for a batch of points independently, advancing the
+        coefficients of every point together.
+
+        Each iteration takes a BFGS step for every point that has not yet
+        converged, using array operations on the stacked coefficients and
+        inverse Hessian approximations. The step length for each point is
+        found by halving the step until the CRPS for that point decreases
+        sufficiently. A point has converged once the largest component of
+        its gradient is within the gradient tolerance, and points stop being
+        updated once they converge or no step reduces their CRPS.
+
+        Args:
+            minimisation_function:
+                Function to minimise, used to select the CRPS derivatives.
+            initial_guess:
+                Initial coefficients of shape (points, coefficients).
+            predictors:
+                Predictor data of shape (points, predictors, samples).
+            truth:
+                Truth of shape (points, samples), which is NaN for samples
+                to be ignored. Every point must have at least one sample.
+            forecast_var:
+                Ensemble variance of shape (points, samples).
+            sqrt_pi:
+                Square root of Pi
+
+        Returns:
+            - The optimised coefficients of shape (points, coefficients).
+            - Whether the minimisation converged for each point.
+            - The number of iterations taken for each point.
+        """
+        crps_derivatives = self.crps_derivatives_dict[minimisation_function.__name__]
+
+        def evaluate(coefficients, indices):
+            return self._batched_crps(
+                crps_derivatives,
+                coefficients,
+                predictors[indices],
+                truth[indices],
+                forecast_var[indices],
+                sqrt_pi,
+            )
+
+        coefficients = self._offset_scale_coefficients(initial_guess)
+        n_points, n_coefficients = coefficients.shape
+        crps, gradient = evaluate(coefficients, slice(None))
+        identity = np.eye(n_coefficients)
+        # Scale the first step of each point to have at most unit length.
+        scale = 1 / np.maximum(np.linalg.norm(gradient, axis=-1), 1)
+        inverse_hessian = scale[:, np.newaxis, np.newaxis] * identity
+        iterations = np.zeros(n_points, dtype=int)
+        converged = np.max(np.abs(gradient), axis=-1) <= self.gradient_tolerance
+        active = np.isfinite(crps) & ~converged
+
+        for _ in range(self.max_iterations):
+            indices = np.flatnonzero(active)
+            if not len(indices):
+                break
+            direction = -np.einsum(
+                "skl,sl->sk", inverse_hessian[indices], gradient[indices]
+            )
+            slope = np.sum(direction * gradient[indices], axis=-1)
+            # Restart from steepest descent where the step is not downhill.
+            uphill = slope >= 0
+            if uphill.any():
+                inverse_hessian[indices[uphill]] = identity
+                direction[uphill] = -gradient[indices[uphill]]
+                slope[uphill] = -np.sum(direction[uphill] ** 2, axis=-1)
+
+            step = np.ones(len(indices))
+            new_coefficients = coefficients[indices].copy()
+            new_crps = crps[indices].copy()
+            new_gradient = gradient[indices].copy()
+            accepted = np.zeros(len(indices), dtype=bool)
+            pending = np.arange(len(indices))
+            for _ in range(self.MAX_STEP_HALVINGS):
+                trial = coefficients[indices[pending]] + (
+                    step[pending, np.newaxis] * direction[pending]
+                )
+                trial_crps, trial_gradient = evaluate(trial, indices[pending])
+                decreased = np.isfinite(trial_crps) & (
+                    trial_crps
+                    <= crps[indices[pending]]
+                    + self.ARMIJO_CONDITION * step[pending] * slope[pending]
+                )
+                done = pending[decreased]
+                new_coefficients[done] = trial[decreased]
+                new_crps[done] = trial_crps[decreased]
+                new_gradient[done] = trial_gradient[decreased]
+                accepted[done] = True
+                pending = pending[~decreased]
+                if not len(pending):
+                    break
+                step[pending] /= 2
+
+            # Update the inverse Hessian approximations where the curvature
+            # condition is satisfied.
+            s_k = new_coefficients - coefficients[indices]
+            y_k = new_gradient - gradient[indices]
+            s_y = np.sum(s_k * y_k, axis=-1)
+            update = accepted & (s_y > 0)
+            if update.any():
+                rho = (1 / s_y[update])[:, np.newaxis, np.newaxis]
+                s_u = s_k[update]
+                y_u = y_k[update]
+                first = iterations[indices[update]] == 0
+                hessian = inverse_hessian[indices[update]]
+                # Rescale the initial approximation using the curvature seen
+                # in the first step.
+                hessian[first] = (
+                    s_y[update][first] / np.sum(y_u[first] ** 2, axis=-1)
+                )[:, np.newaxis, np.newaxis] * identity
+                left = identity - rho * np.einsum("sk,sl->skl", s_u, y_u)
+                inverse_hessian[indices[update]] = np.einsum(
+                    "skl,slm,snm->skn", left, hessian, left
+                ) + rho * np.einsum("sk,sl->skl", s_u, s_u)
+
+            coefficients[indices] = new_coefficients
+            crps[indices] = new_crps
+            gradient[indices] = new_gradient
+            iterations[indices[accepted]] += 1
+            converged[indices] = (
+                np.max(np.abs(new_gradient), axis=-1) <= self.gradient_tolerance
+            )
+            active[indices] = accepted & ~converged[indices]
+
+        return coefficients, converged, iterations
+
+    def _minimise_points_batched(
+        self,
+        minimisation_function: Callable,
+        initial_guess: ndarray,
+        forecast_predictors_data: List[ndarray],
+        truth_data: ndarray,
+        forecast_var_data: ndarray,
+        sqrt_pi: float,
+    ) -> List[Tuple[ndarray, bool, int]]:
+        """Minimise every point at once using _minimise_batched. Samples
+        that are masked or have a NaN truth are ignored, and the initial
+        guess is returned for points without any samples.
+
+        Args:
+            minimisation_function:
+                Function to use when minimising.
+            initial_guess:
+                Initial guess for each point.
+            forecast_predictors_data:
+                Data of each forecast predictor, with the points along the
+                last dimension.
+            truth_data:
+                Data to be used as truth, with the points along the last
+                dimension.
+            forecast_var_data:
+                Ensemble variance data, with the points along the last
+                dimension.
+            sqrt_pi:
+                Square root of pi for minimisation.
+
+        Returns:
+            The optimised coefficients for each point, whether the
+            minimisation converged and the number of iterations, in the form
+            returned by _minimise_point.
+        """
+        n_points = truth_data.shape[-1]
+
+        # Arrange the data as (points, samples), or (points, predictors,
+        # samples), where the samples are the flattened leading dimensions.
+        def as_points(data):
+            return data.reshape(-1, n_points).T
+
+        truth = as_points(np.ma.getdata(truth_data)).astype(np.float64)
+        forecast_var = as_points(np.ma.getdata(forecast_var_data))
+        invalid = (
+            ~np.isfinite(truth)
+            | as_points(np.ma.getmaskarray(truth_data))
+            | as_points(np.ma.getmaskarray(forecast_var_data))
+        )
+        predictors = []
+        for data in forecast_predictors_data:
+            data = data.reshape(-1, truth.shape[-1], n_points)
+            predictors.append(np.ma.getdata(data))
+            invalid |= np.ma.getmaskarray(data).any(axis=0).T
+        predictors = np.moveaxis(np.concatenate(predictors), -1, 0)
+
+        truth[invalid] = np.nan
+        forecast_var = np.where(invalid, 1, forecast_var)
+        predictors = np.where(invalid[:, np.newaxis], 0, predictors)
+
+        optimised_coeffs = np.array(initial_guess, dtype=np.float32)
+        converged = np.ones(n_points, dtype=bool)
+        iterations = np.zeros(n_points, dtype=int)
+        has_data = ~invalid.all(axis=-1)
+        if has_data.any():
+            coeffs, coeffs_converged, coeffs_iterations = self._minimise_batched(
+                minimisation_function,
+                np.asarray(initial_guess)[has_data],
+                predictors[has_data],
+                truth[has_data],
+                forecast_var[has_data],
+                sqrt_pi,
+            )
+            optimised_coeffs[has_data] = coeffs
+            converged[has_data] = coeffs_converged
+            iterations[has_data] = coeffs_iterations
+        return list(zip(optimised_coeffs, converged.tolist(), iterations.tolist()))
+
+    def _minimise_points_in_processes(
+        self,
+        minimisation_function: Callable,
+        initial_guess: ndarray,
+        forecast_predictors_data: List[ndarray],
+        truth_data: ndarray,
+        forecast_var_data: ndarray,
+        sqrt_pi: float,
+    ) -> List[Tuple[ndarray, bool, int]]:
+        """Minimise each point using a pool of n_workers processes. The
+        points are divided into contiguous chunks, several per process so
+        that the work is balanced, and the inputs are placed in shared
+        memory rather than being sent with each chunk.
+
+        Args:
+            minimisation_function:
+                Function to use when minimising.
+            initial_guess:
+                Initial guess for each point.
+            forecast_predictors_data:
+                Data of each forecast predictor.
+            truth_data:
+                Data to be used as truth.
+            forecast_var_data:
+                Ensemble variance data.
+            sqrt_pi:
+                Square root of pi for minimisation.
+
+        Returns:
+            The result of _minimise_point for each point, in order.
+        """
+        n_points = truth_data.shape[-1]
+        chunk_size = -(-n_points // (4 * self.n_workers))
+        chunks = [
+            range(start, min(start + chunk_size, n_points))
+            for start in range(0, n_points, chunk_size)
+        ]
+        arrays = {
+            "initial_guess": np.asarray(initial_guess),
+            "truth": truth_data,
+            "forecast_var": forecast_var_data,
+        }
+        for i, data in enumerate(forecast_predictors_data):
+            arrays[f"predictor{i}"] = data
+        with SharedArrays(arrays) as shared:
+            results = process_map(
+                _minimise_point_chunk,
+                chunks,
+                n_workers=min(self.n_workers, len(chunks)),
+                initializer=_init_point_worker,
+                initargs=(
+                    self,
+                    minimisation_function.__name__,
+                    shared.handles,
+                    sqrt_pi,
+                ),
+            )
+            return [result for chunk in results for result in chunk]
+
     def _process_points_together(
         self,
         minimisation_function: Callable,
@@ -526,7 +1419,13 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 )
             )
             warnings.warn(msg)
-        self._calculate_percentage_change_in_last_iteration(optimised_coeffs.allvecs)
+        self.iterations = int(optimised_coeffs.nit)
+        # The coefficients at each iteration (allvecs) are not returned by
+        # L-BFGS-B.
+        if "allvecs" in optimised_coeffs:
+            self._calculate_percentage_change_in_last_iteration(
+                optimised_coeffs.allvecs
+            )
         return optimised_coeffs.x.astype(np.float32)
 
     def process(
@@ -541,6 +1440,12 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         Function to pass a given function to the scipy minimize
         function to estimate optimised values for the coefficients.
 
+        The total number of iterations taken by the minimisation, summed
+        over the points if point_by_point is True, is stored in the
+        iterations attribute and recorded as the telemetry counter
+        "emos_minimisation.iterations", so that the effect of the initial
+        guess on the cost of the minimisation can be seen.
+
         Further information is available in the
         :mod:`module level docstring <improver.calibration.ensemble_calibration>`.
 
@@ -607,6 +1512,7 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
 
         sqrt_pi = np.sqrt(np.pi)
 
+        self.iterations = 0
         if self.point_by_point:
             optimised_coeffs = self._process_points_independently(
                 minimisation_function,
@@ -625,6 +1531,7 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 forecast_var,
                 sqrt_pi,
             )
+        telemetry_count("emos_minimisation.iterations", self.iterations)
 
         return optimised_coeffs
 
@@ -645,6 +1552,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         tolerance: float = 0.02,
         max_iterations: int = 1000,
         proportion_of_nans: float = 0.5,
+        n_workers: int = 1,
+        minimisation_method: str = "Nelder-Mead",
+        gradient_tolerance: float = 1e-5,
     ) -> None:
         """
         Create an ensemble calibration plugin that, for Nonhomogeneous Gaussian
@@ -701,6 +1611,23 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             proportion_of_nans:
                 The proportion of the matching historic forecast-truth pairs that
                 are allowed to be NaN.
+            n_workers:
+                Number of processes used to minimise the points when
+                point_by_point is True. The coefficients do not depend on the
+                number of processes. Only one worker can be used with the
+                "batched" minimisation method.
+            minimisation_method:
+                The method used to minimise the CRPS, one of "Nelder-Mead",
+                "BFGS", "L-BFGS-B" or "batched". The other methods use the
+                analytic gradient of the CRPS and typically need far fewer
+                evaluations of the CRPS. The "batched" method minimises the
+                coefficients for every point at once, and is recommended
+                with point_by_point.
+            gradient_tolerance:
+                The tolerance for the largest component of the gradient of
+                the CRPS, at which the "BFGS", "L-BFGS-B" and "batched"
+                minimisation methods terminate. These methods do not use the
+                tolerance for the CRPS.
         """
         self.distribution = distribution
         self.point_by_point = point_by_point
@@ -717,6 +1644,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             tolerance=self.tolerance,
             max_iterations=self.max_iterations,
             point_by_point=self.point_by_point,
+            n_workers=n_workers,
+            minimisation_method=minimisation_method,
+            gradient_tolerance=gradient_tolerance,
         )
 
         # Setting default values for coeff_names.
@@ -1087,6 +2017,123 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
 
         return np.array(initial_guess, dtype=np.float32)
 
+    def initial_guess_from_coefficients(
+        self,
+        previous_coefficients: CubeList,
+        historic_forecasts: Cube,
+        truths: Cube,
+        number_of_coefficients: int,
+    ) -> ndarray:
+        """
+        Form the initial guess from coefficients estimated previously for
+        the same diagnostic and forecast period, for example in the previous
+        cycle, which are usually close to the optimised coefficients, so that
+        the minimisation needs fewer iterations.
+
+        A single set of coefficients is used as the initial guess for every
+        point if point_by_point is True. Coefficients for each point can only
+        be used if point_by_point is True, and must be on the same spatial
+        points as the truths.
+
+        Args:
+            previous_coefficients:
+                CubeList of coefficients, as created by
+                create_coefficients_cubelist.
+            historic_forecasts:
+                Historic forecasts from the training dataset.
+            truths:
+                Truths from the training dataset.
+            number_of_coefficients:
+                The number of coefficients being estimated.
+
+        Returns:
+            The initial guess, either with one value for each coefficient,
+            or of shape (number of points, number of coefficients) if
+            point_by_point is True.
+            Order of coefficients is [alpha, beta, gamma, delta].
+
+        Raises:
+            ValueError: If the coefficients are for a different diagnostic.
+            ValueError: If the coefficients are for a different forecast
+                period.
+            ValueError: If the coefficients are for each point but
+                point_by_point is False.
+            ValueError: If the spatial points of the coefficients do not
+                match those of the truths.
+            ValueError: If the number of coefficients does not match the
+                number being estimated.
+        """
+        coefficients = [
+            previous_coefficients.extract_cube(f"emos_coefficient_{coeff_name}")
+            for coeff_name in self.coeff_names
+        ]
+        alpha = coefficients[0]
+        diagnostic = alpha.attributes.get("diagnostic_standard_name")
+        if diagnostic != historic_forecasts.name():
+            msg = (
+                f"The previous coefficients are for {diagnostic}, so cannot be "
+                f"used as the initial guess for {historic_forecasts.name()}."
+            )
+            raise ValueError(msg)
+        historic_forecast_period = historic_forecasts.coord("forecast_period")
+        forecast_period = alpha.coord("forecast_period").copy()
+        forecast_period.convert_units(historic_forecast_period.units)
+        if not np.allclose(forecast_period.points, historic_forecast_period.points):
+            msg = (
+                "The previous coefficients are for a forecast period of "
+                f"{forecast_period.points} {forecast_period.units}, so cannot be "
+                "used as the initial guess for a forecast period of "
+                f"{historic_forecast_period.points} "
+                f"{historic_forecast_period.units}."
+            )
+            raise ValueError(msg)
+
+        if alpha.coord_dims(alpha.coord(axis="x")):
+            if not self.point_by_point:
+                msg = (
+                    "Coefficients for each point can only be used as the "
+                    "initial guess if point_by_point is True."
+                )
+                raise ValueError(msg)
+            for axis in ["y", "x"]:
+                points = alpha.coord(axis=axis).points
+                truth_points = truths.coord(axis=axis).points
+                if points.shape != truth_points.shape or not np.allclose(
+                    points, truth_points
+                ):
+                    msg = (
+                        f"The {axis} coordinate of the previous coefficients "
+                        "does not match that of the truths."
+                    )
+                    raise ValueError(msg)
+            n_points = flatten_spatial_dimensions(alpha).shape[-1]
+            initial_guess = np.concatenate(
+                [
+                    flatten_spatial_dimensions(cube).reshape(-1, n_points)
+                    for cube in coefficients
+                ]
+            ).T
+        else:
+            initial_guess = np.concatenate(
+                [np.ravel(cube.data) for cube in coefficients]
+            )
+
+        if initial_guess.shape[-1] != number_of_coefficients:
+            msg = (
+                f"The previous coefficients contain {initial_guess.shape[-1]} "
+                f"coefficients, but {number_of_coefficients} coefficients are "
+                "being estimated."
+            )
+            raise ValueError(msg)
+
+        initial_guess = np.array(initial_guess, dtype=np.float32)
+        if self.point_by_point and initial_guess.ndim == 1:
+            n_points = flatten_spatial_dimensions(truths).shape[-1]
+            initial_guess = np.broadcast_to(
+                initial_guess, (n_points, number_of_coefficients)
+            )
+        return initial_guess
+
     @staticmethod
     def mask_cube(cube: Cube, landsea_mask: Cube) -> None:
         """
@@ -1121,6 +2168,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         forecast_predictors: CubeList,
         forecast_var: Cube,
         number_of_realizations: Optional[int],
+        previous_coefficients: Optional[CubeList] = None,
     ) -> CubeList:
         """Function to consolidate calls to compute the initial guess, compute
         the optimised coefficients using minimisation and store the resulting
@@ -1141,6 +2189,10 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             number_of_realizations:
                 Number of realizations within the forecast predictor. If no
                 realizations are present, this option is None.
+            previous_coefficients:
+                Coefficients estimated previously, as created by
+                create_coefficients_cubelist, to use as the initial guess
+                instead of computing it.
 
         Returns:
             CubeList constructed using the coefficients provided and using
@@ -1149,36 +2201,44 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             gamma, delta.
 
         """
-        if self.point_by_point and not self.use_default_initial_guess:
-            y_name = truths.coord(axis="y").name()
-            x_name = truths.coord(axis="x").name()
-
-            initial_guess = []
-            for truth_slice in truths.slices_over([y_name, x_name]):
-                constr = iris.Constraint(
-                    coord_values={
-                        y_name: lambda cell: any(
-                            np.isclose(cell.point, truth_slice.coord(y_name).points)
-                        ),
-                        x_name: lambda cell: any(
-                            np.isclose(cell.point, truth_slice.coord(x_name).points)
-                        ),
-                    }
+        if previous_coefficients:
+            if self.predictor == "realizations":
+                number_of_coefficients = number_of_realizations + 3
+            else:
+                number_of_coefficients = len(forecast_predictors) + 3
+            initial_guess = self.initial_guess_from_coefficients(
+                previous_coefficients,
+                historic_forecasts,
+                truths,
+                number_of_coefficients,
+            )
+        elif self.point_by_point and not self.use_default_initial_guess:
+            # Reshape the data once so that the data for each point can be
+            # selected by index from the last dimension.
+            truths_data = flatten_spatial_dimensions(truths)
+            if self.predictor == "realizations":
+                forecast_predictors_data = flatten_spatial_dimensions(
+                    forecast_predictors[0]
+                )
+            else:
+                # If using mean as predictor, stack to produce one array where
+                # the leading dimension represents the number of predictors.
+                forecast_predictors_data = np.ma.stack(
+                    [
+                        flatten_spatial_dimensions(cube, data)
+                        for cube, data in zip(
+                            forecast_predictors,
+                            broadcast_data_to_time_coord(forecast_predictors),
+                        )
+                    ]
                 )
-                forecast_predictors_slice = forecast_predictors.extract(constr)
-                if self.predictor == "realizations":
-                    forecast_predictors_data = forecast_predictors_slice[0].data
-                else:
-                    # If using mean as predictor, stack to produce one array where
-                    # the leading dimension represents the number of predictors.
-                    forecast_predictors_data = np.ma.stack(
-                        broadcast_data_to_time_coord(forecast_predictors_slice)
-                    )
 
+            initial_guess = []
+            for index in range(truths_data.shape[-1]):
                 initial_guess.append(
                     self.compute_initial_guess(
-                        truth_slice.data,
-                        forecast_predictors_data,
+                        truths_data[..., index],
+                        forecast_predictors_data[..., index],
                         self.predictor,
                         number_of_realizations,
                     )
@@ -1229,6 +2289,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         truths: Cube,
         additional_fields: Optional[CubeList] = None,
         landsea_mask: Optional[Cube] = None,
+        previous_coefficients: Optional[CubeList] = None,
     ) -> CubeList:
         """
         Using Nonhomogeneous Gaussian Regression/Ensemble Model Output
@@ -1249,7 +2310,8 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
            and predictor from the historic forecasts.
         6. Calculate initial guess at coefficient values by performing a
            linear regression, if requested, otherwise default values are
-           used.
+           used. If previous coefficients are provided, these are used as
+           the initial guess instead.
         7. Perform minimisation.
 
         Args:
@@ -1264,6 +2326,15 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
                 land points are used to calculate the coefficients. Within the
                 land-sea mask cube land points should be specified as ones,
                 and sea points as zeros.
+            previous_coefficients:
+                Coefficients for the same diagnostic and forecast period
+                estimated previously, for example in the previous cycle, as
+                created by create_coefficients_cubelist. If provided, these
+                are used as the initial guess, either as a single set of
+                coefficients or for each point, so that the minimisation
+                typically converges in far fewer iterations. The number of
+                iterations taken is recorded as the telemetry counter
+                "emos_minimisation.iterations".
 
         Returns:
             CubeList constructed using the coefficients provided and using
@@ -1359,6 +2430,7 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             forecast_predictors,
             forecast_var,
             number_of_realizations,
+            previous_coefficients=previous_coefficients,
         )
         return coefficients_cubelist
 
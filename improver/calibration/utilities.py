@@ -8,7 +8,7 @@ specific for ensemble calibration.
 
 """
 
-from typing import List, Set, Tuple, Union
+from typing import List, Optional, Set, Tuple, Union
 
 import iris
 import numpy as np
@@ -112,6 +112,40 @@ def flatten_ignoring_masked_data(
     return result
 
 
+def flatten_spatial_dimensions(
+    cube: Cube, data: Optional[ndarray] = None
+) -> Union[MaskedArray, ndarray]:
+    """
+    Reshape the data of a cube so that its spatial points lie along the last
+    dimension, allowing the data at each point to be selected by an integer
+    index. The y and x dimensions, or the single dimension shared by the y and
+    x coordinates of site data, are moved to the end and flattened, with x
+    varying fastest. The other dimensions keep their order.
+
+    Args:
+        cube:
+            Cube with y and x coordinates.
+        data:
+            Data to be reshaped in place of the cube data, such as the data
+            broadcast along a leading time dimension by
+            broadcast_data_to_time_coord. Any dimensions in addition to those
+            of the cube must lead.
+
+    Returns:
+        Array with the spatial points along the last dimension.
+    """
+    if data is None:
+        data = cube.data
+    offset = data.ndim - cube.ndim
+    spatial_dims = []
+    for axis in ["y", "x"]:
+        for dim in cube.coord_dims(cube.coord(axis=axis)):
+            if dim + offset not in spatial_dims:
+                spatial_dims.append(dim + offset)
+    data = np.moveaxis(data, spatial_dims, range(-len(spatial_dims), 0))
+    return data.reshape(data.shape[: data.ndim - len(spatial_dims)] + (-1,))
+
+
 def check_predictor(predictor: str) -> str:
     """
     Check the predictor at the start of the process methods in relevant
@@ -131,9 +131,9 @@ def inputcube(to_convert):
         Loaded cube or passed object.
 
     """
-    from improver.utilities.load import load_cube
+    from improver.utilities.load import CUBE_CACHE
 
-    return maybe_coerce_with(load_cube, to_convert)
+    return maybe_coerce_with(CUBE_CACHE.load_cube, to_convert, fast_load=True)
 
 
 @value_converter
@@ -146,13 +146,15 @@ def inputcube_nolazy(to_convert):
     Returns:
         Loaded cube or passed object.
     """
-    from improver.utilities.load import load_cube
+    from improver.utilities.load import CUBE_CACHE
 
     if getattr(to_convert, "has_lazy_data", False):
         # Realise data if lazy
         to_convert.data
 
-    return maybe_coerce_with(load_cube, to_convert, no_lazy_load=True)
+    return maybe_coerce_with(
+        CUBE_CACHE.load_cube, to_convert, no_lazy_load=True, fast_load=True
+    )
 
 
 @value_converter
@@ -164,9 +166,9 @@ def inputcubelist(to_convert):
     Returns:
         Loaded cubelist or passed object.
     """
-    from improver.utilities.load import load_cubelist
+    from improver.utilities.load import CUBE_CACHE
 
-    return maybe_coerce_with(load_cubelist, to_convert)
+    return maybe_coerce_with(CUBE_CACHE.load_cubelist, to_convert, fast_load=True)
 
 
 @value_converter
@@ -248,6 +250,46 @@ def inputdatetime(to_convert):
     return maybe_coerce_with(cycletime_to_datetime, to_convert)
 
 
+def create_subset_inputcube_converter(**subset):
+    """Makes an inputcube converter which only loads a subset of the data.
+
+    The subset is extracted before the data is realised, so only that part
+    of the data is read from file. This suits CLIs which need a region, or a
+    few thresholds or realizations, from a larger file. Cubes passed in
+    directly are returned unchanged.
+
+    Args:
+        **subset (slice or tuple or list):
+            Selection for each named one-dimensional coordinate, given as a
+            slice of indices, a (min, max) tuple of the inclusive range of
+            coordinate values, or a list of coordinate values.
+
+    Returns:
+        callable:
+            A @value_converter which loads the subset of a cube from file.
+    """
+
+    @value_converter
+    def subset_inputcube_converter(to_convert):
+        """Passes the file name and subset onto maybe_coerce_with.
+
+        Args:
+            to_convert (str or iris.cube.Cube):
+                File name or Cube object.
+
+        Returns:
+            iris.cube.Cube:
+                Loaded subset of the cube or passed object.
+        """
+        from improver.utilities.load import CUBE_CACHE
+
+        return maybe_coerce_with(
+            CUBE_CACHE.load_cube, to_convert, subset=subset, fast_load=True
+        )
+
+    return subset_inputcube_converter
+
+
 def create_constrained_inputcubelist_converter(*constraints):
     """Makes function that the input constraints are used in a loop.
 
@@ -312,14 +354,16 @@ def with_output(
     pass_through_output=False,
     compression_level=1,
     least_significant_digit: int = None,
+    chunking="field",
     **kwargs,
 ):
     """Add `output` keyword only argument.
     Add `compression_level` option.
     Add `least_significant_digit` option.
+    Add `chunking` option.
 
-    This is used to add extra `output`, `compression_level` and `least_significant_digit` CLI
-    options. If `output` is provided, it saves the result of calling `wrapped` to file and returns
+    This is used to add extra `output`, `compression_level`, `least_significant_digit` and
+    `chunking` CLI options. If `output` is provided, it saves the result of calling `wrapped` to file and returns
     None, otherwise it returns the result. If `compression_level` is provided, it compresses the
     data with the provided compression level (or not, if `compression_level` 0). If
     `least_significant_digit` provided, it will quantize the data to a certain number of
@@ -343,6 +387,11 @@ def with_output(
             http://www.esrl.noaa.gov/psd/data/gridded/conventions/cdc_netcdf_standard.shtml
             for details. When used with `compression level`, this will result in lossy
             compression.
+        chunking (str):
+            How to chunk the data in the output file: "field" for single x-y slices,
+            fastest for reading maps; "series" for all leading dimensions over x-y
+            tiles, fastest for reading values at points; or "balanced" for blocks
+            of up to 1 MiB.
     Returns:
         Result of calling `wrapped` or None if `output` is given.
     """
@@ -351,7 +400,13 @@ def with_output(
     result = wrapped(*args, **kwargs)
 
     if output and result:
-        save_netcdf(result, output, compression_level, least_significant_digit)
+        save_netcdf(
+            result,
+            output,
+            compression_level,
+            least_significant_digit,
+            chunking=chunking,
+        )
         if pass_through_output:
             return ObjectAsStr(result, output)
         return
@@ -397,19 +452,70 @@ def command_executor(*argv, verbose=False, dry_run=False):
     )
 
 
-def _cli_items():
-    """Dynamically discover CLIs."""
-    import importlib
+class LazySubcommand:
+    """Proxy for a subcommand CLI which defers importing its module.
+
+    Clize asks every subcommand for its ``cli`` object when the dispatcher
+    is built, so the proxy stands in for it and only imports
+    ``improver.cli.<module_name>`` when the command is called or its help
+    is requested. Running a single command therefore only imports the
+    module for that command.
+    """
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self._cli = None
+
+    @property
+    def cli(self):
+        """Return the proxy itself as the clize CLI object."""
+        return self
+
+    def resolve(self):
+        """Import the subcommand module and return its clize CLI object."""
+        if self._cli is None:
+            import importlib
+
+            mcli = importlib.import_module("improver.cli." + self.module_name)
+            self._cli = clizefy(mcli.process).cli
+        return self._cli
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # only reached for attributes not set on the proxy, e.g. helper
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} improver.cli.{self.module_name}>"
+
+
+def _cli_module_names():
+    """Discover CLI module names without importing them.
+
+    Returns:
+        list of str:
+            Sorted names of the modules in the improver.cli package.
+    """
     import pkgutil
 
     from improver.cli import __path__ as improver_cli_pkg_path
 
+    return sorted(
+        minfo.name
+        for minfo in pkgutil.iter_modules(improver_cli_pkg_path)
+        if minfo.name != "__main__"
+    )
+
+
+def _cli_items():
+    """Dynamically discover CLIs."""
     yield ("help", improver_help)
-    for minfo in pkgutil.iter_modules(improver_cli_pkg_path):
-        mod_name = minfo.name
-        if mod_name != "__main__":
-            mcli = importlib.import_module("improver.cli." + mod_name)
-            yield (mod_name, clizefy(mcli.process))
+    for mod_name in _cli_module_names():
+        yield (mod_name, LazySubcommand(mod_name))
 
 
 SUBCOMMANDS_TABLE = OrderedDict(sorted(_cli_items()))
@@ -510,6 +616,133 @@ def execute_command(dispatcher, prog_name, *args, verbose=False, dry_run=False):
     return result
 
 
+class PipelineNode:
+    """A command within a bracketed pipeline of commands.
+
+    Each nested command given as an argument is a child node which must be
+    run before this node. Once a child has run, its result replaces the
+    nested command in the arguments of this node.
+    """
+
+    def __init__(self, args, parent=None, position=None):
+        """
+        Args:
+            args (list):
+                Command and its arguments, which may include nested commands.
+            parent (PipelineNode or None):
+                Node which takes the result of this node as an argument.
+            position (int or None):
+                Index of this node within the arguments of the parent.
+        """
+        self.args = list(args)
+        self.parent = parent
+        self.position = position
+        self.pending = 0
+
+
+def build_pipeline(args, parent=None, position=None):
+    """Convert nested command arguments into a graph of pipeline nodes.
+
+    Args:
+        args (list):
+            Command and its arguments, as returned by unbracket.
+        parent (PipelineNode or None):
+            Node which takes the result of these arguments as an argument.
+        position (int or None):
+            Index of these arguments within the arguments of the parent.
+
+    Returns:
+        list of PipelineNode:
+            Nodes for the command and all of its nested commands, with the
+            node for the outermost command first.
+    """
+    node = PipelineNode(args, parent, position)
+    nodes = [node]
+    for i, arg in enumerate(node.args):
+        if isinstance(arg, (list, tuple)):
+            node.pending += 1
+            nodes.extend(build_pipeline(arg, node, i))
+    return nodes
+
+
+def execute_pipeline_node(prog_name, args):
+    """Run a single pipeline command in a worker process.
+
+    Args:
+        prog_name (str):
+            The program name.
+        args (list):
+            Command and its arguments, with no nested commands.
+
+    Returns:
+        - Result of the command, unwrapped from any ObjectAsStr.
+        - Run-time of the command in seconds.
+    """
+    from improver.utilities.load import CUBE_CACHE
+
+    for i, arg in enumerate(args):
+        if isinstance(arg, pathlib.PurePath):
+            args[i] = str(arg)
+        elif not isinstance(arg, str):
+            args[i] = ObjectAsStr(arg)
+    # Cubes loaded by one node can be reused by later nodes in this worker.
+    with CUBE_CACHE.enable(), TimeIt() as timeit:
+        result = SUBCOMMANDS_DISPATCHER(prog_name, *args)
+    return getattr(result, "original_object", result), timeit.elapsed
+
+
+def execute_pipeline(prog_name, *args, n_workers=2, verbose=False):
+    """Run a bracketed pipeline of commands across a pool of workers.
+
+    Commands are run as soon as all of their nested commands have been run,
+    so independent branches of the pipeline run concurrently. Results are
+    passed between commands in memory rather than through files.
+
+    Args:
+        prog_name (str):
+            The program name.
+        args (tuple):
+            Command and its arguments, as returned by unbracket.
+        n_workers (int):
+            Number of worker processes.
+        verbose (bool):
+            Print the run-time of each command as it completes.
+
+    Returns:
+        Result of the outermost command.
+    """
+    import multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    nodes = build_pipeline(args)
+    # spawn workers rather than forking so that they do not inherit locks
+    # held by other threads (e.g. netCDF/HDF5) at the time of the fork
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+
+        def submit(node):
+            return executor.submit(execute_pipeline_node, prog_name, node.args)
+
+        running = {submit(node): node for node in nodes if not node.pending}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                result, elapsed = future.result()
+                if verbose:
+                    msg = " ".join(
+                        shlex.quote(ObjectAsStr.obj_to_name(x))
+                        for x in (prog_name, *node.args)
+                    )
+                    print(f"Run-time: {elapsed}s; {msg}")
+                if node.parent is None:
+                    return result
+                node.parent.args[node.position] = result
+                node.parent.pending -= 1
+                if not node.parent.pending:
+                    running[submit(node.parent)] = node.parent
+
+
 @clizefy()
 def main(
     prog_name: parameters.pass_name,
@@ -517,6 +750,8 @@ def main(
     *args,
     profile: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
     memprofile: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
+    telemetry: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
+    n_workers: int = 1,
     verbose=False,
     dry_run=False,
 ):
@@ -545,8 +780,18 @@ def main(
             of your program (suffixed with _SNAPSHOT)
             and a track of the maximum memory used by your program
             over time (suffixed with _MAX_TRACKER).
+        telemetry (str):
+            If given, will append a JSON line to the file given for each
+            plugin call, recording the wall time, CPU time, increase in
+            peak memory, and shapes and dtypes of the inputs and outputs.
+        n_workers (int):
+            Number of worker processes to run bracketed commands across.
+            Independent bracketed commands are run concurrently and their
+            results passed between workers without writing them to file.
+            If 1, commands are run in turn in this process.
         verbose (bool):
-            Print executed commands
+            Print executed commands, and for bracketed commands the hits
+            and misses of the cache of cubes loaded from file
         dry_run (bool):
             Print commands to be executed
 
@@ -554,7 +799,10 @@ def main(
     on available command(s).
     """
     args = unbracket(args)
-    exec_cmd = execute_command
+    if n_workers > 1 and not dry_run:
+        exec_cmd = partial(execute_pipeline, n_workers=n_workers)
+    else:
+        exec_cmd = partial(execute_command, SUBCOMMANDS_DISPATCHER, dry_run=dry_run)
     if profile is not None:
         from improver.profile import profile_hook_enable
 
@@ -563,14 +811,21 @@ def main(
         from improver.memprofile import memory_profile_decorator
 
         exec_cmd = memory_profile_decorator(exec_cmd, memprofile)
-    result = exec_cmd(
-        SUBCOMMANDS_DISPATCHER,
-        prog_name,
-        command,
-        *args,
-        verbose=verbose,
-        dry_run=dry_run,
-    )
+    if telemetry is not None:
+        from improver.telemetry import telemetry_enable
+
+        exec_cmd = telemetry_enable(telemetry)(exec_cmd)
+    if dry_run or not any(isinstance(arg, list) for arg in args):
+        return exec_cmd(prog_name, command, *args, verbose=verbose)
+
+    from improver.utilities.load import CUBE_CACHE
+
+    # Bracketed commands often load the same files, such as ancillaries,
+    # so cache the cubes loaded by each command for the others.
+    with CUBE_CACHE.enable():
+        result = exec_cmd(prog_name, command, *args, verbose=verbose)
+    if verbose:
+        print(CUBE_CACHE)
     return result
 
 
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Script to run many improver commands within one process."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(job_file: cli.inputpath, *, n_workers: int = 1):
+    """Run many improver commands from a job file in warm interpreters.
+
+    Each non-blank line of the job file is a command line as it would be
+    given to improver, for example
+    ``threshold input.nc --threshold-values 280 --output output.nc``.
+    Lines starting with # are ignored. Commands are run in the order given,
+    either sequentially in this process or across a pool of worker
+    processes, so that iris, numpy and the plugins are imported once per
+    worker rather than once per command.
+
+    The run-time of each command is printed as it completes. Failing
+    commands do not stop the remaining commands from running.
+
+    Args:
+        job_file (pathlib.Path):
+            File containing the command lines to run.
+        n_workers (int):
+            Number of worker processes to run the commands across.
+            If 1, the commands are run sequentially in this process.
+
+    Raises:
+        RuntimeError: If any of the commands failed.
+    """
+    from improver.utilities.cli_utilities import read_job_file, run_jobs
+
+    command_lines = read_job_file(job_file)
+    failures = 0
+    for command_line, elapsed, error in run_jobs(command_lines, n_workers):
+        status = "FAILED" if error else "OK"
+        print(f"{status} Run-time: {elapsed}s; {command_line}")
+        if error:
+            failures += 1
+            print(f"    {error}")
+    if failures:
+        raise RuntimeError(f"{failures} of {len(command_lines)} commands failed")
@@ -8,11 +8,14 @@ difference in altitude between the grid point and the site location."""
 
 from improver import cli
 
+# Only the 50th percentile of the forecasts is used.
+inputforecast = cli.create_subset_inputcube_converter(percentile=[50.0])
+
 
 @cli.clizefy
 @cli.with_output
 def process(
-    forecast: cli.inputcube,
+    forecast: inputforecast,
     truth: cli.inputcube,
     neighbour_cube: cli.inputcube,
     *,
@@ -30,6 +33,7 @@ def process(
     Args:
         forecast (iris.cube.Cube):
             Historical percentile forecasts. A 50th percentile forecast is required.
+            Only the 50th percentile is loaded from file.
         truth (iris.cube.Cube):
             Truths that are expected to match the validity times of the forecasts.
         neighbour_cube (iris.cube.Cube):
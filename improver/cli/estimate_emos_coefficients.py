@@ -22,6 +22,10 @@ def process(
     predictor="mean",
     tolerance: float = 0.02,
     max_iterations: int = 1000,
+    n_workers: int = 1,
+    minimisation_method="Nelder-Mead",
+    gradient_tolerance: float = 1e-5,
+    previous_coefficients: cli.inputcubelist = None,
 ):
     """Estimate coefficients for Ensemble Model Output Statistics.
 
@@ -81,6 +85,33 @@ def process(
             is raised. If the predictor is "realizations", then the number of
             iterations may require increasing, as there will be more
             coefficients to solve.
+        n_workers (int):
+            Number of processes used to minimise the points when
+            point_by_point is True. The coefficients do not depend on the
+            number of processes. Only one worker can be used with the
+            "batched" minimisation method.
+        minimisation_method (str):
+            The method used to minimise the CRPS, one of "Nelder-Mead",
+            "BFGS", "L-BFGS-B" or "batched". The other methods use the
+            analytic gradient of the CRPS, typically needing far fewer
+            evaluations of the CRPS, and terminate once the largest
+            component of the gradient is within the gradient tolerance. The
+            "batched" method minimises the coefficients for every point at
+            once, and is recommended with point_by_point.
+        gradient_tolerance (float):
+            The tolerance for the largest component of the gradient of the
+            CRPS, at which the "BFGS", "L-BFGS-B" and "batched" minimisation
+            methods terminate. These methods do not use the tolerance for
+            the CRPS.
+        previous_coefficients (iris.cube.CubeList):
+            Coefficients for the same diagnostic and forecast period
+            estimated previously, for example in the previous cycle, to use
+            as the initial guess instead of computing it. These can be a
+            single set of coefficients, or coefficients for each point if
+            point_by_point is True. Starting from near-optimal coefficients
+            typically reduces the number of iterations of the minimisation,
+            which is recorded by the telemetry counter
+            "emos_minimisation.iterations".
 
     Returns:
         iris.cube.CubeList:
@@ -103,5 +134,13 @@ def process(
         predictor=predictor,
         tolerance=tolerance,
         max_iterations=max_iterations,
+        n_workers=n_workers,
+        minimisation_method=minimisation_method,
+        gradient_tolerance=gradient_tolerance,
+    )
+    return plugin(
+        forecast,
+        truth,
+        landsea_mask=land_sea_mask,
+        previous_coefficients=previous_coefficients,
     )
-    return plugin(forecast, truth, landsea_mask=land_sea_mask)
@@ -24,6 +24,9 @@ def process(
     area_sum=False,
     percentiles: cli.comma_separated_list = DEFAULT_PERCENTILES,
     halo_radius: float = None,
+    n_workers: int = 1,
+    float32_accumulation=False,
+    tile_size: int = None,
 ):
     """Runs neighbourhood processing.
 
@@ -82,6 +85,23 @@ def process(
             where a larger grid was defined than the standard grid and we want
             to clip the grid back to the standard grid. Otherwise no clipping
             is applied.
+        n_workers (int):
+            Number of threads used to process the x-y slices of the cube.
+            The output does not depend on the number of threads.
+        float32_accumulation (bool):
+            Include this option to hold working copies of the data in
+            float32 rather than float64, accumulating neighbourhood totals
+            in float64 blocks, reducing memory use. Results may differ from the default by up to about
+            2e-6 times the largest value in each field. Only applicable for
+            calculating "probabilities" output.
+        tile_size (int):
+            Process grids with more than this number of points along either
+            side in square tiles of this size, each extended by a halo of the
+            neighbourhood radius, to reduce memory use for very large
+            domains. The results are identical to those without tiles for
+            thresholded fields, and can otherwise differ in the last bits
+            of float32 precision. Only applicable for calculating
+            "probabilities" output.
 
     Returns:
         iris.cube.Cube:
@@ -108,5 +128,8 @@ def process(
         area_sum=area_sum,
         percentiles=percentiles,
         halo_radius=halo_radius,
+        n_workers=n_workers,
+        float32_accumulation=float32_accumulation,
+        tile_size=tile_size,
     )
     return plugin(cube, mask=mask)
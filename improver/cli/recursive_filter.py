@@ -16,6 +16,7 @@ def process(
     *,
     iterations: int = 1,
     variable_mask: bool = False,
+    n_workers: int = 1,
 ):
     """Module to apply a recursive filter to neighbourhooded data.
 
@@ -50,6 +51,11 @@ def process(
             different mask. If False and cube is masked, a check will be made that
             the same mask is present on each spatial slice. If True, each spatial
             slice of cube may contain a different spatial mask.
+        n_workers (int):
+            Number of threads used to process the x-y slices of the cube
+            if numba is unavailable. With numba, the number of threads is
+            set by numba, e.g. with OMP_NUM_THREADS. The output does not
+            depend on the number of threads.
 
     Returns:
         iris.cube.Cube:
@@ -57,7 +63,7 @@ def process(
     """
     from improver.nbhood.recursive_filter import RecursiveFilter
 
-    plugin = RecursiveFilter(iterations=iterations)
+    plugin = RecursiveFilter(iterations=iterations, n_workers=n_workers)
     return plugin(
         cube, smoothing_coefficients=smoothing_coefficients, variable_mask=variable_mask
     )
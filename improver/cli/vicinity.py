@@ -10,7 +10,12 @@ from improver import cli
 
 @cli.clizefy
 @cli.with_output
-def process(cube: cli.inputcube, vicinity: cli.comma_separated_list = None):
+def process(
+    cube: cli.inputcube,
+    vicinity: cli.comma_separated_list = None,
+    *,
+    n_workers: int = 1,
+):
     """Module to apply vicinity processing to data.
 
     Calculate the maximum value within a vicinity radius about each point
@@ -36,6 +41,9 @@ def process(cube: cli.inputcube, vicinity: cli.comma_separated_list = None):
             List of distances in metres used to define the vicinities within
             which to search for an occurrence. Each vicinity provided will
             lead to a different gridded field.
+        n_workers (int):
+            Number of threads used to process the x-y slices of the cube.
+            The output does not depend on the number of threads.
 
     Returns:
         iris.cube.Cube:
@@ -43,4 +51,4 @@ def process(cube: cli.inputcube, vicinity: cli.comma_separated_list = None):
     """
     from improver.utilities.spatial import OccurrenceWithinVicinity
 
-    return OccurrenceWithinVicinity(radii=vicinity).process(cube)
+    return OccurrenceWithinVicinity(radii=vicinity, n_workers=n_workers).process(cube)
@@ -4,7 +4,8 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module containing neighbourhood processing utilities."""
 
-from typing import List, Optional, Union
+import warnings
+from typing import List, Optional, Tuple, Union
 
 import iris
 import numpy as np
@@ -22,12 +23,46 @@ from improver.utilities.cube_checker import (
     check_cube_coordinates,
     find_dimension_coordinate_mismatch,
 )
-from improver.utilities.neighbourhood_tools import boxsum, pad_and_roll
+from improver.utilities.memo import SliceMemo
+from improver.utilities.neighbourhood_tools import (
+    blocked_boxsum,
+    boxsum,
+    boxsums,
+    chordsum,
+    pad_and_roll,
+    sparse_clusters,
+)
+from improver.utilities.pad_spatial import tiles_with_halo
+from improver.utilities.parallel import thread_map
 from improver.utilities.spatial import (
     check_if_grid_is_equal_area,
     distance_to_number_of_grid_cells,
 )
 
+# Smallest unweighted circular kernel width for which neighbourhood totals are
+# calculated along kernel chords rather than by direct correlation. Below this
+# the extra cumulative sums cost more than they save.
+CHORDSUM_MIN_SIZE = 11
+
+# Largest difference between neighbourhood results from float32 working copies
+# of the data, accumulated in float64 blocks, and those from float64 working
+# copies, relative to the largest absolute value in the x-y slice. The errors
+# are bounded by a small multiple of the float32 machine epsilon (about
+# 1.2e-7), independent of the size of the grid and neighbourhood.
+FLOAT32_ACCUMULATION_TOLERANCE = 2e-6
+
+
+def _numba_available() -> bool:
+    """Return whether the numba implementation of the neighbourhood
+    percentiles can be used."""
+    try:
+        import numba  # noqa: F401
+
+        import improver.nbhood.numba_utilities  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
 def check_radius_against_distance(cube: Cube, radius: float) -> None:
     """Check required distance isn't greater than the size of the domain.
@@ -187,6 +222,9 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         weighted_mode: bool = False,
         sum_only: bool = False,
         re_mask: bool = True,
+        n_workers: int = 1,
+        float32_accumulation: bool = False,
+        tile_size: Optional[int] = None,
     ) -> None:
         """
         Initialise class.
@@ -217,6 +255,30 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                 mask is not applied. Therefore, the neighbourhood processing
                 may result in values being present in areas that were
                 originally masked.
+            n_workers:
+                Number of threads used to process the x-y slices of the cube.
+                If greater than 1, slices are processed concurrently rather
+                than together in one call. The result is the same.
+            float32_accumulation:
+                If True, hold the working copies of real data in float32
+                rather than float64, accumulating the neighbourhood totals in
+                float64 one block of the grid at a time. This halves the
+                memory used by the working copies of the data.
+                Neighbourhood means differ from those accumulated in float64
+                by less than FLOAT32_ACCUMULATION_TOLERANCE times the largest
+                absolute value within each x-y slice of the data.
+            tile_size:
+                If set, x-y grids with more than this number of points along
+                either side are processed in square tiles of this size, each
+                extended by a halo of the neighbourhood radius, to limit the
+                working memory for very large domains. The tiles are shared
+                between threads if n_workers is greater than 1. The results
+                are identical to those without tiles for thresholded fields
+                of zeros and ones. For other data, the neighbourhood totals
+                are differences of cumulative sums that start from the corner
+                of each tile rather than of the grid, so the results differ
+                by less than FLOAT32_ACCUMULATION_TOLERANCE times the largest
+                absolute value within each x-y slice.
 
         Raises:
             ValueError: If the neighbourhood_method is not either
@@ -240,6 +302,9 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         self.weighted_mode = weighted_mode
         self.sum_only = sum_only
         self.re_mask = re_mask
+        self.n_workers = n_workers
+        self.float32_accumulation = float32_accumulation
+        self.tile_size = tile_size
 
     def _calculate_neighbourhood(
         self, data: ndarray, mask: ndarray = None
@@ -250,20 +315,233 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         is masked in the input data array or that corresponds to zeros in the
         input mask.
 
+        The neighbourhood is applied over the last two dimensions of the data,
+        which are expected to be y and x. Any leading dimensions are processed
+        together, with each x-y slice treated independently.
+
+        Args:
+            data:
+                Input data array.
+            mask:
+                Mask of valid input data elements, broadcastable to the
+                shape of the data, usually with only y and x dimensions.
+
+        Returns:
+            Array containing the smoothed field after the
+            neighbourhood method has been applied.
+        """
+        (result,), _ = self._calculate_neighbourhoods(data, mask=mask)
+        return result
+
+    def _calculate_distinct_neighbourhoods(
+        self, data: ndarray, mask: ndarray = None
+    ) -> Union[ndarray, np.ma.MaskedArray]:
+        """
+        Apply neighbourhood processing as in _calculate_neighbourhood,
+        calculating the result once for each distinct combination of x-y
+        slice and mask. Thresholded fields are often entirely zero or one at
+        several thresholds, and each of these is then only processed once.
+        The slices are shared between threads if n_workers is greater than 1,
+        and large grids are processed in tiles if tile_size is set.
+
+        Args:
+            data:
+                Input data array.
+            mask:
+                Mask of valid input data elements, broadcastable to the
+                shape of the data.
+
+        Returns:
+            Array containing the smoothed field after the
+            neighbourhood method has been applied.
+        """
+        tiled = self.tile_size is not None and max(data.shape[-2:]) > self.tile_size
+        if data.ndim <= 2:
+            if tiled:
+                return self._calculate_neighbourhood_in_tiles(data, mask)
+            return self._calculate_neighbourhood(data, mask)
+
+        slices = data.reshape((-1,) + data.shape[-2:])
+        masks = None
+        if np.ndim(mask) > 2:
+            masks = np.broadcast_to(mask, data.shape).reshape(slices.shape)
+        indices, inverse = SliceMemo("nbhood_slices").unique(slices, masks)
+        if len(indices) < len(slices):
+            slices = slices[indices]
+            if masks is not None:
+                masks = masks[indices]
+
+        slice_mask = mask if masks is None else masks
+        if tiled:
+            result = self._calculate_neighbourhood_in_tiles(slices, slice_mask)
+        elif self.n_workers > 1 and len(slices) > 1:
+            result = self._calculate_neighbourhood_in_threads(slices, slice_mask)
+        else:
+            result = self._calculate_neighbourhood(slices, slice_mask)
+
+        if len(indices) < len(inverse):
+            result = result[inverse]
+        return result.reshape(data.shape)
+
+    def _calculate_neighbourhood_in_threads(
+        self, data: ndarray, mask: ndarray = None
+    ) -> Union[ndarray, np.ma.MaskedArray]:
+        """
+        Apply neighbourhood processing as in _calculate_neighbourhood, with
+        the x-y slices shared between n_workers threads. Only a few slices
+        are in progress at once, so the working memory is that of a few
+        slices rather than of the whole array.
+
+        Args:
+            data:
+                Input data array.
+            mask:
+                Mask of valid input data elements, broadcastable to the
+                shape of the data.
+
+        Returns:
+            Array containing the smoothed field after the
+            neighbourhood method has been applied.
+        """
+        slices = data.reshape((-1,) + data.shape[-2:])
+        if mask is None:
+            masks = [None] * len(slices)
+        else:
+            masks = np.broadcast_to(mask, data.shape).reshape(slices.shape)
+
+        result = None
+        for index, slice_result in enumerate(
+            thread_map(
+                lambda args: self._calculate_neighbourhood(*args),
+                zip(slices, masks),
+                n_workers=self.n_workers,
+            )
+        ):
+            if result is None:
+                empty = np.ma.empty if self.re_mask else np.empty
+                result = empty(slices.shape, dtype=slice_result.dtype)
+            result[index] = slice_result
+        return result.reshape(data.shape)
+
+    def _calculate_neighbourhood_in_tiles(
+        self, data: ndarray, mask: ndarray = None
+    ) -> Union[ndarray, np.ma.MaskedArray]:
+        """
+        Apply neighbourhood processing as in _calculate_neighbourhood, to one
+        square tile of the x-y grid at a time. Each tile is extended by a halo
+        of the neighbourhood radius, so that the result within the tile only
+        depends on data that it holds, and the halo is then discarded. The
+        working memory is that of a tile rather than of the whole grid. The
+        tiles are shared between n_workers threads.
+
+        The results are identical to those without tiling wherever the
+        neighbourhood totals are exact, as for thresholded fields of zeros and
+        ones. Otherwise the totals are differences of cumulative sums that
+        start from the corner of each tile rather than of the grid, so they
+        are rounded differently. Each tile is accumulated in the working type
+        and only the result is cast to float32, so with float64 accumulation
+        the results can only differ where a total lies within float64
+        rounding of a float32 rounding boundary. With float32_accumulation
+        they differ by less than FLOAT32_ACCUMULATION_TOLERANCE times the
+        largest absolute value within each x-y slice, as the results with and
+        without tiling are each within this tolerance of those accumulated in
+        float64.
+
         Args:
             data:
                 Input data array.
             mask:
-                Mask of valid input data elements.
+                Mask of valid input data elements, broadcastable to the
+                shape of the data.
 
         Returns:
             Array containing the smoothed field after the
             neighbourhood method has been applied.
         """
+        # Limit the results by the values of the whole slice, not the tile.
+        limits = None if self.sum_only else self._slice_limits(data)
+        radius = self.nb_size // 2
+
+        def calculate_tile(tile):
+            _, halo, core = tile
+            tile_mask = mask if np.ndim(mask) < 2 else mask[(...,) + halo]
+            (tile_result,), _ = self._calculate_neighbourhoods(
+                data[(...,) + halo], mask=tile_mask, limits=limits
+            )
+            return tile_result[(...,) + core]
+
+        tiles = list(tiles_with_halo(data.shape[-2:], self.tile_size, radius, radius))
+        result = None
+        for (tile, _, _), tile_result in zip(
+            tiles, thread_map(calculate_tile, tiles, n_workers=self.n_workers)
+        ):
+            if result is None:
+                empty = np.ma.empty if self.re_mask else np.empty
+                result = empty(data.shape, dtype=tile_result.dtype)
+            result[(...,) + tile] = tile_result
+        return result
+
+    @staticmethod
+    def _slice_limits(data: ndarray) -> Tuple[ndarray, ndarray]:
+        """Find the smallest and largest values within each x-y slice of the
+        data. Slices that are entirely masked give NaN limits, which have no
+        effect as the result is NaN wherever there is no valid data.
+
+        Args:
+            data:
+                Input data array.
+
+        Returns:
+            The smallest and largest values, with length 1 y and x dimensions.
+        """
+        return tuple(
+            np.ma.filled(func(data, axis=(-2, -1), keepdims=True), np.nan)
+            for func in (np.nanmin, np.nanmax)
+        )
+
+    def _calculate_neighbourhoods(
+        self,
+        data: ndarray,
+        mask: ndarray = None,
+        nb_sizes: Optional[List[int]] = None,
+        area_sums: Optional[List[ndarray]] = None,
+        limits: Optional[Tuple[ndarray, ndarray]] = None,
+    ) -> Tuple[List[Union[ndarray, np.ma.MaskedArray]], List[Optional[ndarray]]]:
+        """
+        Apply neighbourhood processing for one or more neighbourhood sizes,
+        as described in _calculate_neighbourhood. For square neighbourhoods
+        the totals for every size are found from one summed-area table for
+        each x-y slice.
+
+        Args:
+            data:
+                Input data array.
+            mask:
+                Mask of valid input data elements, broadcastable to the
+                shape of the data, usually with only y and x dimensions.
+            nb_sizes:
+                Widths in grid cells of the neighbourhoods. If not supplied,
+                the neighbourhood of this plugin is used.
+            area_sums:
+                Number of valid data points within each neighbourhood, as
+                returned by an earlier call with the same mask and sizes. These
+                can only be reused if the data have no mask of their own.
+            limits:
+                Smallest and largest values of each x-y slice, as returned by
+                _slice_limits, to which the results are limited. If not
+                supplied, these are found from the data.
+
+        Returns:
+            - Arrays containing the smoothed field for each neighbourhood size.
+            - Arrays containing the number of valid data points within each
+              neighbourhood size, or None for each size if sum_only is set.
+        """
+        if nb_sizes is None:
+            nb_sizes = [self.nb_size]
 
         if not self.sum_only:
-            min_val = np.nanmin(data)
-            max_val = np.nanmax(data)
+            # Limits are found separately for each x-y slice.
+            min_val, max_val = self._slice_limits(data) if limits is None else limits
 
         # Data mask to be eventually used for re-masking.
         # (This is OK even if mask is None, it gives a scalar False mask then.)
@@ -273,11 +551,18 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
             # Include data mask if masked array.
             data_mask = data_mask | data.mask
             data = data.data
+        if np.ndim(data_mask):
+            # Apply a mask of x-y points to every slice.
+            data_mask = np.broadcast_to(data_mask, data.shape)
 
         # Define working type and output type.
         if issubclass(data.dtype.type, np.complexfloating):
             loc_data_dtype = np.complex128
             out_data_dtype = np.complex64
+        elif self.float32_accumulation:
+            # Sums accumulated in float64 blocks give enough precision.
+            loc_data_dtype = np.float32
+            out_data_dtype = np.float32
         else:
             # Use 64-bit types for enough precision in accumulations.
             loc_data_dtype = np.float64
@@ -286,67 +571,71 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
 
         # Replace invalid elements with zeros so they don't count towards
         # neighbourhood sum
-        if self.neighbourhood_method == "circular":
-            mask_type = np.float32
-        else:
-            mask_type = np.int64
-        valid_data_mask = np.ones(data.shape, dtype=mask_type)
-        valid_data_mask[data_mask] = 0
         data[data_mask] = 0
 
         if self.sum_only:
+            area_sums = [None] * len(nb_sizes)
             max_extreme_data = None
         else:
-            area_sum = self._do_nbhood_sum(valid_data_mask)
-            max_extreme_data = area_sum.astype(loc_data_dtype)
+            if area_sums is None:
+                if self.neighbourhood_method == "circular" or self.float32_accumulation:
+                    mask_type = np.float32
+                else:
+                    mask_type = np.int64
+                valid_data_mask = np.ones(data.shape, dtype=mask_type)
+                valid_data_mask[data_mask] = 0
+                area_sums = self._do_nbhood_sums(valid_data_mask, nb_sizes)
+            max_extreme_data = [
+                area_sum.astype(loc_data_dtype) for area_sum in area_sums
+            ]
         # Where data are all ones in nbhood, result will be same as area_sum
-        data = self._do_nbhood_sum(data, max_extreme=max_extreme_data)
-
-        if not self.sum_only:
-            with np.errstate(divide="ignore", invalid="ignore"):
-                # Calculate neighbourhood mean.
-                data = data / area_sum
-            # For points where all data in the neighbourhood is masked,
-            # set result to nan
-            data[area_sum == 0] = np.nan
-            data = data.clip(min_val, max_val)
-
-        if self.re_mask:
-            data = np.ma.masked_array(data, data_mask, copy=False)
-
-        return data.astype(out_data_dtype)
-
-    def _do_nbhood_sum(
-        self, data: np.ndarray, max_extreme: Optional[np.ndarray] = None
-    ) -> np.ndarray:
-        """Calculate the sum-in-area from an array.
-        As this can be expensive, the method first checks for the extreme cases where the data are:
-        All zeros (result will be all zeros too)
-        All ones (result will be max_extreme, if supplied)
-        Contains outer rows / columns that are completely zero or completely one, these
-        rows and columns are trimmed before calculating the area sum and their contents
-        will be as for the appropriate all case above.
+        nb_sums = self._do_nbhood_sums(data, nb_sizes, max_extremes=max_extreme_data)
+
+        results = []
+        for nb_sum, area_sum in zip(nb_sums, area_sums):
+            if not self.sum_only:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    # Calculate neighbourhood mean.
+                    nb_sum = nb_sum / area_sum.astype(loc_data_dtype, copy=False)
+                # For points where all data in the neighbourhood is masked,
+                # set result to nan
+                nb_sum[area_sum == 0] = np.nan
+                nb_sum = nb_sum.clip(min_val, max_val)
+
+            if self.re_mask:
+                nb_sum = np.ma.masked_array(nb_sum, data_mask, copy=False)
+
+            results.append(nb_sum.astype(out_data_dtype))
+        return results, area_sums
+
+    def _find_trimmed_box(
+        self, data: np.ndarray, nb_size: int, max_extreme: Optional[np.ndarray] = None
+    ) -> Tuple[int, int, Union[int, np.ndarray, None], int, int, int, int]:
+        """Find the smallest box within a 2D array that contains all non-zero
+        or all non-one values, with a neighbourhood-sized buffer.
 
         Args:
             data:
-                Input data array where any masking has already been replaced with zeroes.
+                2D input data array where any masking has already been
+                replaced with zeroes.
+            nb_size:
+                Width in grid cells of the neighbourhood.
             max_extreme:
-                Used as the result for any large areas of data that are all ones, allowing an
-                optimisation to be used. If not supplied, the optimisation will only be used for
-                large areas of zeroes, where a return of zero can be safely predicted.
+                2D array of results for areas of data that are all ones. If not
+                supplied, only areas of zeroes will be trimmed.
 
         Returns:
-            Array containing the sum of data within the usable neighbourhood of each point.
+            The size of the box, the extreme value outside the box, the
+            result to use outside the box, and the start and stop indices of
+            the box along the y and x axes.
         """
-        # Determine the smallest box containing all non-zero or all non-one values with a
-        # neighbourhood-sized buffer and quit if there are none.
         data_shape = data.shape
         ystart = xstart = 0
         ystop, xstop = data.shape
         size = data.size
         extreme = 0
         fill_value = 0
-        half_nb_size = self.nb_size // 2
+        half_nb_size = nb_size // 2
         # For the two extreme values, 0 and 1, find the size and position of the smallest array
         # that includes all other values with a buffer of the neighbourhood radius.
         # The smallest box from either extreme will be passed to the neighbourhooding method.
@@ -380,39 +669,262 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                     _xstart,
                     _xstop,
                 )
-        if size != data.size:
-            # If our chosen extreme allows us to process a subset of data, define the default array
-            # of neighbourhood sums that we know we will get for regions of extreme data values.
-            if isinstance(fill_value, np.ndarray):
-                untrimmed = fill_value.astype(data.dtype)
-            else:
-                untrimmed = np.full(data_shape, fill_value, dtype=data.dtype)
-        if size:
-            # The subset of data is non-zero in size, so calculate the neighbourhood sums in the
-            # subset.
-            data = data[ystart:ystop, xstart:xstop]
+        return size, extreme, fill_value, ystart, ystop, xstart, xstop
 
-            # Calculate neighbourhood totals for input data.
-            if self.neighbourhood_method == "square":
-                data = boxsum(
-                    data, self.nb_size, mode="constant", constant_values=extreme
+    def _blocked(self, data: np.ndarray) -> bool:
+        """Return whether neighbourhood totals of float32 data are
+        accumulated in float64 blocks."""
+        return self.float32_accumulation and data.dtype == np.float32
+
+    def _sum_over_kernel(
+        self, data: np.ndarray, nb_size: int, extreme: int = 0
+    ) -> np.ndarray:
+        """Calculate neighbourhood totals over the last two dimensions of an
+        array, treating each x-y slice independently.
+
+        Large unweighted circular kernels are summed along their chords,
+        which costs O(r) per point rather than the O(r^2) of correlation.
+        Float32 data are summed from float64 cumulative sums of one block
+        at a time if float32_accumulation is set.
+
+        Args:
+            data:
+                Input data array.
+            nb_size:
+                Width in grid cells of the neighbourhood.
+            extreme:
+                Value to assume beyond the edges of the array for a square
+                neighbourhood.
+
+        Returns:
+            Array of neighbourhood totals with the same shape as the data.
+        """
+        blocked = self._blocked(data)
+        if self.neighbourhood_method == "square":
+            if blocked:
+                return blocked_boxsum(
+                    data, nb_size, mode="constant", constant_values=extreme
+                )
+            return boxsum(data, nb_size, mode="constant", constant_values=extreme)
+        if nb_size == self.nb_size:
+            kernel = self.kernel
+        else:
+            kernel = circular_kernel(nb_size // 2, self.weighted_mode)
+        if nb_size >= CHORDSUM_MIN_SIZE and np.isin(kernel, (0, 1)).all():
+            return chordsum(data, kernel, blocked=blocked)
+        # Leading length-1 kernel dimensions keep the slices independent.
+        kernel = kernel.reshape((1,) * (data.ndim - 2) + kernel.shape)
+        return correlate(data, kernel, mode="nearest")
+
+    def _sum_over_clusters(
+        self, data: np.ndarray, nb_size: int
+    ) -> Optional[np.ndarray]:
+        """Calculate neighbourhood totals over a sparse 2D array, such as a
+        field thresholded for a rare event, only around each cluster of
+        non-zero values. The totals are zero away from the clusters.
+
+        Args:
+            data:
+                2D input data array where any masking has already been
+                replaced with zeroes.
+            nb_size:
+                Width in grid cells of the neighbourhood.
+
+        Returns:
+            Array of neighbourhood totals with the same shape as the data, or
+            None if the data are not sparse enough for this to be quicker
+            than processing the whole array.
+        """
+        clusters = sparse_clusters(data, nb_size // 2)
+        if clusters is None:
+            return None
+        labels, boxes = clusters
+        result = np.zeros_like(data)
+        for number, box in enumerate(boxes, start=1):
+            in_cluster = labels[box] == number
+            totals = self._sum_over_kernel(np.where(in_cluster, data[box], 0), nb_size)
+            result[box][in_cluster] = totals[in_cluster]
+        return result
+
+    def _do_nbhood_sum(
+        self, data: np.ndarray, max_extreme: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Calculate the sum-in-area from an array.
+        As this can be expensive, the method first checks each x-y slice for
+        sparse data, which are only processed around each cluster of non-zero
+        values, and then for the extreme cases where the data are:
+        All zeros (result will be all zeros too)
+        All ones (result will be max_extreme, if supplied)
+        Contains outer rows / columns that are completely zero or completely one, these
+        rows and columns are trimmed before calculating the area sum and their contents
+        will be as for the appropriate all case above.
+        Slices that cannot be trimmed are all processed together in a single call.
+
+        Args:
+            data:
+                Input data array where any masking has already been replaced with zeroes.
+                The neighbourhood is applied over the last two dimensions.
+            max_extreme:
+                Used as the result for any large areas of data that are all ones, allowing an
+                optimisation to be used. If not supplied, the optimisation will only be used for
+                large areas of zeroes, where a return of zero can be safely predicted.
+
+        Returns:
+            Array containing the sum of data within the usable neighbourhood of each point.
+        """
+        max_extremes = None if max_extreme is None else [max_extreme]
+        (result,) = self._do_nbhood_sums(data, [self.nb_size], max_extremes)
+        return result
+
+    def _do_nbhood_sums(
+        self,
+        data: np.ndarray,
+        nb_sizes: List[int],
+        max_extremes: Optional[List[np.ndarray]] = None,
+    ) -> List[np.ndarray]:
+        """Calculate the sum-in-area from an array for several neighbourhood
+        sizes, trimming each x-y slice as described in _do_nbhood_sum.
+        For square neighbourhoods, the slices that cannot be trimmed for any
+        size are summed from a single summed-area table.
+
+        Args:
+            data:
+                Input data array where any masking has already been replaced
+                with zeroes. The neighbourhood is applied over the last two
+                dimensions.
+            nb_sizes:
+                Widths in grid cells of the neighbourhoods.
+            max_extremes:
+                Results for large areas of data that are all ones, for each
+                neighbourhood size, as for max_extreme in _do_nbhood_sum.
+
+        Returns:
+            Arrays containing the sum of data within the usable neighbourhood
+            of each point, for each neighbourhood size.
+        """
+        data_shape = data.shape
+        slices = data.reshape((-1,) + data_shape[-2:])
+        results = []
+        untrimmed = []
+        for nb_size, max_extreme in zip(
+            nb_sizes, max_extremes or [None] * len(nb_sizes)
+        ):
+            if max_extreme is not None:
+                max_extreme = max_extreme.reshape(slices.shape)
+            result = np.empty_like(slices)
+            untrimmed.append([])
+            for index, slice_2d in enumerate(slices):
+                sparse_sum = self._sum_over_clusters(slice_2d, nb_size)
+                if sparse_sum is not None:
+                    result[index] = sparse_sum
+                    continue
+                size, extreme, fill_value, ystart, ystop, xstart, xstop = (
+                    self._find_trimmed_box(
+                        slice_2d,
+                        nb_size,
+                        None if max_extreme is None else max_extreme[index],
+                    )
                 )
-            elif self.neighbourhood_method == "circular":
-                data = correlate(data, self.kernel, mode="nearest")
+                if size == slice_2d.size:
+                    untrimmed[-1].append(index)
+                    continue
+                # Define the default neighbourhood sums that we know we will get for
+                # regions of extreme data values, then calculate the sums in the subset.
+                result[index] = fill_value
+                if size:
+                    result[index, ystart:ystop, xstart:xstop] = self._sum_over_kernel(
+                        slice_2d[ystart:ystop, xstart:xstop], nb_size, extreme
+                    )
+            results.append(result)
+
+        # Sum the slices that could not be trimmed together.
+        if self.neighbourhood_method == "square":
+            # One summed-area table serves every neighbourhood size.
+            indices = sorted(set().union(*untrimmed))
+            if indices:
+                untrimmed_slices = (
+                    slices if len(indices) == len(slices) else slices[indices]
+                )
+            if indices and self._blocked(slices):
+                # Blocked totals are found separately for each size.
+                table_sums = [
+                    self._sum_over_kernel(untrimmed_slices, nb_size)
+                    for nb_size in nb_sizes
+                ]
+            elif indices:
+                table_sums = boxsums(
+                    untrimmed_slices, nb_sizes, mode="constant", constant_values=0
+                )
+        for i, (nb_size, slice_indices) in enumerate(zip(nb_sizes, untrimmed)):
+            if not slice_indices:
+                continue
+            if self.neighbourhood_method == "square":
+                nb_sum = table_sums[i]
+                if len(slice_indices) < len(indices):
+                    nb_sum = nb_sum[np.searchsorted(indices, slice_indices)]
+            elif len(slice_indices) < len(slices):
+                nb_sum = self._sum_over_kernel(slices[slice_indices], nb_size)
+            else:
+                nb_sum = self._sum_over_kernel(slices, nb_size)
+            if len(slice_indices) == len(slices):
+                results[i] = nb_sum
+            else:
+                results[i][slice_indices] = nb_sum
+        return [result.reshape(data_shape) for result in results]
+
+    def _set_neighbourhood_size(self, cube: Cube, radius: float) -> None:
+        """Set the width in grid cells of the neighbourhood for a radius,
+        and the kernel for a circular neighbourhood.
+
+        Args:
+            cube:
+                Cube with an equal area grid.
+            radius:
+                The radius in metres of the neighbourhood.
+        """
+        check_radius_against_distance(cube, radius)
+
+        grid_cells = distance_to_number_of_grid_cells(cube, radius)
+        if self.neighbourhood_method == "circular":
+            self.kernel = circular_kernel(grid_cells, self.weighted_mode)
+            self.nb_size = max(self.kernel.shape)
         else:
-            data = untrimmed
+            self.nb_size = 2 * grid_cells + 1
+
+    def _prepare(self, cube: Cube) -> None:
+        """Check the cube and set the neighbourhood for the radius at its
+        lead time.
+
+        Args:
+            cube:
+                Cube to which the neighbourhood processing will be applied.
+        """
+        super().process(cube)
+        check_if_grid_is_equal_area(cube)
+        self._set_neighbourhood_size(cube, self.radius)
 
-        # Expand data to the full size again
-        if data.shape != data_shape:
-            untrimmed[ystart:ystop, xstart:xstop] = data
-            data = untrimmed
-        return data
+    @staticmethod
+    def _with_yx_last(cube: Cube) -> Cube:
+        """Return the cube, or a transposed copy of it, with y and x as the
+        last two dimensions and the other dimensions in their original order.
+        """
+        yx_dims = [cube.coord_dims(cube.coord(axis=axis))[0] for axis in "yx"]
+        order = [dim for dim in range(cube.ndim) if dim not in yx_dims] + yx_dims
+        if order != list(range(cube.ndim)):
+            cube = cube.copy()
+            cube.transpose(order)
+        return cube
 
     def process(self, cube: Cube, mask_cube: Optional[Cube] = None) -> Cube:
         """
         Call the methods required to apply a neighbourhood processing to a cube.
 
         Applies neighbourhood processing to each 2D x-y-slice of the input cube.
+        All slices are processed in one call on the full data array, or shared
+        between threads if n_workers is greater than 1, and the result has the
+        dimensions of the input with y and x last. Identical slices are only
+        processed once. If tile_size is set, large grids are processed in
+        tiles.
 
         If the input cube is masked the neighbourhood sum is calculated from
         the total of the unmasked data in the neighbourhood around each grid
@@ -435,35 +947,70 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
             Cube containing the smoothed field after the
             neighbourhood method has been applied.
         """
-        super().process(cube)
-        check_if_grid_is_equal_area(cube)
-
         # If the data is masked, the mask will be processed as well as the
         # original_data * mask array.
-        check_radius_against_distance(cube, self.radius)
-
-        grid_cells = distance_to_number_of_grid_cells(cube, self.radius)
-        if self.neighbourhood_method == "circular":
-            self.kernel = circular_kernel(grid_cells, self.weighted_mode)
-            self.nb_size = max(self.kernel.shape)
-        else:
-            self.nb_size = 2 * grid_cells + 1
+        self._prepare(cube)
 
         try:
             mask_cube_data = mask_cube.data
         except AttributeError:
             mask_cube_data = None
 
-        result_slices = CubeList()
-        for cube_slice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-            cube_slice.data = self._calculate_neighbourhood(
-                cube_slice.data, mask_cube_data
-            )
-            result_slices.append(cube_slice)
-        neighbourhood_averaged_cube = result_slices.merge_cube()
+        # Process all distinct x-y slices at once, with y and x as the last
+        # dimensions.
+        cube = self._with_yx_last(cube)
+        neighbourhood_averaged_cube = cube.copy(
+            data=self._calculate_distinct_neighbourhoods(cube.data, mask_cube_data)
+        )
 
         return neighbourhood_averaged_cube
 
+    def process_radii(
+        self, cube: Cube, radii: List[float], mask_cube: Optional[Cube] = None
+    ) -> CubeList:
+        """
+        Apply neighbourhood processing to a cube for several radii, as
+        described in process. The radii and lead times of this plugin are
+        not used.
+
+        For square neighbourhoods, the neighbourhood sums for all the radii
+        are found from a single summed-area table for each x-y slice, which
+        is quicker than processing each radius in turn.
+
+        Args:
+            cube:
+                Cube containing the array to which the neighbourhood processing
+                will be applied. Usually thresholded data.
+            radii:
+                The radii in metres of the neighbourhoods to apply.
+            mask_cube:
+                Cube containing the array to be used as a mask. Zero values in
+                this array are taken as points to be masked.
+
+        Returns:
+            Cubes containing the smoothed field for each radius, in the
+            order of the radii.
+        """
+        if np.isnan(cube.data).any():
+            raise ValueError("Error: NaN detected in input cube data")
+        check_if_grid_is_equal_area(cube)
+
+        nb_sizes = []
+        for radius in radii:
+            self._set_neighbourhood_size(cube, radius)
+            nb_sizes.append(self.nb_size)
+
+        try:
+            mask_cube_data = mask_cube.data
+        except AttributeError:
+            mask_cube_data = None
+
+        cube = self._with_yx_last(cube)
+        results, _ = self._calculate_neighbourhoods(
+            cube.data, mask_cube_data, nb_sizes=nb_sizes
+        )
+        return CubeList(cube.copy(data=result) for result in results)
+
 
 class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
     """Class for generating percentiles from a circular neighbourhood."""
@@ -473,6 +1020,7 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
         radii: Union[float, List[float]],
         lead_times: Optional[List] = None,
         percentiles: Union[float, List[float]] = DEFAULT_PERCENTILES,
+        n_workers: int = 1,
     ) -> None:
         """
         Create a neighbourhood processing subclass that generates percentiles
@@ -493,9 +1041,12 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
             percentiles:
                 Percentile value(s) at which to calculate; if not provided uses
                 DEFAULT_PERCENTILES.
+            n_workers:
+                Number of threads used to process the x-y slices of the cube.
         """
         super().__init__(radii, lead_times=lead_times)
         self.percentiles = tuple(as_iterable(percentiles))
+        self.n_workers = n_workers
 
     def pad_and_unpad_cube(self, slice_2d: Cube, kernel: ndarray) -> Cube:
         """
@@ -646,18 +1197,47 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
                     ]
                     # fmt: on
         """
-        kernel_mask = kernel > 0
-        nb_slices = pad_and_roll(
-            slice_2d.data, kernel.shape, mode="mean", stat_length=max(kernel.shape) // 2
-        )
         percentiles = np.array(self.percentiles, dtype=np.float32)
 
         # Create cube for output percentile data.
         pctcube = self.make_percentile_cube(slice_2d)
 
+        if _numba_available():
+            pctcube.data[...] = self._sliding_percentiles(
+                slice_2d.data, kernel, percentiles
+            )
+        else:
+            self._window_percentiles(slice_2d.data, kernel, percentiles, pctcube.data)
+
+        return iris.util.squeeze(pctcube)
+
+    @staticmethod
+    def _window_percentiles(
+        data: ndarray, kernel: ndarray, percentiles: ndarray, out: ndarray
+    ) -> None:
+        """Calculate percentiles over a kernel about each point of a 2D array
+        by gathering every neighbourhood and applying np.percentile.
+
+        Args:
+            data:
+                2D data array.
+            kernel:
+                Kernel defining the neighbourhood, where values above zero
+                are included.
+            percentiles:
+                Percentiles at which to calculate values.
+            out:
+                Array of shape (len(percentiles),) + data.shape in which to
+                place the result.
+        """
+        kernel_mask = kernel > 0
+        nb_slices = pad_and_roll(
+            data, kernel.shape, mode="mean", stat_length=max(kernel.shape) // 2
+        )
+
         # Collapse neighbourhood windows into percentiles.
         # (Loop over outer dimension to reduce memory footprint.)
-        for nb_chunk, perc_chunk in zip(nb_slices, pctcube.data.swapaxes(0, 1)):
+        for nb_chunk, perc_chunk in zip(nb_slices, out.swapaxes(0, 1)):
             np.percentile(
                 nb_chunk[..., kernel_mask],
                 percentiles,
@@ -666,7 +1246,55 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
                 overwrite_input=True,
             )
 
-        return iris.util.squeeze(pctcube)
+    @staticmethod
+    def _sliding_percentiles(
+        data: ndarray, kernel: ndarray, percentiles: ndarray
+    ) -> ndarray:
+        """Calculate percentiles over a kernel about each point of a 2D array
+        by sliding the neighbourhood along each row, giving the same result
+        as _window_percentiles. See
+        :func:`improver.nbhood.numba_utilities.fast_neighbourhood_percentiles`.
+
+        Args:
+            data:
+                2D data array.
+            kernel:
+                Kernel defining the neighbourhood, where values above zero
+                are included.
+            percentiles:
+                Percentiles at which to calculate values.
+
+        Returns:
+            Array of shape (len(percentiles),) + data.shape holding the
+            percentiles.
+        """
+        from improver.nbhood.numba_utilities import fast_neighbourhood_percentiles
+
+        kernel_mask = kernel > 0
+        padded = np.pad(
+            data,
+            [(size // 2, size // 2) for size in kernel.shape],
+            mode="mean",
+            stat_length=max(kernel.shape) // 2,
+        )
+        # Find the runs of ones along each row of the kernel.
+        edges = np.diff(kernel_mask.astype(np.int8), axis=1, prepend=0, append=0)
+        chord_rows, chord_starts = np.nonzero(edges > 0)
+        _, chord_stops = np.nonzero(edges < 0)
+        # Positions of the values either side of each percentile, found as
+        # in np.percentile.
+        indices = np.true_divide(percentiles, 100) * (kernel_mask.sum() - 1)
+        below = np.floor(indices).astype(np.intp)
+        weights = indices - below
+        return fast_neighbourhood_percentiles(
+            padded,
+            chord_rows,
+            chord_starts,
+            chord_stops,
+            kernel.shape,
+            below,
+            weights,
+        )
 
     def process(self, cube: Cube) -> Cube:
         """
@@ -695,13 +1323,20 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
         grid_cell = distance_to_number_of_grid_cells(cube, self.radius)
         check_radius_against_distance(cube, self.radius)
         kernel = circular_kernel(grid_cell, weighted_mode=False)
+        if not _numba_available():
+            warnings.warn(
+                "Module numba unavailable. "
+                "GeneratePercentilesFromANeighbourhood will be slower."
+            )
         # Loop over each 2D slice to reduce memory demand and derive
         # percentiles on the kernel. Will return an extra dimension.
-        pctcubelist = iris.cube.CubeList()
-        for slice_2d in cube.slices(
-            ["projection_y_coordinate", "projection_x_coordinate"]
-        ):
-            pctcubelist.append(self.pad_and_unpad_cube(slice_2d, kernel))
+        pctcubelist = iris.cube.CubeList(
+            thread_map(
+                lambda slice_2d: self.pad_and_unpad_cube(slice_2d, kernel),
+                cube.slices(["projection_y_coordinate", "projection_x_coordinate"]),
+                n_workers=self.n_workers,
+            )
+        )
 
         result = pctcubelist.merge_cube()
         exception_coordinates = find_dimension_coordinate_mismatch(
@@ -774,6 +1409,9 @@ class MetaNeighbourhood(BasePlugin):
         area_sum: bool = False,
         percentiles: Union[float, List[float]] = DEFAULT_PERCENTILES,
         halo_radius: Optional[float] = None,
+        n_workers: int = 1,
+        float32_accumulation: bool = False,
+        tile_size: Optional[int] = None,
     ) -> None:
         """
         Initialise the MetaNeighbourhood class.
@@ -824,6 +1462,16 @@ class MetaNeighbourhood(BasePlugin):
                 where a larger grid was defined than the standard grid and we want
                 to clip the grid back to the standard grid. Otherwise no clipping
                 is applied.
+            n_workers:
+                Number of threads used to process the x-y slices of the cube.
+            float32_accumulation:
+                Hold working copies of the data in float32, accumulating
+                neighbourhood totals in float64 blocks, to reduce memory use. Only applicable for calculating
+                "probabilities" output.
+            tile_size:
+                Process grids with more than this number of points along
+                either side in square tiles of this size, to reduce memory
+                use. Only applicable for calculating "probabilities" output.
         """
         self._neighbourhood_output = neighbourhood_output
         self._neighbourhood_shape = neighbourhood_shape
@@ -833,6 +1481,9 @@ class MetaNeighbourhood(BasePlugin):
         self._area_sum = area_sum
         self._percentiles = percentiles
         self._halo_radius = halo_radius
+        self._n_workers = n_workers
+        self._float32_accumulation = float32_accumulation
+        self._tile_size = tile_size
 
         if neighbourhood_output == "percentiles":
             if weighted_mode:
@@ -876,12 +1527,16 @@ class MetaNeighbourhood(BasePlugin):
                 weighted_mode=self._weighted_mode,
                 sum_only=self._area_sum,
                 re_mask=True,
+                n_workers=self._n_workers,
+                float32_accumulation=self._float32_accumulation,
+                tile_size=self._tile_size,
             )(cube, mask_cube=mask)
         elif self._neighbourhood_output == "percentiles":
             result = GeneratePercentilesFromANeighbourhood(
                 self._radius_or_radii,
                 lead_times=self._lead_times,
                 percentiles=self._percentiles,
+                n_workers=self._n_workers,
             )(cube)
 
         if self._degrees_as_complex:
@@ -0,0 +1,207 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+This module defines the optional numba utilities for neighbourhood processing
+plugins.
+"""
+
+import os
+from typing import Tuple
+
+import numpy as np
+from numba import config, get_num_threads, njit, prange, set_num_threads
+
+config.THREADING_LAYER = "omp"
+if "OMP_NUM_THREADS" in os.environ:
+    set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+
+
+@njit
+def _tree_add(tree: np.ndarray, rank: int, count: int) -> None:
+    """Add a count to the value of a rank in a Fenwick tree of counts."""
+    index = rank + 1
+    while index < len(tree):
+        tree[index] += count
+        index += index & -index
+
+
+@njit
+def _tree_find(tree: np.ndarray, position: int, top_bit: int) -> int:
+    """Find the rank at a zero-based position in the sorted values counted
+    by a Fenwick tree."""
+    index = 0
+    remaining = position + 1
+    step = top_bit
+    while step:
+        if index + step < len(tree) and tree[index + step] < remaining:
+            index += step
+            remaining -= tree[index]
+        step >>= 1
+    return index
+
+
+@njit(parallel=True)
+def fast_neighbourhood_percentiles(
+    padded: np.ndarray,
+    chord_rows: np.ndarray,
+    chord_starts: np.ndarray,
+    chord_stops: np.ndarray,
+    kernel_shape: Tuple[int, int],
+    below: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """Calculate percentiles of the values within a kernel about every point
+    of a padded 2D array, equivalent to applying np.percentile to each
+    neighbourhood.
+
+    The values are ranked once, and the neighbourhood of each point is held
+    as counts of ranks in a Fenwick tree. Moving the neighbourhood one point
+    along a row only requires the values at the ends of each chord of the
+    kernel to be removed and added, and each percentile is then found in
+    O(log N) operations. Rows are processed in parallel.
+
+    Args:
+        padded:
+            2D data array, padded by half the kernel size on each side.
+        chord_rows:
+            Kernel row of each run of ones within the kernel.
+        chord_starts:
+            Kernel column at the start of each run of ones.
+        chord_stops:
+            Kernel column after the end of each run of ones.
+        kernel_shape:
+            Number of rows and columns in the kernel.
+        below:
+            Position in the sorted neighbourhood values of the value below
+            each percentile.
+        weights:
+            Weight of the value above each percentile when interpolating.
+
+    Returns:
+        Array of shape (len(below), ny, nx) holding the percentiles, where
+        ny and nx are the shape of the unpadded array.
+    """
+    ny = padded.shape[0] - kernel_shape[0] + 1
+    nx = padded.shape[1] - kernel_shape[1] + 1
+    n_points = (chord_stops - chord_starts).sum()
+
+    flat = padded.ravel()
+    order = np.argsort(flat, kind="mergesort")
+    values = flat[order]
+    ranks = np.empty(flat.size, dtype=np.int64)
+    ranks[order] = np.arange(flat.size)
+    ranks = ranks.reshape(padded.shape)
+    top_bit = 1
+    while top_bit * 2 <= flat.size:
+        top_bit *= 2
+
+    result = np.empty((len(below), ny, nx), dtype=np.float32)
+    # Each chunk of rows keeps its own tree, emptied after every row.
+    n_chunks = min(ny, 4 * get_num_threads())
+    for chunk in prange(n_chunks):
+        tree = np.zeros(flat.size + 1, dtype=np.int32)
+        for y in range(chunk, ny, n_chunks):
+            for x in range(nx):
+                for i in range(len(chord_rows)):
+                    row = y + chord_rows[i]
+                    if x == 0:
+                        for column in range(chord_starts[i], chord_stops[i]):
+                            _tree_add(tree, ranks[row, column], 1)
+                    else:
+                        _tree_add(tree, ranks[row, x - 1 + chord_starts[i]], -1)
+                        _tree_add(tree, ranks[row, x - 1 + chord_stops[i]], 1)
+                for p in range(len(below)):
+                    lower = values[_tree_find(tree, below[p], top_bit)]
+                    upper = values[
+                        _tree_find(tree, min(below[p] + 1, n_points - 1), top_bit)
+                    ]
+                    # Interpolate as np.percentile does.
+                    difference = upper - lower
+                    if weights[p] >= 0.5:
+                        result[p, y, x] = upper - difference * (1 - weights[p])
+                    else:
+                        result[p, y, x] = lower + difference * weights[p]
+            for i in range(len(chord_rows)):
+                row = y + chord_rows[i]
+                for column in range(chord_starts[i], chord_stops[i]):
+                    _tree_add(tree, ranks[row, nx - 1 + column], -1)
+    return result
+
+
+@njit(parallel=True)
+def fast_recursive_filter(
+    grid: np.ndarray,
+    coeffs_x: np.ndarray,
+    weights_x: np.ndarray,
+    coeffs_y: np.ndarray,
+    weights_y: np.ndarray,
+    iterations: int,
+) -> np.ndarray:
+    """Apply a recursive filter in place to every x-y slice of a 3D array,
+    forwards and backwards along x and then along y for each iteration,
+    equivalent to RecursiveFilter._recurse_forward and _recurse_backward.
+
+    Each new value is the weighted sum of the existing value and the new
+    value at the preceding point. Along x, each row is filtered in turn
+    by a thread. Along y, each thread updates a block of columns one row
+    at a time, so that both passes work along contiguous memory.
+
+    Args:
+        grid:
+            3D array of data, with y and x as the last two dimensions.
+        coeffs_x:
+            3D array of smoothing coefficients for the x-direction, with one
+            element fewer along x than the grid, and either one slice for
+            all slices of the grid or one for each.
+        weights_x:
+            1 - coeffs_x, the weights of the existing values along x.
+        coeffs_y:
+            3D array of smoothing coefficients for the y-direction, with one
+            element fewer along y than the grid, shaped as for coeffs_x.
+        weights_y:
+            1 - coeffs_y, the weights of the existing values along y.
+        iterations:
+            The number of iterations of the recursive filter.
+
+    Returns:
+        The grid, containing the smoothed field.
+    """
+    n_slices, ny, nx = grid.shape
+    shared = coeffs_x.shape[0] == 1
+    block = 64
+    n_blocks = (nx + block - 1) // block
+    for _ in range(iterations):
+        for row in prange(n_slices * ny):
+            k = row // ny
+            j = row % ny
+            c = 0 if shared else k
+            for i in range(1, nx):
+                grid[k, j, i] = (
+                    weights_x[c, j, i - 1] * grid[k, j, i]
+                    + coeffs_x[c, j, i - 1] * grid[k, j, i - 1]
+                )
+            for i in range(nx - 2, -1, -1):
+                grid[k, j, i] = (
+                    weights_x[c, j, i] * grid[k, j, i]
+                    + coeffs_x[c, j, i] * grid[k, j, i + 1]
+                )
+        for column_block in prange(n_slices * n_blocks):
+            k = column_block // n_blocks
+            start = (column_block % n_blocks) * block
+            stop = min(start + block, nx)
+            c = 0 if shared else k
+            for j in range(1, ny):
+                for i in range(start, stop):
+                    grid[k, j, i] = (
+                        weights_y[c, j - 1, i] * grid[k, j, i]
+                        + coeffs_y[c, j - 1, i] * grid[k, j - 1, i]
+                    )
+            for j in range(ny - 2, -1, -1):
+                for i in range(start, stop):
+                    grid[k, j, i] = (
+                        weights_y[c, j, i] * grid[k, j, i]
+                        + coeffs_y[c, j, i] * grid[k, j + 1, i]
+                    )
+    return grid
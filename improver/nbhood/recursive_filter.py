@@ -4,9 +4,9 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module to apply a recursive filter to neighbourhooded data."""
 
-from typing import List, Optional, Tuple
+import warnings
+from typing import Callable, List, Optional, Tuple
 
-import iris
 import numpy as np
 from iris.cube import Cube, CubeList
 from numpy import ndarray
@@ -15,8 +15,20 @@ from improver import PostProcessingPlugin
 from improver.generate_ancillaries.generate_orographic_smoothing_coefficients import (
     OrographicSmoothingCoefficients,
 )
-from improver.utilities.cube_checker import check_cube_coordinates
-from improver.utilities.pad_spatial import pad_cube_with_halo, remove_halo_from_cube
+from improver.utilities.pad_spatial import pad_cube_with_halo
+from improver.utilities.parallel import thread_map
+
+
+def _numba_available() -> bool:
+    """Return whether the numba implementation of the recursive filter can
+    be used."""
+    try:
+        import numba  # noqa: F401
+
+        import improver.nbhood.numba_utilities  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 class RecursiveFilter(PostProcessingPlugin):
@@ -28,6 +40,7 @@ class RecursiveFilter(PostProcessingPlugin):
         self,
         iterations: Optional[int] = None,
         edge_width: int = 15,
+        n_workers: int = 1,
     ) -> None:
         """
         Initialise the class.
@@ -38,6 +51,10 @@ class RecursiveFilter(PostProcessingPlugin):
             edge_width:
                 Half the width of the padding halo applied before
                 recursive filtering.
+            n_workers:
+                Number of threads used to filter the x-y slices of the cube
+                if numba is unavailable. The numba implementation shares the
+                slices between the threads set for numba instead.
         Raises:
             ValueError: If number of iterations is not None and is set such
                         that iterations is less than 1.
@@ -49,6 +66,7 @@ class RecursiveFilter(PostProcessingPlugin):
                 )
         self.iterations = iterations
         self.edge_width = edge_width
+        self.n_workers = n_workers
         self.smoothing_coefficient_name_format = "smoothing_coefficient_{}"
 
     @staticmethod
@@ -74,30 +92,28 @@ class RecursiveFilter(PostProcessingPlugin):
 
         Args:
             grid:
-                2D array containing the input data to which the recursive
-                filter will be applied.
+                Array containing the input data to which the recursive
+                filter will be applied, with y and x as the last two
+                dimensions.
             smoothing_coefficients:
-                Matching 2D array of smoothing_coefficient values that will be
-                used when applying the recursive filter along the specified
-                axis.
+                Array of smoothing_coefficient values, broadcastable to the
+                grid except along the specified axis, that will be used when
+                applying the recursive filter along the specified axis.
             axis:
-                Index of the spatial axis (0 or 1) over which to recurse.
+                Index of the spatial axis over which to recurse, either
+                0 or 1 for a 2D array, or -2 or -1.
 
         Returns:
-            2D array containing the smoothed field after the recursive
+            Array containing the smoothed field after the recursive
             filter method has been applied to the input array in the
             forward direction along the specified axis.
         """
+        line = RecursiveFilter._line_index(grid, axis)
         lim = grid.shape[axis]
         for i in range(1, lim):
-            if axis == 0:
-                grid[i, :] = (1.0 - smoothing_coefficients[i - 1, :]) * grid[
-                    i, :
-                ] + smoothing_coefficients[i - 1, :] * grid[i - 1, :]
-            if axis == 1:
-                grid[:, i] = (1.0 - smoothing_coefficients[:, i - 1]) * grid[
-                    :, i
-                ] + smoothing_coefficients[:, i - 1] * grid[:, i - 1]
+            grid[line(i)] = (1.0 - smoothing_coefficients[line(i - 1)]) * grid[
+                line(i)
+            ] + smoothing_coefficients[line(i - 1)] * grid[line(i - 1)]
         return grid
 
     @staticmethod
@@ -123,80 +139,97 @@ class RecursiveFilter(PostProcessingPlugin):
 
         Args:
             grid:
-                2D array containing the input data to which the recursive
-                filter will be applied.
+                Array containing the input data to which the recursive
+                filter will be applied, with y and x as the last two
+                dimensions.
             smoothing_coefficients:
-                Matching 2D array of smoothing_coefficient values that will be
-                used when applying the recursive filter along the specified
-                axis.
+                Array of smoothing_coefficient values, broadcastable to the
+                grid except along the specified axis, that will be used when
+                applying the recursive filter along the specified axis.
             axis:
-                Index of the spatial axis (0 or 1) over which to recurse.
+                Index of the spatial axis over which to recurse, either
+                0 or 1 for a 2D array, or -2 or -1.
 
         Returns:
-            2D array containing the smoothed field after the recursive
+            Array containing the smoothed field after the recursive
             filter method has been applied to the input array in the
             backwards direction along the specified axis.
         """
+        line = RecursiveFilter._line_index(grid, axis)
         lim = grid.shape[axis]
         for i in range(lim - 2, -1, -1):
-            if axis == 0:
-                grid[i, :] = (1.0 - smoothing_coefficients[i, :]) * grid[
-                    i, :
-                ] + smoothing_coefficients[i, :] * grid[i + 1, :]
-            if axis == 1:
-                grid[:, i] = (1.0 - smoothing_coefficients[:, i]) * grid[
-                    :, i
-                ] + smoothing_coefficients[:, i] * grid[:, i + 1]
+            grid[line(i)] = (1.0 - smoothing_coefficients[line(i)]) * grid[
+                line(i)
+            ] + smoothing_coefficients[line(i)] * grid[line(i + 1)]
         return grid
 
     @staticmethod
-    def _run_recursion(
-        cube: Cube,
-        smoothing_coefficients_x: Cube,
-        smoothing_coefficients_y: Cube,
+    def _line_index(grid: ndarray, axis: int) -> Callable[[int], Tuple]:
+        """Return a function giving the index of the line of points at
+        position i along one of the last two axes of the grid. The index
+        counts dimensions from the end, so that it can also be applied to
+        smoothing coefficients with fewer leading dimensions."""
+        if axis >= 0:
+            axis -= grid.ndim
+        trailing = (slice(None),) * (-1 - axis)
+        return lambda i: (Ellipsis, i) + trailing
+
+    @staticmethod
+    def _recurse(
+        grid: ndarray,
+        smoothing_coefficients_x: ndarray,
+        smoothing_coefficients_y: ndarray,
         iterations: int,
-    ) -> Cube:
+    ) -> ndarray:
         """
-        Method to run the recursive filter.
+        Apply the recursive filter in place, forwards and backwards along x
+        and then along y for each iteration, to every x-y slice of an array.
+
+        Calls a fast numba implementation where numba is available (see
+        :func:`improver.nbhood.numba_utilities.fast_recursive_filter`),
+        which works along contiguous lines of points with the slices shared
+        between threads, and otherwise recurses over whole rows and columns
+        with NumPy.
 
         Args:
-            cube:
-                2D cube containing the input data to which the recursive
-                filter will be applied.
+            grid:
+                3D array containing the input data, with y and x as the
+                last two dimensions.
             smoothing_coefficients_x:
-                2D cube containing array of smoothing_coefficient values that
-                will be used when applying the recursive filter along the
-                x-axis.
+                3D array of smoothing_coefficient values for the x-direction,
+                with one element fewer along x than the grid, and either
+                one slice for all slices of the grid or one for each.
             smoothing_coefficients_y:
-                2D cube containing array of smoothing_coefficient values that
-                will be used when applying the recursive filter along the
-                y-axis.
+                3D array of smoothing_coefficient values for the y-direction,
+                with one element fewer along y than the grid, and either
+                one slice for all slices of the grid or one for each.
             iterations:
-                The number of iterations of the recursive filter
+                The number of iterations of the recursive filter.
 
         Returns:
-            Cube containing the smoothed field after the recursive filter
-            method has been applied to the input cube.
+            The grid, containing the smoothed field.
         """
-        (x_index,) = cube.coord_dims(cube.coord(axis="x").name())
-        (y_index,) = cube.coord_dims(cube.coord(axis="y").name())
-        output = cube.data
-
-        for _ in range(iterations):
-            output = RecursiveFilter._recurse_forward(
-                output, smoothing_coefficients_x.data, x_index
-            )
-            output = RecursiveFilter._recurse_backward(
-                output, smoothing_coefficients_x.data, x_index
-            )
-            output = RecursiveFilter._recurse_forward(
-                output, smoothing_coefficients_y.data, y_index
-            )
-            output = RecursiveFilter._recurse_backward(
-                output, smoothing_coefficients_y.data, y_index
-            )
-            cube.data = output
-        return cube
+        if not _numba_available():
+            for _ in range(iterations):
+                for coefficients, axis in (
+                    (smoothing_coefficients_x, -1),
+                    (smoothing_coefficients_y, -2),
+                ):
+                    grid = RecursiveFilter._recurse_forward(grid, coefficients, axis)
+                    grid = RecursiveFilter._recurse_backward(grid, coefficients, axis)
+            return grid
+
+        from improver.nbhood.numba_utilities import fast_recursive_filter
+
+        # Weights of the existing values, calculated as in the NumPy version.
+        return fast_recursive_filter(
+            grid,
+            smoothing_coefficients_x,
+            1.0 - smoothing_coefficients_x,
+            smoothing_coefficients_y,
+            1.0 - smoothing_coefficients_y,
+            iterations,
+        )
 
     def _validate_coefficients(
         self, cube: Cube, smoothing_coefficients: CubeList
@@ -311,6 +344,50 @@ class RecursiveFilter(PostProcessingPlugin):
         plugin.zero_masked(coeffs_x, coeffs_y, mask)
         return coeffs_x, coeffs_y
 
+    def _padded_coefficients(
+        self,
+        cube_format: Cube,
+        coeffs_x: Cube,
+        coeffs_y: Cube,
+        masks: Optional[ndarray] = None,
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Pad the smoothing coefficients with a halo, zeroing the coefficients
+        about the masked points of each slice.
+
+        Args:
+            cube_format:
+                2D x-y slice of the cube to be filtered.
+            coeffs_x:
+                2D cube of smoothing coefficients in the x-direction.
+            coeffs_y:
+                2D cube of smoothing coefficients in the y-direction.
+            masks:
+                3D array of the masks of each x-y slice, or None if no
+                points are masked.
+
+        Returns:
+            - 3D array of padded smoothing coefficients in the x-direction.
+            - 3D array of padded smoothing coefficients in the y-direction.
+            Each has one slice for each mask, or a single slice if there
+            are no masks.
+        """
+        pairs = []
+        for mask in [None] if masks is None else masks:
+            if mask is None or not mask.any():
+                pairs.append((coeffs_x, coeffs_y))
+            else:
+                pairs.append(
+                    self._update_coefficients_from_mask(
+                        coeffs_x.copy(), coeffs_y.copy(), cube_format.copy(data=mask)
+                    )
+                )
+        padded_x, padded_y = zip(*(self._pad_coefficients(*pair) for pair in pairs))
+        return (
+            np.stack([coeffs.data for coeffs in padded_x]),
+            np.stack([coeffs.data for coeffs in padded_y]),
+        )
+
     def process(
         self,
         cube: Cube,
@@ -325,20 +402,19 @@ class RecursiveFilter(PostProcessingPlugin):
         and :func:`~improver.cli.generate_orographic_smoothing_coefficients`.
         The steps undertaken are:
 
-        1. Split the input cube into slices determined by the co-ordinates in
-           the x and y directions.
+        1. View the input data as a stack of slices determined by the
+           co-ordinates in the x and y directions.
         2. Construct an array of filter parameters (smoothing_coefficients_x
-           and smoothing_coefficients_y) for each cube slice that are used to
-           weight the recursive filter in the x- and y-directions.
-        3. Pad each cube slice with a square-neighbourhood halo and apply
-           the recursive filter for the required number of iterations.
-        4. Remove the halo from the cube slice and append the recursed cube
-           slice to a 'recursed cube'.
-        5. Merge all the cube slices in the 'recursed cube' into a 'new cube'.
-        6. Modify the 'new cube' so that its scalar dimension co-ordinates are
-           consistent with those in the original input cube.
-        7. Return the 'new cube' which now contains the recursively filtered
-           values for the original input cube.
+           and smoothing_coefficients_y) that are used to weight the recursive
+           filter in the x- and y-directions. These are shared by all slices
+           unless the slices have different masks.
+        3. Pad the slices with a square-neighbourhood halo and apply the
+           recursive filter to all of them together for the required number
+           of iterations. The numba implementation shares the slices
+           between its own threads. Without numba, the slices are shared
+           between n_workers threads.
+        4. Remove the halo and return a copy of the input cube containing the
+           recursively filtered values.
 
         The smoothing_coefficient determines how much "value" of a cell
         undergoing filtering is comprised of the current value at that cell and
@@ -402,44 +478,56 @@ class RecursiveFilter(PostProcessingPlugin):
                         "Input cube contains spatial slices with different masks."
                     )
 
-        recursed_cube = iris.cube.CubeList()
-        for cslice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-            padded_cube = pad_cube_with_halo(
-                cslice, 2 * self.edge_width, 2 * self.edge_width, pad_method="symmetric"
-            )
-
-            slice_coeffs_x = coeffs_x.copy()
-            slice_coeffs_y = coeffs_y.copy()
-
-            mask_cube = None
-            if np.ma.is_masked(cslice.data):
-                mask_cube = cslice.copy(data=cslice.data.mask)
-                slice_coeffs_x, slice_coeffs_y = self._update_coefficients_from_mask(
-                    slice_coeffs_x,
-                    slice_coeffs_y,
-                    mask_cube,
-                )
-
-            padded_coefficients_x, padded_coefficients_y = self._pad_coefficients(
-                slice_coeffs_x, slice_coeffs_y
-            )
+        # Filter all x-y slices together, with y and x as the last dimensions.
+        yx_dims = [cube.coord_dims(cube.coord(axis=axis))[0] for axis in "yx"]
+        data = np.moveaxis(cube.data, yx_dims, [-2, -1])
+        lines = np.ma.getdata(data).reshape((-1,) + data.shape[-2:])
+        masks = None
+        if np.ma.is_masked(data):
+            masks = np.ma.getmaskarray(data).reshape(lines.shape)
+            if not variable_mask:
+                masks = masks[:1]
+        padded_x, padded_y = self._padded_coefficients(
+            cube_format, coeffs_x, coeffs_y, masks
+        )
 
-            new_cube = self._run_recursion(
-                padded_cube,
-                padded_coefficients_x,
-                padded_coefficients_y,
-                self.iterations,
-            )
-            new_cube = remove_halo_from_cube(
-                new_cube, 2 * self.edge_width, 2 * self.edge_width
-            )
+        width = 2 * self.edge_width
+        padded = np.pad(
+            lines, ((0, 0), (width, width), (width, width)), mode="symmetric"
+        )
 
-            if mask_cube is not None:
-                new_cube.data = np.ma.MaskedArray(new_cube.data, mask=mask_cube.data)
+        def filter_slices(part):
+            """Filter a range of slices of the padded data in place."""
+            if len(padded_x) > 1:
+                coefficients = padded_x[part], padded_y[part]
+            else:
+                coefficients = padded_x, padded_y
+            self._recurse(padded[part], *coefficients, self.iterations)
+
+        # The numba kernel already filters the slices in parallel, so
+        # sharing them between further threads would oversubscribe the CPU.
+        n_workers = self.n_workers
+        if _numba_available():
+            n_workers = 1
+        else:
+            warnings.warn("Module numba unavailable. RecursiveFilter will be slower.")
+        parts = [
+            slice(indices[0], indices[-1] + 1)
+            for indices in np.array_split(np.arange(len(padded)), n_workers)
+            if len(indices)
+        ]
+        list(thread_map(filter_slices, parts, n_workers=n_workers))
 
-            recursed_cube.append(new_cube)
+        result = padded[
+            :, width : padded.shape[1] - width, width : padded.shape[2] - width
+        ]
+        result = np.ascontiguousarray(
+            np.moveaxis(result.reshape(data.shape), [-2, -1], yx_dims)
+        )
+        if masks is not None:
+            result = np.ma.MaskedArray(result, mask=np.ma.getmaskarray(cube.data))
+        new_cube = cube.copy(data=result)
 
-        new_cube = recursed_cube.merge_cube()
         if mask_zeros:
             new_cube.data = np.ma.getdata(new_cube.data)
             # This unmasks all the data on the cube
@@ -447,6 +535,4 @@ class RecursiveFilter(PostProcessingPlugin):
                 # Reapplying the original mask so the data doesn't change.
                 new_cube.data = np.ma.array(new_cube.data, mask=cube_mask)
 
-        new_cube = check_cube_coordinates(cube, new_cube)
-
         return new_cube
@@ -18,6 +18,7 @@ from improver.utilities.cube_checker import (
     find_dimension_coordinate_mismatch,
 )
 from improver.utilities.cube_manipulation import collapsed
+from improver.utilities.memo import SliceMemo
 
 
 class ApplyNeighbourhoodProcessingWithAMask(PostProcessingPlugin):
@@ -223,25 +224,54 @@ class ApplyNeighbourhoodProcessingWithAMask(PostProcessingPlugin):
         )
         yname = cube.coord(axis="y").name()
         xname = cube.coord(axis="x").name()
+        mask_slices = list(mask_cube.slices_over(self.coord_for_masking))
+        mask_data = np.stack([mask_slice.data for mask_slice in mask_slices])
+        # Identical mask bands give identical results, so only the distinct
+        # bands are processed.
+        band_indices, band_inverse = SliceMemo("nbhood_mask_bands").unique(mask_data)
+        mask_data = mask_data[band_indices]
+        # Number of valid points in the neighbourhood of each point for each
+        # mask, by neighbourhood size. These depend only on the masks, so are
+        # reused for every slice of data that has no mask of its own.
+        mask_area_sums = {}
+        # Results for each distinct slice of data and neighbourhood size.
+        memo = SliceMemo("nbhood_mask_slices")
         result_slices = iris.cube.CubeList([])
         # Take 2D slices of the input cube for memory issues.
-        prev_x_y_slice = None
         for x_y_slice in cube.slices([yname, xname]):
-            if prev_x_y_slice is not None and np.array_equal(
-                prev_x_y_slice.data, x_y_slice.data
-            ):
-                # Use same result as last time!
-                prev_result = result_slices[-1].copy()
+            plugin._prepare(x_y_slice)
+            key = memo.key(x_y_slice.data, extra=plugin.nb_size)
+            prev_result = memo.get(key)
+            if prev_result is not None:
+                # Use same result as for the identical slice!
+                prev_result = prev_result.copy()
                 for coord in x_y_slice.coords(dim_coords=False):
-                    prev_result.coord(coord).points = coord.points.copy()
+                    result_coord = prev_result.coord(coord)
+                    result_coord.points = coord.points.copy()
+                    result_coord.bounds = (
+                        None if coord.bounds is None else coord.bounds.copy()
+                    )
                 result_slices.append(prev_result)
                 continue
-            prev_x_y_slice = x_y_slice
+
+            # Apply each mask in mask_cube to the 2D input slice, processing
+            # all the masks together.
+            data = x_y_slice.data
+            if np.ma.is_masked(data):
+                data = np.ma.stack([data] * len(mask_data))
+                area_sums = None
+            else:
+                data = np.broadcast_to(np.ma.getdata(data), mask_data.shape)
+                area_sums = mask_area_sums.get(plugin.nb_size)
+            (results,), (area_sums,) = plugin._calculate_neighbourhoods(
+                data, mask_data, area_sums=None if area_sums is None else [area_sums]
+            )
+            if not np.ma.is_masked(x_y_slice.data):
+                mask_area_sums[plugin.nb_size] = area_sums
 
             cube_slices = iris.cube.CubeList([])
-            # Apply each mask in mask_cube to the 2D input slice.
-            for mask_slice in mask_cube.slices_over(self.coord_for_masking):
-                output_cube = plugin(x_y_slice, mask_cube=mask_slice)
+            for mask_slice, result in zip(mask_slices, results[band_inverse]):
+                output_cube = x_y_slice.copy(data=result)
                 coord_object = mask_slice.coord(self.coord_for_masking).copy()
                 output_cube.add_aux_coord(coord_object)
                 output_cube = iris.util.new_axis(output_cube, self.coord_for_masking)
@@ -249,6 +279,7 @@ class ApplyNeighbourhoodProcessingWithAMask(PostProcessingPlugin):
             concatenated_cube = cube_slices.concatenate_cube()
             if self.collapse_weights is not None:
                 concatenated_cube = self.collapse_mask_coord(concatenated_cube)
+            memo.add(key, concatenated_cube)
             result_slices.append(concatenated_cube)
         result = result_slices.merge_cube()
         # Promote any single value dimension coordinates if they were
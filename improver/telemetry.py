@@ -0,0 +1,158 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Module containing per-plugin telemetry utilities."""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from resource import RUSAGE_SELF, getrusage
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Environment variable holding the telemetry file path. An environment
+# variable is used so that worker processes inherit the setting.
+TELEMETRY_ENV_VAR = "IMPROVER_TELEMETRY"
+
+# linux reports max_rss in KiB rather than bytes
+_RSS_TO_BYTES = 1024 if sys.platform == "linux" else 1
+
+# Plugin calls are recorded separately by each thread
+_local = threading.local()
+
+
+def _counters() -> List[Dict[str, int]]:
+    """Return the counters for each plugin call currently being recorded by
+    this thread, innermost last. The number of calls gives the nesting
+    depth."""
+    if not hasattr(_local, "counters"):
+        _local.counters = []
+    return _local.counters
+
+
+@contextmanager
+def telemetry_enable(filename: str) -> Iterator[None]:
+    """Enable recording of plugin calls to a file within a context, restoring
+    the previous setting on exit.
+
+    Args:
+        filename:
+            File path to append a JSON line to for each plugin call.
+    """
+    previous = os.environ.get(TELEMETRY_ENV_VAR)
+    os.environ[TELEMETRY_ENV_VAR] = filename
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(TELEMETRY_ENV_VAR, None)
+        else:
+            os.environ[TELEMETRY_ENV_VAR] = previous
+
+
+def telemetry_filename() -> Optional[str]:
+    """Return the file path telemetry is being recorded to.
+
+    Returns:
+        File path, or None if telemetry is not enabled.
+    """
+    return os.environ.get(TELEMETRY_ENV_VAR) or None
+
+
+def telemetry_count(name: str, increment: int = 1) -> None:
+    """Add to a named counter in the record of the innermost plugin call
+    being recorded. Does nothing if no plugin call is being recorded.
+
+    Args:
+        name:
+            Name of the counter.
+        increment:
+            Amount to add to the counter.
+    """
+    stack = _counters()
+    if stack:
+        counters = stack[-1]
+        counters[name] = counters.get(name, 0) + increment
+
+
+def describe(obj: Any) -> List[Dict[str, Any]]:
+    """Describe the arrays and cubes within an object.
+
+    Args:
+        obj:
+            Object to describe. Lists, tuples and dictionary values are
+            searched for arrays and cubes.
+
+    Returns:
+        Name, shape and dtype of each array or cube found.
+    """
+    if hasattr(obj, "shape") and hasattr(obj, "dtype"):
+        name = obj.name() if callable(getattr(obj, "name", None)) else None
+        return [{"name": name, "shape": list(obj.shape), "dtype": str(obj.dtype)}]
+    if isinstance(obj, dict):
+        obj = list(obj.values())
+    if isinstance(obj, (list, tuple)):
+        return [item for element in obj for item in describe(element)]
+    return []
+
+
+def record_call(plugin: Any, method: Callable, args: tuple, kwargs: dict) -> Any:
+    """Call a plugin method and append a record of the call to the
+    telemetry file.
+
+    The record holds the plugin class, the wall and CPU time taken, the
+    increase in the peak resident set size of the process, and the names,
+    shapes and dtypes of the input and output arrays and cubes. Calls to
+    plugins made by other plugins are recorded with a greater depth. Any
+    counters added to with telemetry_count during the call are included.
+
+    Args:
+        plugin:
+            Plugin instance being called.
+        method:
+            Method of the plugin to call.
+        args:
+            Positional arguments for the method.
+        kwargs:
+            Keyword arguments for the method.
+
+    Returns:
+        Output of the method.
+    """
+    stack = _counters()
+    record = {
+        "plugin": f"{type(plugin).__module__}.{type(plugin).__qualname__}",
+        "pid": os.getpid(),
+        "depth": len(stack),
+        "inputs": describe([args, kwargs]),
+    }
+    error = None
+    max_rss = getrusage(RUSAGE_SELF).ru_maxrss
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    counters = {}
+    stack.append(counters)
+    try:
+        result = method(*args, **kwargs)
+    except BaseException as err:
+        error = err
+        raise
+    finally:
+        stack.pop()
+        if counters:
+            record["counters"] = counters
+        record["wall_time"] = time.perf_counter() - wall_start
+        record["cpu_time"] = time.process_time() - cpu_start
+        record["peak_rss_delta"] = (
+            getrusage(RUSAGE_SELF).ru_maxrss - max_rss
+        ) * _RSS_TO_BYTES
+        if error is None:
+            record["outputs"] = describe([result])
+        else:
+            record["error"] = f"{type(error).__name__}: {error}"
+        with open(telemetry_filename(), "a") as fout:
+            print(json.dumps(record), file=fout)
+    return result
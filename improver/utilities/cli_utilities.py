@@ -5,7 +5,11 @@
 """Provides support utilities for cli scripts."""
 
 import json
-from typing import Dict, Optional
+import multiprocessing
+import shlex
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 
 def load_json_or_none(file_path: Optional[str]) -> Optional[Dict]:
@@ -26,3 +30,85 @@ def load_json_or_none(file_path: Optional[str]) -> Optional[Dict]:
         with open(file_path, "r") as input_file:
             metadata_dict = json.load(input_file)
     return metadata_dict
+
+
+def read_job_file(file_path: Union[str, Path]) -> List[str]:
+    """Read improver command lines from a job file.
+
+    Each non-blank line of the file is one command line, as it would be
+    given to the improver executable, e.g.
+    ``threshold input.nc --threshold-values 280 --output output.nc``.
+    A leading ``improver`` is optional. Lines starting with ``#`` are
+    ignored.
+
+    Args:
+        file_path:
+            File path to the job file.
+
+    Returns:
+        The command lines in the order they appear in the file.
+    """
+    with open(file_path, "r") as input_file:
+        lines = [line.strip() for line in input_file]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def run_job(command_line: str) -> Tuple[str, float, Optional[str]]:
+    """Run a single improver command line in the current interpreter.
+
+    Any modules imported by previous jobs remain imported, so only the
+    first job run by a process pays for importing iris, numpy and the
+    plugins used. Cubes loaded from file are cached for later jobs run by
+    the same process.
+
+    Args:
+        command_line:
+            Command line as it would be given to the improver executable.
+
+    Returns:
+        - The command line that was run.
+        - Run-time of the command in seconds.
+        - Error message if the command failed, otherwise None.
+    """
+    from improver import cli
+    from improver.utilities.load import CUBE_CACHE
+
+    args = shlex.split(command_line)
+    if args and args[0] == "improver":
+        args = args[1:]
+    error = None
+    # Cubes loaded by one job can be reused by later jobs in this process.
+    with CUBE_CACHE.enable(), cli.TimeIt() as timeit:
+        try:
+            cli.main.cli("improver", *args)
+        except (Exception, SystemExit) as err:
+            error = f"{type(err).__name__}: {err}"
+    return command_line, timeit.elapsed, error
+
+
+def run_jobs(
+    command_lines: List[str], n_workers: int = 1
+) -> Iterator[Tuple[str, float, Optional[str]]]:
+    """Run improver command lines sequentially or across a worker pool.
+
+    Args:
+        command_lines:
+            Command lines as they would be given to the improver executable.
+        n_workers:
+            Number of worker processes. If 1, all jobs are run sequentially
+            in the current process.
+
+    Yields:
+        The result of :func:`run_job` for each command line, in the order
+        given.
+    """
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+    if n_workers == 1:
+        yield from map(run_job, command_lines)
+        return
+    # spawn workers rather than forking so that they do not inherit locks
+    # held by other threads (e.g. netCDF/HDF5) at the time of the fork
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+        yield from executor.map(run_job, command_lines)
@@ -4,9 +4,15 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module for loading cubes."""
 
-from typing import List, Optional, Union
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import iris
+import numpy as np
 from iris import Constraint
 from iris.cube import Cube, CubeList
 
@@ -16,11 +22,329 @@ from improver.utilities.cube_manipulation import (
     strip_var_names,
 )
 
+Subset = Dict[str, Union[slice, Tuple[float, float], List[float]]]
+
+
+def _subset_cube(cube: Cube, subset: Subset) -> Cube:
+    """Extract a subset of a cube by index or coordinate value, without
+    realising its data. Slicing lazy data before it is realised means that
+    only the data within the subset is read from file.
+
+    Args:
+        cube:
+            Cube to subset.
+        subset:
+            Selection for each named one-dimensional coordinate, given as a
+            slice of indices, a (min, max) tuple of the inclusive range of
+            coordinate values, or a list of coordinate values.
+
+    Returns:
+        Subset of the cube. Dimensions are kept even where only a single
+        point is selected.
+
+    Raises:
+        ValueError: if a coordinate does not describe a single dimension,
+            other than a scalar coordinate selected by value.
+        ValueError: if no points of a coordinate match the selection.
+    """
+    for name, selection in subset.items():
+        coord = cube.coord(name)
+        dims = cube.coord_dims(coord)
+        # a scalar coordinate selected by value only needs to match
+        scalar = not dims and not isinstance(selection, slice)
+        if not scalar and (len(dims) != 1 or coord.ndim != 1):
+            raise ValueError(
+                f"Cannot subset on the {name} coordinate, as it does not "
+                "describe a single dimension"
+            )
+        if isinstance(selection, slice):
+            index = selection
+        else:
+            points = coord.points
+            if isinstance(selection, tuple):
+                lower, upper = selection
+                index = np.flatnonzero((points >= lower) & (points <= upper))
+            else:
+                requested = np.asarray(selection)
+                # values are compared in the type of the points, so that
+                # float values match float32 points, but values that cannot
+                # be held exactly by integer points must not be truncated
+                values = requested.astype(points.dtype)
+                if not np.issubdtype(points.dtype, np.floating):
+                    values = values[values == requested]
+                index = np.flatnonzero(np.isin(points, values))
+            if not index.size:
+                raise ValueError(f"No {name} points match the subset {selection}")
+            if scalar:
+                continue
+            if np.all(np.diff(index) == 1):
+                # a slice allows the file to be read in contiguous blocks
+                index = slice(index[0], index[-1] + 1)
+        keys = [slice(None)] * cube.ndim
+        keys[dims[0]] = index
+        cube = cube[tuple(keys)]
+    return cube
+
+
+# netCDF attributes interpreted when building cubes and coordinates, which
+# are therefore not copied into their attributes
+_CF_ATTRIBUTES = {
+    "_FillValue",
+    "axis",
+    "bounds",
+    "calendar",
+    "cell_methods",
+    "coordinates",
+    "grid_mapping",
+    "long_name",
+    "missing_value",
+    "standard_name",
+    "units",
+}
+
+# netCDF attributes needing structures which the fast loader does not build
+_UNSUPPORTED_ATTRIBUTES = {
+    "add_offset",
+    "ancillary_variables",
+    "cell_measures",
+    "climatology",
+    "compress",
+    "formula_terms",
+    "scale_factor",
+}
+
+# Coordinates on which the grid mapping of a data variable is set
+_HORIZONTAL_COORDS = {
+    "latitude",
+    "longitude",
+    "grid_latitude",
+    "grid_longitude",
+    "projection_x_coordinate",
+    "projection_y_coordinate",
+}
+
+
+# The netCDF library is not thread safe, so reads of lazy data loaded by the
+# fast loader are made one at a time
+_NETCDF_LOCK = threading.Lock()
+
+
+class _NetCDFVariableProxy:
+    """Array-like reference to a netCDF variable, which opens the file to
+    read the requested part of the variable when indexed. This allows the
+    data to be wrapped in a dask array without holding the file open."""
+
+    def __init__(self, filepath: str, var) -> None:
+        self.filepath = filepath
+        self.name = var.name
+        self.shape = var.shape
+        self.dtype = var.dtype
+        self.ndim = len(var.shape)
+
+    def __getitem__(self, keys):
+        import netCDF4
+
+        with _NETCDF_LOCK, netCDF4.Dataset(self.filepath) as dataset:
+            return dataset.variables[self.name][keys]
+
+
+def _fast_load_coord_system(grid_var):
+    """Build the coordinate system described by a netCDF grid mapping
+    variable, or return None if the grid mapping is not supported."""
+    from iris.coord_systems import GeogCS, LambertAzimuthalEqualArea
+
+    attrs = {key: grid_var.getncattr(key) for key in grid_var.ncattrs()}
+    semi_major = attrs.get("semi_major_axis", attrs.get("earth_radius"))
+    if semi_major is None:
+        return None
+    ellipsoid = GeogCS(
+        semi_major,
+        attrs.get("semi_minor_axis"),
+        attrs.get("inverse_flattening"),
+        attrs.get("longitude_of_prime_meridian", 0),
+    )
+    name = attrs.get("grid_mapping_name")
+    if name == "latitude_longitude":
+        return ellipsoid
+    if name == "lambert_azimuthal_equal_area":
+        return LambertAzimuthalEqualArea(
+            attrs["latitude_of_projection_origin"],
+            attrs["longitude_of_projection_origin"],
+            attrs.get("false_easting", 0),
+            attrs.get("false_northing", 0),
+            ellipsoid,
+        )
+    return None
+
+
+def _fast_load_attributes(var) -> Dict:
+    """Return the attributes of a netCDF variable which are not interpreted
+    as part of the cube or coordinate structure."""
+    return {
+        key: var.getncattr(key) for key in var.ncattrs() if key not in _CF_ATTRIBUTES
+    }
+
+
+def _fast_load_units(var):
+    """Return the units of a netCDF variable, or None if they cannot be
+    interpreted."""
+    from cf_units import Unit
+
+    try:
+        return Unit(var.getncattr("units"), calendar=getattr(var, "calendar", None))
+    except ValueError:
+        return None
+
+
+def _fast_load_coord(dataset, name: str, as_dim_coord: bool):
+    """Build a coordinate from a netCDF coordinate variable."""
+    from iris.coords import AuxCoord, DimCoord
+
+    var = dataset.variables[name]
+    bounds = None
+    if "bounds" in var.ncattrs():
+        bounds = dataset.variables[var.getncattr("bounds")][:]
+    kwargs = dict(
+        standard_name=getattr(var, "standard_name", None),
+        long_name=getattr(var, "long_name", None),
+        var_name=name,
+        units=_fast_load_units(var),
+        bounds=bounds,
+        attributes=_fast_load_attributes(var),
+    )
+    if as_dim_coord:
+        try:
+            return DimCoord(var[:], **kwargs)
+        except ValueError:
+            # points are not strictly monotonic
+            pass
+    return AuxCoord(var[:], **kwargs)
+
+
+def _fast_load_dataset(dataset, filepath: str) -> Optional[Cube]:
+    """Build a cube from an open netCDF dataset, or return None if the
+    dataset does not have the structure required by :func:`_fast_load`."""
+    import dask.array as da
+    from iris.coords import DimCoord
+    from iris.fileformats.netcdf import parse_cell_methods
+
+    dataset.set_auto_mask(False)
+    variables = dataset.variables
+    referenced = set()
+    for var in variables.values():
+        referenced.update(getattr(var, "coordinates", "").split())
+        for key in ("bounds", "grid_mapping"):
+            if key in var.ncattrs():
+                referenced.add(var.getncattr(key))
+    data_names = [
+        name
+        for name in variables
+        if name not in referenced and name not in dataset.dimensions
+    ]
+    if len(data_names) != 1:
+        return None
+    var = variables[data_names[0]]
+    aux_names = getattr(var, "coordinates", "").split()
+    coord_names = [name for name in var.dimensions if name in variables]
+    if not referenced.issubset(variables):
+        return None
+    for name in [var.name, *coord_names, *aux_names]:
+        other = variables[name]
+        if (
+            _UNSUPPORTED_ATTRIBUTES.intersection(other.ncattrs())
+            or other.dtype.kind not in "biuf"
+            or "units" not in other.ncattrs()
+            or _fast_load_units(other) is None
+            or not set(other.dimensions).issubset(var.dimensions)
+        ):
+            return None
+
+    coord_system = None
+    if "grid_mapping" in var.ncattrs():
+        grid_var = variables[var.getncattr("grid_mapping")]
+        coord_system = _fast_load_coord_system(grid_var)
+        if coord_system is None:
+            return None
+
+    chunks = var.chunking()
+    # data is masked where it holds the fill value, as when loaded by iris
+    meta = np.ma.masked_array(np.empty((0,) * var.ndim, dtype=var.dtype))
+    data = da.from_array(
+        _NetCDFVariableProxy(filepath, var),
+        chunks=var.shape if chunks == "contiguous" else tuple(chunks),
+        meta=meta,
+    )
+    global_attributes = {key: dataset.getncattr(key) for key in dataset.ncattrs()}
+    cube = Cube(
+        data,
+        standard_name=getattr(var, "standard_name", None),
+        long_name=getattr(var, "long_name", None),
+        var_name=var.name,
+        units=_fast_load_units(var),
+    )
+    if hasattr(cube.attributes, "globals"):
+        # iris 3.8 onwards holds global and data variable attributes apart
+        cube.attributes.globals.update(global_attributes)
+        cube.attributes.locals.update(_fast_load_attributes(var))
+    else:
+        cube.attributes = {**global_attributes, **_fast_load_attributes(var)}
+    if "cell_methods" in var.ncattrs():
+        cube.cell_methods = parse_cell_methods(var.getncattr("cell_methods"))
+    for name in coord_names:
+        coord = _fast_load_coord(dataset, name, as_dim_coord=True)
+        if coord.standard_name in _HORIZONTAL_COORDS:
+            coord.coord_system = coord_system
+        dim = var.dimensions.index(name)
+        if isinstance(coord, DimCoord):
+            cube.add_dim_coord(coord, dim)
+        else:
+            cube.add_aux_coord(coord, dim)
+    for name in aux_names:
+        coord = _fast_load_coord(dataset, name, as_dim_coord=False)
+        dims = [var.dimensions.index(dim) for dim in variables[name].dimensions]
+        cube.add_aux_coord(coord, dims)
+    return cube
+
+
+def _fast_load(filepath: str) -> Optional[Cube]:
+    """Load a cube directly from the netCDF variables of a file with the
+    simple structure written by :func:`improver.utilities.save.save_netcdf`,
+    bypassing the iris netCDF rules engine and merge.
+
+    The file must hold a single data variable on a latitude-longitude or
+    Lambert azimuthal equal area grid, with numeric coordinates held in
+    coordinate variables or listed as its auxiliary coordinates. The data
+    is loaded lazily as by iris.
+
+    Args:
+        filepath:
+            Path of the file to load.
+
+    Returns:
+        The loaded cube, or None if the file does not have the expected
+        structure, in which case it should be loaded with iris.
+    """
+    try:
+        import netCDF4
+    except ImportError:
+        return None
+    if not os.path.isfile(filepath):
+        return None
+    try:
+        dataset = netCDF4.Dataset(filepath)
+    except OSError:
+        # not a netCDF file, which iris may be able to load
+        return None
+    with dataset:
+        return _fast_load_dataset(dataset, filepath)
+
 
 def load_cubelist(
     filepath: Union[str, List[str]],
     constraints: Optional[Union[Constraint, str]] = None,
     no_lazy_load: bool = False,
+    subset: Optional[Subset] = None,
+    fast_load: bool = False,
 ) -> CubeList:
     """Load cubes from filepath(s) into a cubelist. Strips off all
     var names except for "threshold"-type coordinates, where this is different
@@ -38,11 +362,25 @@ def load_cubelist(
             If True, bypass cube deferred (lazy) loading and load the whole
             cube into memory. This can increase performance at the cost of
             memory. If False (default) then lazy load.
+        subset:
+            Selection to extract from each cube before its data is realised,
+            so that only this part of the data is read from file. Each
+            named one-dimensional coordinate is selected by a slice of
+            indices, a (min, max) tuple of the inclusive range of coordinate
+            values, or a list of coordinate values, e.g.
+            ``{"threshold": [275.0, 280.0], "projection_x_coordinate": (0, 1e5)}``.
+        fast_load:
+            If True, files with the simple structure written by save_netcdf
+            are loaded directly from their netCDF variables, which is much
+            quicker than iris for many small files. Other files, and all
+            files when constraints are given, are loaded with iris.
 
     Returns:
         CubeList that has been created from the input filepath given the
         constraints provided.
     """
+    use_fast_load = fast_load and constraints is None
+
     # Remove legacy metadata prefix cube if present
     constraints = (
         iris.Constraint(cube_func=lambda cube: cube.long_name != "prefixes")
@@ -51,12 +389,13 @@ def load_cubelist(
 
     # Load each file individually to avoid partial merging (not used
     # iris.load_raw() due to issues with time representation)
-    if isinstance(filepath, str):
-        cubes = iris.load(filepath, constraints=constraints)
-    else:
-        cubes = iris.cube.CubeList([])
-        for item in filepath:
+    cubes = iris.cube.CubeList([])
+    for item in [filepath] if isinstance(filepath, str) else filepath:
+        cube = _fast_load(item) if use_fast_load else None
+        if cube is None:
             cubes.extend(iris.load(item, constraints=constraints))
+        else:
+            cubes.append(cube)
 
     if not cubes:
         message = "No cubes found using constraints {}".format(constraints)
@@ -66,7 +405,7 @@ def load_cubelist(
     # describe probabilistic data)
     cubes = strip_var_names(cubes)
 
-    for cube in cubes:
+    for i, cube in enumerate(cubes):
         # Remove metadata attributes pointing to legacy prefix cube
         cube.attributes.pop("bald__isPrefixedBy", None)
 
@@ -77,6 +416,8 @@ def load_cubelist(
         y_name = cube.coord(axis="y").name()
         x_name = cube.coord(axis="x").name()
         enforce_coordinate_ordering(cube, [y_name, x_name], anchor_start=False)
+        if subset:
+            cube = cubes[i] = _subset_cube(cube, subset)
         if no_lazy_load:
             # Force cube's data into memory by touching the .data attribute.
             cube.data
@@ -88,6 +429,8 @@ def load_cube(
     filepath: Union[str, List[str]],
     constraints: Optional[Union[Constraint, str]] = None,
     no_lazy_load: bool = False,
+    subset: Optional[Subset] = None,
+    fast_load: bool = False,
 ) -> Cube:
     """Load the filepath provided using Iris into a cube. Strips off all
     var names except for "threshold"-type coordinates, where this is different
@@ -106,15 +449,188 @@ def load_cube(
             If True, bypass cube deferred (lazy) loading and load the whole
             cube into memory. This can increase performance at the cost of
             memory. If False (default) then lazy load.
+        subset:
+            Selection to extract from each loaded cube before its data is
+            realised, as described for :func:`load_cubelist`.
+        fast_load:
+            If True, load files written by save_netcdf directly from their
+            netCDF variables where possible, as described for
+            :func:`load_cubelist`.
 
     Returns:
         Cube that has been loaded from the input filepath given the
         constraints provided.
     """
-    cubes = load_cubelist(filepath, constraints, no_lazy_load)
+    cubes = load_cubelist(filepath, constraints, no_lazy_load, subset, fast_load)
     # Merge loaded cubes
     if len(cubes) == 1:
         cube = cubes[0]
     else:
         cube = MergeCubes()(cubes)
     return cube
+
+
+class CubeCache:
+    """Least recently used cache of cubes loaded from file.
+
+    Entries are keyed on the file path(s) together with the modification
+    time and size of each file and the load options, so a file which is
+    rewritten is loaded afresh. The loaded cubes are cached, and callers are
+    given copies so that they cannot modify the cached data. Loads of a
+    subset are cached separately from loads of the whole file. Loads from
+    paths which are not plain files (e.g. wildcards), or with constraints
+    other than a cube name, are passed straight through to the loader, as
+    are all loads while the cache is disabled.
+    """
+
+    def __init__(self, max_bytes: int = 2**29, enabled: bool = True) -> None:
+        """
+        Args:
+            max_bytes:
+                Maximum total size in bytes of the cached cubes. Least
+                recently used entries are discarded to keep within this
+                size. Cubes with lazy data are counted at the size of their
+                coordinates, as their data is not held.
+            enabled:
+                Whether loads use the cache.
+        """
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._nbytes = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def _key(
+        loader: str,
+        filepath: Union[str, List[str]],
+        constraints: Optional[Union[Constraint, str]],
+        no_lazy_load: bool,
+        subset: Optional[Subset],
+    ) -> Optional[Tuple]:
+        """Create the cache key for a load, or None if it cannot be cached."""
+        if constraints is not None and not isinstance(constraints, str):
+            return None
+        selections = []
+        for name, selection in sorted((subset or {}).items()):
+            # slices and lists are not hashable
+            if isinstance(selection, slice):
+                selection = ("slice", selection.start, selection.stop, selection.step)
+            elif isinstance(selection, tuple):
+                selection = ("range", *selection)
+            else:
+                selection = ("values", *selection)
+            selections.append((name, selection))
+        paths = [filepath] if isinstance(filepath, str) else list(filepath)
+        files = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except (OSError, TypeError):
+                return None
+            files.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+        return (loader, tuple(files), constraints, no_lazy_load, tuple(selections))
+
+    @staticmethod
+    def _cube_nbytes(cube: Cube) -> int:
+        """Return the size in bytes of the arrays held by a cube."""
+        nbytes = 0 if cube.has_lazy_data() else cube.data.nbytes
+        for coord in cube.coords():
+            nbytes += coord.core_points().nbytes
+            if coord.has_bounds():
+                nbytes += coord.core_bounds().nbytes
+        return nbytes
+
+    @staticmethod
+    def _copy(cubes: Union[Cube, CubeList]) -> Union[Cube, CubeList]:
+        """Return a copy of a cube or of every cube in a cubelist."""
+        if isinstance(cubes, Cube):
+            return cubes.copy()
+        return CubeList(cube.copy() for cube in cubes)
+
+    def _load(self, loader, filepath, constraints, no_lazy_load, subset, fast_load):
+        """Return a copy of the cached result of the loader, loading and
+        caching the result if it is not already held. The fast loader builds
+        the same cubes as iris, so is not part of the key."""
+        load = partial(loader, filepath, constraints, no_lazy_load, subset, fast_load)
+        if not self.enabled:
+            return load()
+        key = self._key(loader.__name__, filepath, constraints, no_lazy_load, subset)
+        if key is None:
+            return load()
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._copy(self._entries[key][0])
+        self.misses += 1
+        result = load()
+        cubes = [result] if isinstance(result, Cube) else result
+        nbytes = sum(self._cube_nbytes(cube) for cube in cubes)
+        if nbytes > self.max_bytes:
+            return result
+        self._entries[key] = (result, nbytes)
+        self._nbytes += nbytes
+        while self._nbytes > self.max_bytes:
+            _, (_, old_nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= old_nbytes
+        return self._copy(result)
+
+    def load_cube(
+        self,
+        filepath: Union[str, List[str]],
+        constraints: Optional[Union[Constraint, str]] = None,
+        no_lazy_load: bool = False,
+        subset: Optional[Subset] = None,
+        fast_load: bool = False,
+    ) -> Cube:
+        """Load a cube as :func:`load_cube`, using the cache where possible."""
+        return self._load(
+            load_cube, filepath, constraints, no_lazy_load, subset, fast_load
+        )
+
+    def load_cubelist(
+        self,
+        filepath: Union[str, List[str]],
+        constraints: Optional[Union[Constraint, str]] = None,
+        no_lazy_load: bool = False,
+        subset: Optional[Subset] = None,
+        fast_load: bool = False,
+    ) -> CubeList:
+        """Load a cubelist as :func:`load_cubelist`, using the cache where
+        possible."""
+        return self._load(
+            load_cubelist, filepath, constraints, no_lazy_load, subset, fast_load
+        )
+
+    @contextmanager
+    def enable(self) -> Iterator["CubeCache"]:
+        """Enable the cache within a context, restoring the previous state
+        on exit. Cached cubes are kept after the context exits, so that
+        they can be reused if the cache is enabled again."""
+        enabled = self.enabled
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = enabled
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and reset the counters."""
+        self._entries.clear()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self) -> str:
+        """Summarise the cache usage."""
+        return (
+            f"Cube cache: {self.hits} hits, {self.misses} misses, "
+            f"{len(self._entries)} entries, {self._nbytes} bytes"
+        )
+
+
+# Cache shared by the CLI calls made within one process, which is only
+# enabled for pipelines and batches of commands, as a single command gains
+# nothing from caching the cubes it loads.
+CUBE_CACHE = CubeCache(enabled=False)
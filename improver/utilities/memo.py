@@ -0,0 +1,159 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Provides a memo for reusing results calculated from identical arrays."""
+
+import hashlib
+import threading
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+from improver.telemetry import telemetry_count
+
+
+def array_digest(*arrays: Optional[ndarray]) -> bytes:
+    """Calculate a digest of the shape, dtype, values and mask of arrays.
+
+    Arrays with the same digest can be treated as identical, as the chance
+    of two different arrays sharing a 128-bit BLAKE2 digest is negligible.
+    Values hidden by a mask are included, so arrays that differ only in
+    masked values have different digests.
+
+    Args:
+        arrays:
+            Numeric arrays, or None.
+
+    Returns:
+        Digest of the arrays.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        if array is None:
+            digest.update(b"None")
+            continue
+        digest.update(repr((np.shape(array), np.asanyarray(array).dtype.str)).encode())
+        digest.update(np.ascontiguousarray(np.ma.getdata(array)))
+        if np.ma.isMaskedArray(array):
+            digest.update(np.ascontiguousarray(np.ma.getmaskarray(array)))
+    return digest.digest()
+
+
+class SliceMemo:
+    """Results calculated from arrays, such as the x-y slices of a cube,
+    stored by a digest of the array contents so that they are calculated
+    once for each distinct set of arrays within one plugin call.
+
+    The number of results calculated and reused are recorded as telemetry
+    counters named "<name>.computed" and "<name>.reused".
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Args:
+            name:
+                Prefix for the names of the telemetry counters.
+        """
+        self.name = name
+        self._results = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*arrays: Optional[ndarray], extra: Hashable = None) -> Hashable:
+        """Return the key for results calculated from arrays.
+
+        Args:
+            arrays:
+                Arrays from which the result is calculated.
+            extra:
+                Other values on which the result depends.
+
+        Returns:
+            Key for the results.
+        """
+        return extra, array_digest(*arrays)
+
+    def get(self, key: Hashable) -> Any:
+        """Return a stored result, counting it as reused.
+
+        Args:
+            key:
+                Key for the result.
+
+        Returns:
+            The stored result, or None if there is none.
+        """
+        with self._lock:
+            result = self._results.get(key)
+        if result is not None:
+            telemetry_count(f"{self.name}.reused")
+        return result
+
+    def add(self, key: Hashable, result: Any) -> None:
+        """Store a result, counting it as computed.
+
+        Args:
+            key:
+                Key for the result.
+            result:
+                Result to store, which should not be modified afterwards.
+        """
+        with self._lock:
+            self._results[key] = result
+        telemetry_count(f"{self.name}.computed")
+
+    def __call__(
+        self, function: Callable, *arrays: Optional[ndarray], extra: Hashable = None
+    ) -> Any:
+        """Return the result of a function of arrays, calling the function
+        only if the result for identical arrays is not already stored.
+
+        Args:
+            function:
+                Function to call with the arrays.
+            arrays:
+                Arrays to pass to the function.
+            extra:
+                Other values on which the result depends.
+
+        Returns:
+            Result of the function.
+        """
+        key = self.key(*arrays, extra=extra)
+        result = self.get(key)
+        if result is None:
+            result = function(*arrays)
+            self.add(key, result)
+        return result
+
+    def unique(self, *arrays: Optional[ndarray]) -> Tuple[ndarray, ndarray]:
+        """Find the distinct slices along the leading dimension of arrays,
+        counting each distinct slice as computed and each repeat as reused.
+
+        Args:
+            arrays:
+                Arrays with the same length leading dimension, or None.
+
+        Returns:
+            - Index of the first occurrence of each distinct slice.
+            - Index into the distinct slices of each slice, so that
+              slices of a result calculated from the distinct slices can
+              be indexed with it to give a result for every slice.
+        """
+        length = len(next(array for array in arrays if array is not None))
+        first = {}
+        indices = []
+        inverse = np.empty(length, dtype=np.intp)
+        for index in range(length):
+            key = self.key(
+                *(None if array is None else array[index] for array in arrays)
+            )
+            if key not in first:
+                first[key] = len(indices)
+                indices.append(index)
+            inverse[index] = first[key]
+        telemetry_count(f"{self.name}.computed", len(indices))
+        telemetry_count(f"{self.name}.reused", length - len(indices))
+        return np.array(indices, dtype=np.intp), inverse
@@ -4,10 +4,19 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Provides tools for neighbourhood generation"""
 
-from typing import Any, Tuple, Union
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 from numpy import ndarray
+from scipy.ndimage import find_objects, label, maximum_filter
+
+# Largest fraction of points that may be events for a field to be treated as
+# sparse, and processed only around clusters of those events.
+SPARSE_MAX_FRACTION = 0.01
+
+# Number of positions along an axis whose totals are found together from one
+# float64 cumulative sum when accumulating in blocks.
+ACCUMULATION_BLOCK_SIZE = 128
 
 
 def rolling_window(
@@ -209,3 +218,281 @@ def boxsum(
         - data[..., i : i + m, :n]
     )
     return result
+
+
+def blocked_cumsums(
+    data: ndarray, axis: int, overlap: int, block_size: int = ACCUMULATION_BLOCK_SIZE
+) -> Iterator[Tuple[slice, ndarray]]:
+    """Calculate float64 cumulative sums along one axis of an array, one
+    block of positions at a time.
+
+    The positions along the axis, other than the last `overlap`, are split
+    into blocks of at most `block_size`. For each block of positions a to b,
+    the data from a up to b + overlap are accumulated in float64 with a
+    leading zero, so that the total of the elements from a + i up to but not
+    including a + k is ``cumulative[k] - cumulative[i]``. Totals over windows
+    of up to overlap + 1 elements can then be found in float64 for every
+    position of the block, while only one block is ever held in float64.
+    As the sums start afresh in each block, their errors do not grow with the
+    length of the axis.
+
+    Args:
+        data:
+            The input data array.
+        axis:
+            The axis along which to accumulate.
+        overlap:
+            The number of further elements accumulated after each block.
+        block_size:
+            The largest number of positions in each block.
+
+    Yields:
+        - Slice of the positions of the block along the axis.
+        - Float64 array of the cumulative sums for the block, with length
+          along the axis of the block length plus overlap plus one.
+    """
+    axis = axis % data.ndim
+    before = (slice(None),) * axis
+    length = data.shape[axis] - overlap
+    for start in range(0, length, block_size):
+        stop = min(start + block_size, length)
+        block = data[before + (slice(start, stop + overlap),)]
+        shape = list(block.shape)
+        shape[axis] += 1
+        cumulative = np.empty(shape, dtype=np.float64)
+        cumulative[before + (0,)] = 0
+        np.cumsum(
+            block,
+            axis=axis,
+            dtype=np.float64,
+            out=cumulative[before + (slice(1, None),)],
+        )
+        yield slice(start, stop), cumulative
+
+
+def _blocked_window_sum(data: ndarray, size: int, axis: int) -> ndarray:
+    """Calculate the totals within a window of `size` elements along one axis
+    of an array, from cumulative sums in float64 blocks. The result has the
+    type of the data and is shorter than the data by `size` elements along the
+    axis, and the total at each position covers the `size` elements ending
+    one element later."""
+    axis = axis % data.ndim
+    before = (slice(None),) * axis
+    shape = list(data.shape)
+    shape[axis] -= size
+    result = np.empty(shape, dtype=data.dtype)
+    for block, cumulative in blocked_cumsums(data, axis, size):
+        length = block.stop - block.start
+        upper = before + (slice(size + 1, size + 1 + length),)
+        lower = before + (slice(1, 1 + length),)
+        result[before + (block,)] = cumulative[upper] - cumulative[lower]
+    return result
+
+
+def blocked_boxsum(
+    data: ndarray, boxsize: Union[int, Tuple[int, int]], **pad_options: Any
+) -> ndarray:
+    """Calculate neighbourhood totals as for `boxsum`, with accuracy that does
+    not depend on the size of the array, without a float64 copy of the data.
+
+    A summed-area table of a large single precision array holds totals far
+    larger than any neighbourhood total, so rounding errors in the table
+    swamp the differences taken from it. Here the totals are instead found
+    separably, along x and then along y, each from cumulative sums in float64
+    of one block of the array at a time (see `blocked_cumsums`). Each total is
+    rounded to the type of the data once, so float32 data give totals within
+    a few float32 roundings of those from float64 data, while only the result
+    and one block in float64 are held at a time.
+
+    Args:
+        data:
+            The input data array, of a floating point type.
+        boxsize:
+            The size of the neighbourhood. Must be an odd number.
+        pad_options:
+            Additional keyword arguments passed to `numpy.pad` function.
+            If given, the returned result will have the same shape as the input
+            array.
+
+    Returns:
+        Array containing the calculated neighbourhood total.
+
+    Raises:
+        ValueError: If `boxsize` has non-integer type.
+        ValueError: If any member of `boxsize` is not an odd number.
+    """
+    boxsize = np.atleast_1d(boxsize)
+    if not issubclass(boxsize.dtype.type, np.integer):
+        raise ValueError("The size of the neighbourhood must be of an integer type.")
+    if not np.all(boxsize % 2):
+        raise ValueError("The size of the neighbourhood must be an odd number.")
+    if pad_options:
+        data = pad_boxsum(data, boxsize, **pad_options)
+    data = _blocked_window_sum(data, boxsize[-1], axis=data.ndim - 1)
+    return _blocked_window_sum(data, boxsize[0], axis=data.ndim - 2)
+
+
+def boxsums(
+    data: ndarray, boxsizes: List[Union[int, Tuple[int, int]]], **pad_options: Any
+) -> List[ndarray]:
+    """Calculate neighbourhood totals for several neighbourhood sizes from a
+    single summed-area table.
+
+    The data are padded for the largest neighbourhood and accumulated once,
+    then the totals for each neighbourhood size are looked up from the same
+    table as described in `boxsum`. Each result is identical to that from
+    `boxsum` with the same arguments, provided any padding mode repeats the
+    same values however wide the padding, e.g. "constant" or "edge".
+
+    Args:
+        data:
+            The input data array.
+        boxsizes:
+            The sizes of the neighbourhoods. Each must be an odd number.
+        pad_options:
+            Additional keyword arguments passed to `numpy.pad` function.
+            If given, the returned results will have the same shape as the
+            input array.
+
+    Returns:
+        Arrays containing the calculated neighbourhood totals for each
+        neighbourhood size.
+    """
+    boxsizes = [np.broadcast_to(boxsize, 2) for boxsize in boxsizes]
+    largest = np.max(boxsizes, axis=0)
+    if pad_options:
+        data = pad_boxsum(data, largest, **pad_options)
+    table = data.cumsum(-2).cumsum(-1)
+    results = []
+    for boxsize in boxsizes:
+        if pad_options:
+            # Trim the table to the padding required for this neighbourhood.
+            iy, ix = (largest - boxsize) // 2
+            result = boxsum(
+                table[..., iy : table.shape[-2] - iy, ix : table.shape[-1] - ix],
+                boxsize,
+                cumsum=False,
+            )
+        else:
+            result = boxsum(table, boxsize, cumsum=False)
+        results.append(result)
+    return results
+
+
+def chordsum(data: ndarray, kernel: ndarray, blocked: bool = False) -> ndarray:
+    """Fast vectorised approach to calculating neighbourhood totals over an
+    unweighted kernel, such as a circle.
+
+    Each row of the kernel is split into runs of ones, or chords. The total
+    along every chord is found from a cumulative sum along the x axis, so
+    that the cost scales with the number of chords rather than with the
+    number of points in the kernel. For a circle of radius r this is O(r)
+    rather than O(r^2) operations per point.
+
+    The neighbourhood totals are calculated over the last two dimensions of
+    the data, with the edges extended by their nearest values. The result
+    is equivalent to ``scipy.ndimage.correlate(data, kernel, mode="nearest")``
+    for a 2D array, up to floating point rounding.
+
+    Args:
+        data:
+            The input data array.
+        kernel:
+            2D array of zeros and ones defining the neighbourhood, with its
+            centre at the middle point of each axis.
+        blocked:
+            If True, accumulate the cumulative sums along x and the totals
+            over the chords in float64 for one block of columns at a time,
+            and round each total to the type of the data once, so that the
+            errors do not grow with the size of the array or kernel, as for
+            `blocked_boxsum`.
+
+    Returns:
+        Array containing the calculated neighbourhood total, with the same
+        shape and type as the input data.
+
+    Raises:
+        ValueError: If the kernel contains values other than zero and one.
+    """
+    if not np.isin(kernel, (0, 1)).all():
+        raise ValueError("The kernel must only contain zeros and ones.")
+    ky, kx = kernel.shape
+    ny, nx = data.shape[-2:]
+    padded = np.pad(
+        data,
+        [(0, 0)] * (data.ndim - 2) + [(ky // 2, ky // 2), (kx // 2, kx // 2)],
+        mode="edge",
+    )
+    chords = []
+    for i, row in enumerate(kernel):
+        edges = np.diff(np.concatenate([[0], row, [0]]))
+        for start, stop in zip(np.flatnonzero(edges > 0), np.flatnonzero(edges < 0)):
+            chords.append((i, start, stop))
+
+    def sum_chords(cumulative, out):
+        # The total from column a up to but not including column b is
+        # cumulative[b] - cumulative[a]
+        length = out.shape[-1]
+        for i, start, stop in chords:
+            out += cumulative[..., i : i + ny, stop : stop + length]
+            out -= cumulative[..., i : i + ny, start : start + length]
+        return out
+
+    if not blocked:
+        cumulative = np.zeros(padded.shape[:-1] + (padded.shape[-1] + 1,), data.dtype)
+        np.cumsum(padded, axis=-1, out=cumulative[..., 1:])
+        return sum_chords(cumulative, np.zeros(data.shape, dtype=data.dtype))
+
+    result = np.empty(data.shape, dtype=data.dtype)
+    for block, cumulative in blocked_cumsums(padded, -1, kx - 1):
+        total = np.zeros(data.shape[:-1] + (block.stop - block.start,), np.float64)
+        result[..., block] = sum_chords(cumulative, total)
+    return result
+
+
+def sparse_clusters(
+    events: ndarray, radius: int
+) -> Optional[Tuple[ndarray, List[Tuple[slice, slice]]]]:
+    """Find clusters of events in a sparse 2D field, such as the points
+    exceeding a rare-event threshold, so that a neighbourhood operation can
+    be applied only around each cluster rather than over the whole field.
+
+    Each event is extended by the radius in both directions, and the
+    connected regions of the extended events form the clusters. The
+    neighbourhood of any point only contains events from the cluster whose
+    region contains that point, and points outside every region have no
+    events within their neighbourhood. A neighbourhood operation over a
+    cluster's bounding box, with the events of other clusters removed, then
+    gives the result for every point in that cluster's region.
+
+    Args:
+        events:
+            2D array that is non-zero at events.
+        radius:
+            Radius of the neighbourhood in grid cells, as the half-width of
+            a square that contains it.
+
+    Returns:
+        None if more than SPARSE_MAX_FRACTION of the points are events, or
+        if the bounding boxes of the clusters cover more than half of the
+        field. Otherwise:
+
+        - Array labelling the region of each cluster with the number of
+          the cluster, counted from 1, and other points with 0.
+        - The y and x slices of the bounding box of each cluster's region,
+          in order of the cluster numbers.
+    """
+    if np.count_nonzero(events) > SPARSE_MAX_FRACTION * events.size:
+        return None
+    regions = maximum_filter(
+        (events != 0).astype(np.uint8), size=2 * radius + 1, mode="constant"
+    )
+    labels, _ = label(regions)
+    boxes = find_objects(labels)
+    covered = sum(
+        (box_y.stop - box_y.start) * (box_x.stop - box_x.start)
+        for box_y, box_x in boxes
+    )
+    if covered > events.size / 2:
+        return None
+    return labels, boxes
@@ -5,6 +5,7 @@
 """Utilities for spatial padding of iris cubes."""
 
 from copy import deepcopy
+from typing import Iterator, Tuple
 
 import iris
 import numpy as np
@@ -298,3 +299,52 @@ def remove_halo_from_cube(cube: Cube, width_x: float, width_y: float) -> Cube:
         cube, trimmed_data, trimmed_x_coord, trimmed_y_coord
     )
     return trimmed_cube
+
+
+def tiles_with_halo(
+    shape: Tuple[int, int], tile_size: int, width_x: int, width_y: int
+) -> Iterator[Tuple[Tuple[slice, slice], Tuple[slice, slice], Tuple[slice, slice]]]:
+    """
+    Split a y-x grid into square tiles, each extended by a halo of
+    neighbouring rows and columns, so that the tiles can be processed
+    independently with an operation that reaches no further than the halo
+    width from each point. The halo is cut short at the edges of the grid,
+    where the operation should pad the tile as it would the whole grid.
+    Removing the halo from each processed tile, as remove_halo_from_cube
+    does for cubes, and stitching the tiles together then gives the result
+    for the whole grid.
+
+    Args:
+        shape:
+            The lengths of the y and x dimensions of the grid.
+        tile_size:
+            The length of each side of a tile in grid cells, excluding the
+            halo. Tiles at the ends of each row and column may be smaller.
+        width_x:
+            The width of the halo in the x direction in grid cells.
+        width_y:
+            The width of the halo in the y direction in grid cells.
+
+    Yields:
+        - The y and x slices of the grid covered by a tile.
+        - The y and x slices of the grid covered by the tile and its halo.
+        - The y and x slices of the tile within the tile with its halo.
+    """
+    spans = []
+    for length, width in zip(shape, (width_y, width_x)):
+        axis_spans = []
+        for start in range(0, length, tile_size):
+            stop = min(start + tile_size, length)
+            halo_start = max(start - width, 0)
+            halo_stop = min(stop + width, length)
+            axis_spans.append(
+                (
+                    slice(start, stop),
+                    slice(halo_start, halo_stop),
+                    slice(start - halo_start, stop - halo_start),
+                )
+            )
+        spans.append(axis_spans)
+    for tile_y, halo_y, core_y in spans[0]:
+        for tile_x, halo_x, core_x in spans[1]:
+            yield (tile_y, tile_x), (halo_y, halo_x), (core_y, core_x)
@@ -0,0 +1,217 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Provides utilities for running independent calculations in parallel."""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+
+def thread_map(
+    function: Callable,
+    items: Iterable,
+    n_workers: int = 1,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Any]:
+    """Apply a function to each item using a pool of threads, returning the
+    results in the order of the items.
+
+    This is suited to functions that spend most of their time in NumPy or
+    SciPy routines that release the GIL, such as processing each x-y slice
+    of a cube. Items are only taken from the iterable as workers become
+    free, so at most max_in_flight items and results are held at once
+    before the results are consumed.
+
+    Args:
+        function:
+            Function to call with each item.
+        items:
+            Items to process, which may be a generator.
+        n_workers:
+            Number of threads. If 1, the items are processed in turn in the
+            calling thread.
+        max_in_flight:
+            Maximum number of items submitted but not yet returned. Defaults
+            to twice the number of workers.
+
+    Returns:
+        Iterator over the results of the function for each item.
+    """
+    if n_workers <= 1:
+        return map(function, items)
+    return _thread_map(function, items, n_workers, max_in_flight or 2 * n_workers)
+
+
+def _thread_map(
+    function: Callable, items: Iterable, n_workers: int, max_in_flight: int
+) -> Iterator[Any]:
+    """Generator for thread_map using a pool of n_workers threads."""
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = deque()
+        for item in items:
+            if len(futures) >= max_in_flight:
+                yield futures.popleft().result()
+            futures.append(executor.submit(function, item))
+        while futures:
+            yield futures.popleft().result()
+
+
+def process_map(
+    function: Callable,
+    items: Iterable,
+    n_workers: int = 1,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+) -> Iterator[Any]:
+    """Apply a function to each item using a pool of processes, returning
+    the results in the order of the items.
+
+    This is suited to functions that spend most of their time in Python
+    code, which cannot run in parallel in threads. The function, items and
+    results must be picklable, and the function must be importable from a
+    module. Large inputs shared by every item should be placed in
+    :class:`SharedArrays` and attached by the initializer, rather than
+    being passed with each item.
+
+    Args:
+        function:
+            Function to call with each item.
+        items:
+            Items to process.
+        n_workers:
+            Number of processes. If 1, the items are processed in turn in
+            the calling process, after calling the initializer.
+        initializer:
+            Function called once in each process before any items are
+            processed.
+        initargs:
+            Arguments for the initializer.
+
+    Returns:
+        Iterator over the results of the function for each item.
+    """
+    if n_workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return map(function, items)
+    return _process_map(function, items, n_workers, initializer, initargs)
+
+
+def _process_map(
+    function: Callable,
+    items: Iterable,
+    n_workers: int,
+    initializer: Optional[Callable],
+    initargs: Tuple,
+) -> Iterator[Any]:
+    """Generator for process_map using a pool of n_workers processes."""
+    # spawn workers rather than forking so that they do not inherit locks
+    # held by other threads (e.g. netCDF/HDF5) at the time of the fork
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        yield from executor.map(function, items)
+
+
+def shared_memory_available() -> bool:
+    """Return whether :class:`SharedArrays` can be used, as
+    multiprocessing.shared_memory requires Python 3.8 or later.
+    """
+    return find_spec("multiprocessing.shared_memory") is not None
+
+
+class SharedArrays:
+    """Copies of named arrays in shared memory blocks, which worker processes
+    can read without the arrays being pickled and sent to each process.
+
+    The blocks are released when the context manager exits, so workers must
+    have finished with the arrays by then. Pass :attr:`handles` to the
+    workers, which call :func:`attach_shared_arrays` to get the arrays.
+    Masked arrays are stored as their data and mask. This requires Python
+    3.8 or later, which can be checked with :func:`shared_memory_available`.
+    """
+
+    def __init__(self, arrays: Dict[str, ndarray]) -> None:
+        """
+        Args:
+            arrays:
+                Arrays to copy into shared memory, by name.
+        """
+        self._blocks = []
+        self.handles = {}
+        try:
+            for name, array in arrays.items():
+                mask = None
+                if np.ma.isMaskedArray(array):
+                    mask = self._share(np.ma.getmaskarray(array))
+                self.handles[name] = (self._share(np.ma.getdata(array)), mask)
+        except BaseException:
+            self.close()
+            raise
+
+    def _share(self, array: ndarray) -> Tuple[str, Tuple[int, ...], str]:
+        """Copy an array into a new shared memory block, returning the name
+        of the block and the shape and dtype of the array."""
+        from multiprocessing import shared_memory
+
+        array = np.asarray(array)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return block.name, array.shape, array.dtype.str
+
+    def close(self) -> None:
+        """Release the shared memory blocks."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def attach_shared_arrays(
+    handles: Dict[str, Tuple],
+) -> Tuple[List[Any], Dict[str, ndarray]]:
+    """Attach to arrays placed in shared memory by :class:`SharedArrays`.
+
+    Args:
+        handles:
+            The handles of the shared arrays.
+
+    Returns:
+        - The attached shared memory blocks, which must be kept for as long
+          as the arrays are used.
+        - The arrays, by name, which should not be modified.
+    """
+    from multiprocessing import shared_memory
+
+    blocks = []
+    arrays = {}
+
+    def attach(handle):
+        name, shape, dtype = handle
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    for name, (data, mask) in handles.items():
+        arrays[name] = attach(data)
+        if mask is not None:
+            arrays[name] = np.ma.MaskedArray(arrays[name], mask=attach(mask))
+    return blocks, arrays
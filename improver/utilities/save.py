@@ -6,10 +6,11 @@
 
 import os
 import warnings
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 import cf_units
 import iris
+import numpy as np
 from iris.cube import Cube, CubeList
 
 from improver.metadata.check_datatypes import check_mandatory_standards
@@ -52,11 +53,82 @@ def _check_metadata(cube: Cube) -> None:
         raise ValueError("{} has unknown units".format(cube.name()))
 
 
+def _chunksizes(
+    shape: Tuple[int, ...], itemsize: int, chunking: str, target_bytes: int
+) -> Tuple[int, ...]:
+    """
+    Choose the chunk shape of a netCDF variable according to how the data
+    are expected to be read.
+
+    Args:
+        shape:
+            Shape of the data, with the y and x dimensions last.
+        itemsize:
+            Size in bytes of each data value.
+        chunking:
+            "field" for chunks of single x-y slices, suited to reading maps;
+            "series" for chunks spanning all leading dimensions over x-y
+            tiles, suited to reading all thresholds and times at points;
+            "balanced" for chunks of around target_bytes, found by halving
+            the longest dimension of the chunk.
+        target_bytes:
+            Maximum size in bytes of "series" and "balanced" chunks, unless
+            a "series" chunk over a single x-y point is larger.
+
+    Returns:
+        Chunk sizes for each dimension.
+
+    Raises:
+        ValueError: if the chunking is not recognised.
+    """
+    if chunking == "field":
+        return tuple([1] * (len(shape) - 2) + list(shape[-2:]))
+    if chunking == "series":
+        # only the x-y dimensions are reduced in size
+        n_fixed = len(shape) - 2
+    elif chunking == "balanced":
+        n_fixed = 0
+    else:
+        raise ValueError(
+            f"Chunking must be one of 'field', 'series' or 'balanced', not {chunking}"
+        )
+    chunks = list(shape)
+    while np.prod(chunks) * itemsize > target_bytes and max(chunks[n_fixed:]) > 1:
+        dim = n_fixed + int(np.argmax(chunks[n_fixed:]))
+        chunks[dim] = -(-chunks[dim] // 2)
+    return tuple(chunks)
+
+
+def _rechunk_lazy_data(cube: Cube, chunksizes: Tuple[int, ...]) -> Cube:
+    """
+    Rechunks lazy data on a cube to match the chunking of the netCDF
+    variable it is saved to. Iris streams lazy data to file one dask chunk
+    at a time, so aligned chunks allow each chunk to be computed, written
+    and compressed in turn without realising the whole array, while dask
+    computes further chunks on its worker threads.
+
+    Args:
+        cube:
+            The cube to be saved.
+        chunksizes:
+            Chunk sizes of the netCDF variable.
+
+    Returns:
+        A copy of the cube with rechunked lazy data, or the input cube if
+        its data is not lazy.
+    """
+    if cube.has_lazy_data():
+        return cube.copy(data=cube.lazy_data().rechunk(chunksizes))
+    return cube
+
+
 def save_netcdf(
     cubelist: Union[Cube, CubeList],
     filename: str,
     compression_level: int = 1,
     least_significant_digit: Optional[int] = None,
+    chunking: str = "field",
+    chunk_target_bytes: int = 2**20,
 ) -> None:
     """Save the input Cube or CubeList as a NetCDF file and check metadata
     where required for integrity.
@@ -65,6 +137,9 @@ def save_netcdf(
     local_keys to record non-global attributes as data attributes rather than
     global attributes.
 
+    Lazy data is streamed to file one chunk at a time rather than being
+    realised in full before saving.
+
     Args:
         cubelist:
             Cube or list of cubes to be saved
@@ -80,6 +155,15 @@ def save_netcdf(
             http://www.esrl.noaa.gov/psd/data/gridded/conventions/cdc_netcdf_standard.shtml
             for details. When used with `compression level`, this will result in lossy
             compression.
+        chunking:
+            How to chunk the data in the file. "field" (default) chunks
+            single x-y slices, which is fastest for reading maps. "series"
+            chunks all leading dimensions (e.g. thresholds and times) over
+            x-y tiles of up to chunk_target_bytes, which is fastest for
+            reading values at points. "balanced" chunks blocks of up to
+            chunk_target_bytes, for a mixture of the two.
+        chunk_target_bytes:
+            Maximum chunk size in bytes for "series" and "balanced" chunking.
 
     Raises:
         warning if cubelist contains cubes of varying dimensions.
@@ -99,13 +183,20 @@ def save_netcdf(
         cube.attributes.pop("least_significant_digit", None)
 
     # If all xy slices are the same shape, use this to determine
-    # the chunksize for the netCDF (eg. 1, 1, 970, 1042)
+    # the chunksize for the netCDF (eg. 1, 1, 970, 1042 for field chunking)
     chunksizes = None
     if len({cube.shape[:2] for cube in cubelist}) == 1:
         cube = cubelist[0]
         if cube.ndim >= 2:
-            xy_chunksizes = [cube.shape[-2], cube.shape[-1]]
-            chunksizes = tuple([1] * (cube.ndim - 2) + xy_chunksizes)
+            chunksizes = _chunksizes(
+                cube.shape, cube.dtype.itemsize, chunking, chunk_target_bytes
+            )
+            cubelist = iris.cube.CubeList(
+                _rechunk_lazy_data(item, chunksizes)
+                if item.shape == cube.shape
+                else item
+                for item in cubelist
+            )
     else:
         msg = "Chunksize not set as cubelist contains cubes of varying dimensions"
         warnings.warn(msg)
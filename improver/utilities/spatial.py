@@ -31,6 +31,9 @@ from improver.metadata.utilities import (
 )
 from improver.utilities.cube_checker import check_cube_coordinates, spatial_coords_match
 from improver.utilities.cube_manipulation import enforce_coordinate_ordering
+from improver.utilities.memo import SliceMemo
+from improver.utilities.neighbourhood_tools import sparse_clusters
+from improver.utilities.parallel import thread_map
 
 
 def check_if_grid_is_equal_area(
@@ -716,6 +719,42 @@ class GradientBetweenAdjacentGridSquares(PostProcessingPlugin):
         return tuple(gradients)
 
 
+def _maximum_filter(data: ndarray, size: int, valid: ndarray) -> ndarray:
+    """
+    Find the maximum value within a square about each point, as
+    scipy.ndimage.maximum_filter does, for the valid points of a 2D array.
+
+    Fields such as rare-event thresholds are mostly at their smallest valid
+    value. If they are sparse enough, the maxima are only calculated around
+    each cluster of points above that value, and are that value elsewhere.
+
+    Args:
+        data:
+            2D array of values, where invalid points are smaller than all
+            valid points.
+        size:
+            Length of each side of the square, in grid points.
+        valid:
+            Boolean array that is true at valid points.
+
+    Returns:
+        Array of maxima. Values at invalid points are undefined.
+    """
+    if not valid.any():
+        return maximum_filter(data, size=size)
+    background = data[valid].min()
+    clusters = sparse_clusters(valid & (data > background), size // 2)
+    if clusters is None:
+        return maximum_filter(data, size=size)
+    labels, boxes = clusters
+    result = np.full_like(data, background)
+    for number, box in enumerate(boxes, start=1):
+        in_cluster = labels[box] == number
+        maxima = maximum_filter(np.where(in_cluster, data[box], background), size=size)
+        result[box][in_cluster] = maxima[in_cluster]
+    return result
+
+
 def maximum_within_vicinity(
     grid: Union[MaskedArray, ndarray],
     grid_point_radius: int,
@@ -728,7 +767,8 @@ def maximum_within_vicinity(
     For non-binary fields, if the vicinity of two occurrences overlap,
     the maximum value within the vicinity is chosen.
     If a land-mask has been supplied, process land and sea points
-    separately.
+    separately. Sparse fields, such as rare-event thresholds, are only
+    processed around each cluster of occurrences.
 
     Args:
         grid:
@@ -765,12 +805,16 @@ def maximum_within_vicinity(
         for match in (True, False):
             matched_data = unmasked_grid.copy()
             matched_data[landmask != match] = -fill_value
-            matched_max_data = maximum_filter(matched_data, size=grid_points)
+            matched_max_data = _maximum_filter(
+                matched_data, grid_points, matched_data > -fill_value
+            )
             max_data = np.where(landmask == match, matched_max_data, max_data)
     else:
         # The following command finds the maximum value for each grid point
         # from within a square of length "size"
-        max_data = maximum_filter(unmasked_grid, size=grid_points)
+        max_data = _maximum_filter(
+            unmasked_grid, grid_points, unmasked_grid > -fill_value
+        )
     if np.ma.is_masked(grid):
         # Update only the unmasked values
         processed_grid.data[~grid.mask] = max_data[~grid.mask]
@@ -850,6 +894,7 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
         radii: Optional[List[Union[float, int]]] = None,
         grid_point_radii: Optional[List[Union[float, int]]] = None,
         land_mask_cube: Cube = None,
+        n_workers: int = 1,
     ) -> None:
         """
         Args:
@@ -864,6 +909,8 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
                 Binary land-sea mask data. True for land-points, False for sea.
                 Restricts in-vicinity processing to only include points of a
                 like mask value.
+            n_workers:
+                Number of threads used to process the x-y slices of the cube.
 
         Raises:
             ValueError: If both radii and grid point radii are set.
@@ -904,11 +951,13 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
         else:
             self.land_mask = None
         self.land_mask_cube = land_mask_cube
+        self.n_workers = n_workers
 
     def process(self, cube: Cube) -> Cube:
         """
         Produces the vicinity processed data. The input data is sliced to
-        yield y-x slices to which the maximum_within_vicinity method is applied.
+        yield y-x slices to which the maximum_within_vicinity method is applied,
+        once for each distinct slice.
         The different vicinity radii (if multiple) are looped over and a
         coordinate recording the radius used is added to each resulting cube.
         A single cube is returned with the leading coordinates of the input cube
@@ -951,14 +1000,23 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
         ]
 
         for radius, grid_point_radius in zip(self.radii, grid_point_radii):
-            max_cubes = CubeList([])
-            for cube_slice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-                result = cube_slice.copy(
-                    data=maximum_within_vicinity(
-                        cube_slice.data, grid_point_radius, self.land_mask
-                    )
+            # Identical slices, such as all-zero thresholds, give identical
+            # results, so each distinct slice is only processed once.
+            memo = SliceMemo("vicinity_slices")
+            max_cubes = CubeList(
+                thread_map(
+                    lambda cube_slice: cube_slice.copy(
+                        data=memo(
+                            lambda data: maximum_within_vicinity(
+                                data, grid_point_radius, self.land_mask
+                            ),
+                            cube_slice.data,
+                        )
+                    ),
+                    cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]),
+                    n_workers=self.n_workers,
                 )
-                max_cubes.append(result)
+            )
             result_cube = max_cubes.merge_cube()
 
             # Put dimensions back if they were there before.
@@ -0,0 +1,53 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+Tests for the batch CLI
+"""
+
+import pytest
+
+from . import acceptance as acc
+
+pytestmark = [pytest.mark.acc, acc.skip_if_kgo_missing]
+CLI = acc.cli_name_with_dashes(__file__)
+run_cli = acc.run_cli(CLI)
+
+
+@pytest.mark.parametrize("n_workers", ("1", "2"))
+def test_threshold_jobs(tmp_path, n_workers):
+    """Test running thresholding jobs from a job file. The job file is passed
+    as a string as it is not a KGO file with a checksum."""
+    cli_dir = acc.kgo_root() / "threshold"
+    input_path = cli_dir / "basic" / "input.nc"
+    kgo_subdirs = ["basic", "multiple_thresholds"]
+    threshold_values = ["280", "270,280,290"]
+    job_path = tmp_path / "jobs.txt"
+    with open(job_path, "w") as job_file:
+        for kgo_subdir, values in zip(kgo_subdirs, threshold_values):
+            output_path = tmp_path / f"{kgo_subdir}.nc"
+            job_file.write(
+                f"threshold {input_path} --threshold-values {values} "
+                f"--output {output_path}\n"
+            )
+    run_cli([str(job_path), "--n-workers", n_workers])
+    for kgo_subdir in kgo_subdirs:
+        kgo_path = cli_dir / kgo_subdir / "kgo.nc"
+        acc.compare(tmp_path / f"{kgo_subdir}.nc", kgo_path)
+
+
+def test_failed_job(tmp_path):
+    """Test a failing job is reported without stopping later jobs"""
+    cli_dir = acc.kgo_root() / "threshold"
+    input_path = cli_dir / "basic" / "input.nc"
+    kgo_path = cli_dir / "basic" / "kgo.nc"
+    output_path = tmp_path / "output.nc"
+    job_path = tmp_path / "jobs.txt"
+    job_path.write_text(
+        f"threshold {tmp_path / 'missing.nc'} --threshold-values 280\n"
+        f"threshold {input_path} --threshold-values 280 --output {output_path}\n"
+    )
+    with pytest.raises(RuntimeError, match="1 of 2 commands failed"):
+        run_cli([str(job_path)])
+    acc.compare(output_path, kgo_path)
@@ -9,12 +9,14 @@ class.
 """
 
 import unittest
+from unittest.mock import patch
 
 import iris
 import numpy as np
 import pytest
 from iris.cube import CubeList
 from iris.tests import IrisTest
+from scipy.optimize import approx_fprime
 
 from improver.calibration.ensemble_calibration import (
     ContinuousRankedProbabilityScoreMinimisers as Plugin,
@@ -178,6 +180,40 @@ class Test_calculate_normal_crps(SetupNormalInputs):
         self.assertIsInstance(result, np.float64)
         self.assertAlmostEqual(result, self.mean_plugin.BAD_VALUE, self.precision)
 
+    def test_gradient_mean_predictor(self):
+        """Test that the analytic gradient of the CRPS matches a finite
+        difference approximation. The ensemble mean is the predictor."""
+        coefficients = np.array([0.1, 0.95, 0.2, 0.6], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+        )
+        crps_function = self.mean_plugin.calculate_normal_crps
+        gradient_function = self.mean_plugin.calculate_normal_crps_gradient
+        result = gradient_function(coefficients, *args)
+        expected = approx_fprime(coefficients, crps_function, 1e-7, *args)
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_allclose(result, expected, rtol=1e-3, atol=1e-5)
+
+    def test_gradient_realizations_predictor(self):
+        """Test that the analytic gradient of the CRPS matches a finite
+        difference approximation. The ensemble realizations are the
+        predictor."""
+        coefficients = np.array([0.1, 0.5, 0.6, 0.55, 0.2, 0.6], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data_realizations,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+        )
+        crps_function = self.realizations_plugin.calculate_normal_crps
+        gradient_function = self.realizations_plugin.calculate_normal_crps_gradient
+        result = gradient_function(coefficients, *args)
+        expected = approx_fprime(coefficients, crps_function, 1e-7, *args)
+        np.testing.assert_allclose(result, expected, rtol=1e-3, atol=1e-5)
+
 
 class Test_process_normal_distribution(
     SetupNormalInputs, EnsembleCalibrationAssertions
@@ -321,6 +357,48 @@ class Test_process_normal_distribution(
             result, self.expected_realizations_coefficients
         )
 
+    def test_gradient_methods_match_nelder_mead(self):
+        """Test that minimising with the analytic gradient of the CRPS gives
+        a CRPS no greater than Nelder-Mead, with matching location and scale
+        parameters. Nelder-Mead is run to a tight tolerance, as it otherwise
+        stops well short of the minimum for these inputs. The ensemble mean
+        is the predictor."""
+        nelder_mead = Plugin("mean", tolerance=1e-8, max_iterations=5000)
+        expected = nelder_mead.process(
+            self.initial_guess_for_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "norm",
+        ).astype(np.float64)
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+        )
+        expected_mu, expected_sigma, *_ = self.mean_plugin._normal_crps_preparation(
+            expected, *args
+        )
+        crps_function = self.mean_plugin.calculate_normal_crps
+        expected_crps = crps_function(expected, *args, self.sqrt_pi)
+        for method in ["BFGS", "L-BFGS-B", "batched"]:
+            with self.subTest(method=method):
+                plugin = Plugin(
+                    "mean", tolerance=self.tolerance, minimisation_method=method
+                )
+                result = plugin.process(
+                    self.initial_guess_for_mean,
+                    self.forecast_predictor_mean,
+                    self.truth,
+                    self.forecast_variance,
+                    "norm",
+                ).astype(np.float64)
+                mu, sigma, *_ = plugin._normal_crps_preparation(result, *args)
+                crps = crps_function(result, *args, self.sqrt_pi)
+                self.assertLessEqual(crps, expected_crps + self.tolerance)
+                np.testing.assert_allclose(mu, expected_mu, atol=0.01)
+                np.testing.assert_allclose(sigma, expected_sigma, atol=0.01)
+
     def test_mean_predictor_keyerror(self):
         """
         Test that the minimisation has resulted in a KeyError, if the
@@ -363,6 +441,20 @@ class Test_process_normal_distribution(
         )
         self.assertEMOSCoefficientsAlmostEqual(result, self.expected_mean_coefficients)
 
+    def test_iterations(self):
+        """Test that the number of iterations taken by the minimisation is
+        recorded, and is limited by max_iterations."""
+        plugin = Plugin("mean", tolerance=self.tolerance, max_iterations=5)
+        with pytest.warns(UserWarning, match="did not result in convergence"):
+            plugin(
+                self.initial_guess_for_mean,
+                self.forecast_predictor_mean,
+                self.truth,
+                self.forecast_variance,
+                "norm",
+            )
+        self.assertEqual(plugin.iterations, 5)
+
     def test_realizations_predictor_max_iterations(self):
         """
         Test that the plugin returns a list of coefficients
@@ -457,6 +549,78 @@ class Test_process_normal_distribution(
             result, self.expected_realizations_coefficients_point_by_point, decimal=2
         )
 
+    def test_point_by_point_n_workers(self):
+        """Test that minimising the points in several processes gives the
+        same coefficients, in the same order, as minimising them in turn."""
+        predictor = "mean"
+        distribution = "norm"
+        inputs = (
+            self.initial_guess_spot_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+        )
+        plugin = Plugin(predictor, tolerance=self.tolerance, point_by_point=True)
+        expected = plugin.process(*inputs, distribution)
+        expected_iterations = plugin.iterations
+        plugin = Plugin(
+            predictor, tolerance=self.tolerance, point_by_point=True, n_workers=2
+        )
+        result = plugin.process(*inputs, distribution)
+        np.testing.assert_array_equal(result, expected)
+        self.assertEqual(plugin.iterations, expected_iterations)
+
+        # Without shared memory, the points are minimised in turn.
+        with patch(
+            "improver.calibration.ensemble_calibration.shared_memory_available",
+            return_value=False,
+        ), patch.object(Plugin, "_minimise_points_in_processes") as in_processes:
+            result = plugin.process(*inputs, distribution)
+        in_processes.assert_not_called()
+        np.testing.assert_array_equal(result, expected)
+
+    def test_point_by_point_catch_warnings(self):
+        """Test that a single warning reports the number of points for which
+        the minimisation did not converge."""
+        predictor = "mean"
+        distribution = "norm"
+        warning_msg = (
+            "Minimisation did not result in convergence after 10 iterations "
+            r"for \d of 9 points"
+        )
+
+        plugin = Plugin(
+            predictor, tolerance=self.tolerance, max_iterations=10, point_by_point=True
+        )
+        with pytest.warns(UserWarning, match=warning_msg) as warning_list:
+            plugin.process(
+                self.initial_guess_spot_mean,
+                self.forecast_predictor_mean,
+                self.truth,
+                self.forecast_variance,
+                distribution,
+            )
+        assert len(warning_list) == 1
+
+    def test_invalid_n_workers(self):
+        """Test that an error is raised if n_workers is less than 1."""
+        with pytest.raises(ValueError, match="n_workers must be at least 1"):
+            Plugin("mean", point_by_point=True, n_workers=0)
+
+    def test_batched_with_n_workers(self):
+        """Test that an error is raised if the batched minimisation method is
+        requested with more than one worker."""
+        with pytest.raises(ValueError, match="cannot be used with n_workers=2"):
+            Plugin(
+                "mean", point_by_point=True, n_workers=2, minimisation_method="batched"
+            )
+
+    def test_invalid_minimisation_method(self):
+        """Test that an error is raised if the minimisation method is not
+        supported."""
+        with pytest.raises(ValueError, match="Minimisation method Powell"):
+            Plugin("mean", minimisation_method="Powell")
+
     def test_catch_warnings(self):
         """
         Test that a warning is generated if the minimisation
@@ -533,6 +697,74 @@ class Test_process_normal_distribution(
             result, self.expected_mean_coefficients_point_by_point
         )
 
+    def _crps_for_each_point(self, plugin, coefficients):
+        """Calculate the CRPS at each grid point for coefficients of shape
+        (coefficients, y, x)."""
+        forecast_predictor = self.forecast_predictor_mean[0].data
+        return np.array(
+            [
+                plugin.calculate_normal_crps(
+                    coefficients[:, j, i].astype(np.float64),
+                    forecast_predictor[:, j, i],
+                    self.truth.data[:, j, i],
+                    self.forecast_variance.data[:, j, i],
+                    self.sqrt_pi,
+                )
+                for j, i in np.ndindex(coefficients.shape[1:])
+            ]
+        )
+
+    def test_batched_point_by_point(self):
+        """Test that minimising every grid point at once gives a CRPS at each
+        point no greater than minimising each point with Nelder-Mead."""
+        inputs = (
+            self.initial_guess_spot_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "norm",
+        )
+        plugin = Plugin("mean", tolerance=self.tolerance, point_by_point=True)
+        expected = plugin.process(*inputs)
+        batched_plugin = Plugin(
+            "mean",
+            tolerance=self.tolerance,
+            point_by_point=True,
+            minimisation_method="batched",
+        )
+        result = batched_plugin.process(*inputs)
+        self.assertEqual(result.shape, expected.shape)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(
+            np.all(
+                self._crps_for_each_point(plugin, result)
+                <= self._crps_for_each_point(plugin, expected) + self.tolerance
+            )
+        )
+
+    def test_batched_point_by_point_with_nans(self):
+        """Test that the initial guess is returned by the batched minimisation
+        for a grid point where the truth is always NaN, and that a NaN truth
+        at a single time is ignored at another point."""
+        self.truth.data[:, 0, 0] = np.nan
+        self.truth.data[0, 1, 1] = np.nan
+        plugin = Plugin(
+            "mean",
+            tolerance=self.tolerance,
+            point_by_point=True,
+            minimisation_method="batched",
+        )
+        result = plugin.process(
+            self.initial_guess_spot_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "norm",
+        )
+        np.testing.assert_array_equal(result[:, 0, 0], self.initial_guess_for_mean)
+        self.assertTrue(np.all(np.isfinite(result)))
+        self.assertFalse(np.array_equal(result[:, 1, 1], self.initial_guess_for_mean))
+
     def test_mean_predictor_sites_additional_predictor(self):
         """
         Test that the plugin returns a numpy array with the expected
@@ -700,6 +932,41 @@ class Test_calculate_truncated_normal_crps(SetupTruncatedNormalInputs):
         self.assertIsInstance(result, np.float64)
         self.assertAlmostEqual(result, self.mean_plugin.BAD_VALUE, self.precision)
 
+    def test_gradient_mean_predictor(self):
+        """Test that the analytic gradient of the CRPS matches a finite
+        difference approximation. The ensemble mean is the predictor."""
+        coefficients = np.array([0.1, 0.95, 0.2, 0.6], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+        )
+        crps_function = self.mean_plugin.calculate_truncated_normal_crps
+        gradient_function = self.mean_plugin.calculate_truncated_normal_crps_gradient
+        result = gradient_function(coefficients, *args)
+        expected = approx_fprime(coefficients, crps_function, 1e-7, *args)
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_allclose(result, expected, rtol=1e-3, atol=1e-5)
+
+    def test_gradient_realizations_predictor(self):
+        """Test that the analytic gradient of the CRPS matches a finite
+        difference approximation. The ensemble realizations are the
+        predictor."""
+        coefficients = np.array([0.1, 0.5, 0.6, 0.55, 0.2, 0.6], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data_realizations,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+        )
+        plugin = self.realizations_plugin
+        crps_function = plugin.calculate_truncated_normal_crps
+        gradient_function = plugin.calculate_truncated_normal_crps_gradient
+        result = gradient_function(coefficients, *args)
+        expected = approx_fprime(coefficients, crps_function, 1e-7, *args)
+        np.testing.assert_allclose(result, expected, rtol=1e-3, atol=1e-5)
+
 
 class Test_process_truncated_normal_distribution(
     SetupTruncatedNormalInputs, EnsembleCalibrationAssertions
@@ -759,6 +1026,48 @@ class Test_process_truncated_normal_distribution(
             result, self.expected_realizations_coefficients
         )
 
+    def test_gradient_methods_match_nelder_mead(self):
+        """Test that minimising with the analytic gradient of the CRPS gives
+        a CRPS no greater than Nelder-Mead, with matching location and scale
+        parameters. Nelder-Mead is run to a tight tolerance, as it otherwise
+        stops well short of the minimum for these inputs. The ensemble mean
+        is the predictor."""
+        nelder_mead = Plugin("mean", tolerance=1e-8, max_iterations=5000)
+        expected = nelder_mead.process(
+            self.initial_guess_for_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "truncnorm",
+        ).astype(np.float64)
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+        )
+        expected_mu, expected_sigma, *_ = self.mean_plugin._normal_crps_preparation(
+            expected, *args
+        )
+        crps_function = self.mean_plugin.calculate_truncated_normal_crps
+        expected_crps = crps_function(expected, *args, self.sqrt_pi)
+        for method in ["BFGS", "L-BFGS-B", "batched"]:
+            with self.subTest(method=method):
+                plugin = Plugin(
+                    "mean", tolerance=self.tolerance, minimisation_method=method
+                )
+                result = plugin.process(
+                    self.initial_guess_for_mean,
+                    self.forecast_predictor_mean,
+                    self.truth,
+                    self.forecast_variance,
+                    "truncnorm",
+                ).astype(np.float64)
+                mu, sigma, *_ = plugin._normal_crps_preparation(result, *args)
+                crps = crps_function(result, *args, self.sqrt_pi)
+                self.assertLessEqual(crps, expected_crps + self.tolerance)
+                np.testing.assert_allclose(mu, expected_mu, atol=0.01)
+                np.testing.assert_allclose(sigma, expected_sigma, atol=0.01)
+
     def test_mean_predictor_keyerror(self):
         """
         Test that an exception is raised when the distribution requested is
@@ -198,6 +198,14 @@ class Test__init__(SetupCubes):
         plugin = Plugin(self.distribution)
         self.assertEqual(plugin.coeff_names, expected)
 
+    def test_minimiser_options(self):
+        """Test that the minimisation options are passed to the minimiser."""
+        plugin = Plugin(
+            self.distribution, minimisation_method="BFGS", gradient_tolerance=1e-3
+        )
+        self.assertEqual(plugin.minimiser.minimisation_method, "BFGS")
+        self.assertEqual(plugin.minimiser.gradient_tolerance, 1e-3)
+
     def test_invalid_distribution(self):
         """Test an error is raised for an invalid distribution"""
         distribution = "biscuits"
@@ -1419,6 +1427,139 @@ class Test_process(
         with self.assertRaisesRegex(ValueError, msg):
             plugin.process(self.historic_temperature_forecast_cube, None)
 
+    def test_previous_coefficients(self):
+        """Test that using previously estimated coefficients as the initial
+        guess gives the same coefficients in fewer iterations. BFGS is used,
+        as it converges to the minimum for these inputs."""
+        plugin = self.plugin(self.distribution, minimisation_method="BFGS")
+        previous = plugin.process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        cold_iterations = plugin.minimiser.iterations
+        result = plugin.process(
+            self.historic_temperature_forecast_cube,
+            self.temperature_truth_cube,
+            previous_coefficients=previous,
+        )
+        self.assertEMOSCoefficientsAlmostEqual(
+            np.array([cube.data for cube in result]),
+            np.array([cube.data for cube in previous]),
+        )
+        self.assertLess(plugin.minimiser.iterations, cold_iterations)
+
+    def test_previous_coefficients_point_by_point(self):
+        """Test that coefficients for each point can be used as the initial
+        guess, and that a single set of coefficients is used for every point
+        when point_by_point is True."""
+        plugin = self.plugin(
+            self.distribution, point_by_point=True, minimisation_method="BFGS"
+        )
+        previous = plugin.process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        cold_iterations = plugin.minimiser.iterations
+        result = plugin.process(
+            self.historic_temperature_forecast_cube,
+            self.temperature_truth_cube,
+            previous_coefficients=previous,
+        )
+        for cube, previous_cube in zip(result, previous):
+            self.assertEMOSCoefficientsAlmostEqual(cube.data, previous_cube.data)
+        self.assertLess(plugin.minimiser.iterations, cold_iterations)
+
+        global_previous = self.plugin(self.distribution).process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        result = plugin.process(
+            self.historic_temperature_forecast_cube,
+            self.temperature_truth_cube,
+            previous_coefficients=global_previous,
+        )
+        for cube in result:
+            self.assertEqual(
+                cube.shape[-2:], self.historic_temperature_forecast_cube.shape[-2:]
+            )
+
+    def test_previous_coefficients_point_by_point_not_requested(self):
+        """Test that an exception is raised if coefficients for each point
+        are provided when point_by_point is False."""
+        previous = self.plugin(self.distribution, point_by_point=True).process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        plugin = self.plugin(self.distribution)
+        msg = "Coefficients for each point can only be used"
+        with self.assertRaisesRegex(ValueError, msg):
+            plugin.process(
+                self.historic_temperature_forecast_cube,
+                self.temperature_truth_cube,
+                previous_coefficients=previous,
+            )
+
+    def test_previous_coefficients_mismatching_points(self):
+        """Test that an exception is raised if the previous coefficients for
+        each point are on different spatial points to the truths."""
+        plugin = self.plugin(self.distribution, point_by_point=True)
+        previous = plugin.process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        previous = iris.cube.CubeList(cube[..., 1:, :] for cube in previous)
+        msg = "The y coordinate of the previous coefficients"
+        with self.assertRaisesRegex(ValueError, msg):
+            plugin.process(
+                self.historic_temperature_forecast_cube,
+                self.temperature_truth_cube,
+                previous_coefficients=previous,
+            )
+
+    def test_previous_coefficients_different_diagnostic(self):
+        """Test that an exception is raised if the previous coefficients are
+        for a different diagnostic."""
+        plugin = self.plugin(self.distribution)
+        previous = plugin.process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        for cube in previous:
+            cube.attributes["diagnostic_standard_name"] = "wind_speed"
+        msg = "The previous coefficients are for wind_speed"
+        with self.assertRaisesRegex(ValueError, msg):
+            plugin.process(
+                self.historic_temperature_forecast_cube,
+                self.temperature_truth_cube,
+                previous_coefficients=previous,
+            )
+
+    def test_previous_coefficients_different_forecast_period(self):
+        """Test that an exception is raised if the previous coefficients are
+        for a different forecast period."""
+        plugin = self.plugin(self.distribution)
+        previous = plugin.process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        for cube in previous:
+            cube.coord("forecast_period").points = [3600]
+        msg = "The previous coefficients are for a forecast period of"
+        with self.assertRaisesRegex(ValueError, msg):
+            plugin.process(
+                self.historic_temperature_forecast_cube,
+                self.temperature_truth_cube,
+                previous_coefficients=previous,
+            )
+
+    def test_previous_coefficients_wrong_number(self):
+        """Test that an exception is raised if the number of previous
+        coefficients does not match the number being estimated."""
+        previous = self.plugin(self.distribution, predictor="realizations").process(
+            self.historic_temperature_forecast_cube, self.temperature_truth_cube
+        )
+        plugin = self.plugin(self.distribution)
+        msg = "The previous coefficients contain 6 coefficients, but 4"
+        with self.assertRaisesRegex(ValueError, msg):
+            plugin.process(
+                self.historic_temperature_forecast_cube,
+                self.temperature_truth_cube,
+                previous_coefficients=previous,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
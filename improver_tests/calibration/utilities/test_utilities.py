@@ -28,6 +28,7 @@ from improver.calibration.utilities import (
     create_unified_frt_coord,
     filter_non_matching_cubes,
     flatten_ignoring_masked_data,
+    flatten_spatial_dimensions,
     forecast_coords_match,
     get_frt_hours,
     merge_land_and_sea,
@@ -36,6 +37,7 @@ from improver.metadata.constants.time_types import TIME_COORDS
 from improver.synthetic_data.set_up_test_cubes import (
     add_coordinate,
     set_up_percentile_cube,
+    set_up_spot_variable_cube,
     set_up_variable_cube,
 )
 from improver.utilities.cube_manipulation import sort_coord_in_cube
@@ -228,6 +230,51 @@ class Test_flatten_ignoring_masked_data(IrisTest):
             )
 
 
+class Test_flatten_spatial_dimensions(unittest.TestCase):
+    """Test the flatten_spatial_dimensions utility."""
+
+    def setUp(self):
+        """Set up a gridded cube with realization, y and x dimensions."""
+        data = np.arange(2 * 3 * 4, dtype=np.float32).reshape(2, 3, 4)
+        self.cube = set_up_variable_cube(data, realizations=[0, 1])
+
+    def test_gridded(self):
+        """Test that y and x are flattened with x varying fastest."""
+        result = flatten_spatial_dimensions(self.cube)
+        assert_array_equal(result, self.cube.data.reshape(2, 12))
+
+    def test_transposed(self):
+        """Test that the result does not depend on the order of the
+        dimensions of the cube."""
+        cube = self.cube.copy()
+        cube.transpose([2, 0, 1])
+        result = flatten_spatial_dimensions(cube)
+        assert_array_equal(result, self.cube.data.reshape(2, 12))
+
+    def test_data_with_extra_leading_dimension(self):
+        """Test that data broadcast with an extra leading dimension is
+        flattened using the spatial dimensions of the cube."""
+        data = np.stack([self.cube.data, self.cube.data + 100])
+        result = flatten_spatial_dimensions(self.cube, data)
+        assert_array_equal(result, data.reshape(2, 2, 12))
+
+    def test_masked(self):
+        """Test that a mask is retained."""
+        self.cube.data = np.ma.masked_less(self.cube.data, 5)
+        result = flatten_spatial_dimensions(self.cube)
+        self.assertIsInstance(result, np.ma.MaskedArray)
+        expected = np.ma.getmaskarray(self.cube.data).reshape(2, 12)
+        assert_array_equal(np.ma.getmaskarray(result), expected)
+
+    def test_spot(self):
+        """Test that sites sharing a dimension for y and x are kept in order."""
+        data = np.arange(2 * 5, dtype=np.float32).reshape(2, 5)
+        cube = set_up_spot_variable_cube(data, realizations=[0, 1])
+        cube.transpose([1, 0])
+        result = flatten_spatial_dimensions(cube)
+        assert_array_equal(result, data)
+
+
 class Test_check_predictor(unittest.TestCase):
     """
     Test to check the predictor.
@@ -14,9 +14,14 @@ from iris.exceptions import ConstraintMismatchError
 
 import improver
 from improver.cli import (
+    LazySubcommand,
+    build_pipeline,
     clizefy,
     create_constrained_inputcubelist_converter,
+    create_subset_inputcube_converter,
     docutilize,
+    execute_command,
+    execute_pipeline,
     inputcube,
     inputcube_nolazy,
     inputcubelist,
@@ -106,9 +111,11 @@ class Test_inputcube(unittest.TestCase):
 
     @patch("improver.cli.maybe_coerce_with", return_value="return")
     def test_basic(self, m):
-        """Tests that input cube calls load_cube with the string"""
+        """Tests that input cube calls the cached load_cube with the string"""
         result = inputcube("foo")
-        m.assert_called_with(improver.utilities.load.load_cube, "foo")
+        m.assert_called_with(
+            improver.utilities.load.CUBE_CACHE.load_cube, "foo", fast_load=True
+        )
         self.assertEqual(result, "return")
 
 
@@ -127,7 +134,10 @@ class Test_inputcube_nolazy(unittest.TestCase):
         """
         result = inputcube_nolazy("foo")
         self.coerce_patch.assert_called_with(
-            improver.utilities.load.load_cube, "foo", no_lazy_load=True
+            improver.utilities.load.CUBE_CACHE.load_cube,
+            "foo",
+            no_lazy_load=True,
+            fast_load=True,
         )
         self.assertEqual(result, "return")
 
@@ -137,7 +147,10 @@ class Test_inputcube_nolazy(unittest.TestCase):
         self.assertTrue(cube.has_lazy_data())
         result = inputcube_nolazy(cube)
         self.coerce_patch.assert_called_with(
-            improver.utilities.load.load_cube, cube, no_lazy_load=True
+            improver.utilities.load.CUBE_CACHE.load_cube,
+            cube,
+            no_lazy_load=True,
+            fast_load=True,
         )
         self.assertFalse(cube.has_lazy_data())
         self.assertEqual(result, "return")
@@ -148,9 +161,30 @@ class Test_inputcubelist(unittest.TestCase):
 
     @patch("improver.cli.maybe_coerce_with", return_value="return")
     def test_basic(self, m):
-        """Tests that input cubelist calls load_cubelist with the string"""
+        """Tests that input cubelist calls the cached load_cubelist with the
+        string"""
         result = inputcubelist("foo")
-        m.assert_called_with(improver.utilities.load.load_cubelist, "foo")
+        m.assert_called_with(
+            improver.utilities.load.CUBE_CACHE.load_cubelist, "foo", fast_load=True
+        )
+        self.assertEqual(result, "return")
+
+
+class Test_create_subset_inputcube_converter(unittest.TestCase):
+    """Tests the create_subset_inputcube_converter function"""
+
+    @patch("improver.cli.maybe_coerce_with", return_value="return")
+    def test_basic(self, m):
+        """Tests that the converter calls the cached load_cube with the
+        subset"""
+        converter = create_subset_inputcube_converter(realization=slice(0, 2))
+        result = converter("foo")
+        m.assert_called_with(
+            improver.utilities.load.CUBE_CACHE.load_cube,
+            "foo",
+            subset={"realization": slice(0, 2)},
+            fast_load=True,
+        )
         self.assertEqual(result, "return")
 
 
@@ -192,7 +226,7 @@ class Test_with_output(unittest.TestCase):
         compression_level=1 and default least_significant_digit=None"""
         # pylint disable is needed as it can't see the wrappers output kwarg.
         result = wrapped_with_output.cli("argv[0]", "2", "--output=foo")
-        m.assert_called_with(4, "foo", 1, None)
+        m.assert_called_with(4, "foo", 1, None, chunking="field")
         self.assertEqual(result, None)
 
     @patch("improver.utilities.save.save_netcdf")
@@ -202,7 +236,7 @@ class Test_with_output(unittest.TestCase):
         result = wrapped_with_output.cli(
             "argv[0]", "2", "--output=foo", "--compression-level=9"
         )
-        m.assert_called_with(4, "foo", 9, None)
+        m.assert_called_with(4, "foo", 9, None, chunking="field")
         self.assertEqual(result, None)
 
     @patch("improver.utilities.save.save_netcdf")
@@ -212,7 +246,7 @@ class Test_with_output(unittest.TestCase):
         result = wrapped_with_output.cli(
             "argv[0]", "2", "--output=foo", "--compression-level=0"
         )
-        m.assert_called_with(4, "foo", 0, None)
+        m.assert_called_with(4, "foo", 0, None, chunking="field")
         self.assertEqual(result, None)
 
     @patch("improver.utilities.save.save_netcdf")
@@ -226,7 +260,16 @@ class Test_with_output(unittest.TestCase):
             "--compression-level=0",
             "--least-significant-digit=2",
         )
-        m.assert_called_with(4, "foo", 0, 2)
+        m.assert_called_with(4, "foo", 0, 2, chunking="field")
+        self.assertEqual(result, None)
+
+    @patch("improver.utilities.save.save_netcdf")
+    def test_with_output_chunking(self, m):
+        """Tests save_netcdf, chunking=series"""
+        result = wrapped_with_output.cli(
+            "argv[0]", "2", "--output=foo", "--chunking=series"
+        )
+        m.assert_called_with(4, "foo", 1, None, chunking="series")
         self.assertEqual(result, None)
 
 
@@ -354,6 +397,27 @@ class Test_clizefy(unittest.TestCase):
         m.assert_called_with(func.__doc__)
 
 
+class Test_LazySubcommand(unittest.TestCase):
+    """Test the LazySubcommand proxy"""
+
+    @patch("importlib.import_module")
+    def test_no_import_on_creation(self, m):
+        """Tests that creating the proxy and its cli does not import"""
+        lazy = LazySubcommand("threshold")
+        self.assertIs(lazy.cli, lazy)
+        m.assert_not_called()
+
+    def test_resolve(self):
+        """Tests that the proxy resolves to the clize CLI of the module"""
+        from improver.cli import threshold
+
+        lazy = LazySubcommand("threshold")
+        self.assertIs(lazy.resolve(), threshold.process.cli)
+        self.assertEqual(
+            lazy.helper.description, threshold.process.cli.helper.description
+        )
+
+
 class Test_unbracket(unittest.TestCase):
     """Test the unbracket function"""
 
@@ -377,6 +441,56 @@ class Test_unbracket(unittest.TestCase):
             unbracket(["foo", "]", "bar"])
 
 
+class Test_build_pipeline(unittest.TestCase):
+    """Test the build_pipeline function"""
+
+    def test_basic(self):
+        """Tests that nested commands become child nodes of their command"""
+        args = ["foo", ["bar", ["qux", "a"], "b"], ["baz", "c"], "-o", "z"]
+        foo, bar, qux, baz = build_pipeline(args)
+        self.assertEqual(foo.args, args)
+        self.assertIsNone(foo.parent)
+        self.assertEqual(foo.pending, 2)
+        self.assertEqual((bar.parent, bar.position, bar.pending), (foo, 1, 1))
+        self.assertEqual((qux.parent, qux.position, qux.pending), (bar, 1, 0))
+        self.assertEqual((baz.parent, baz.position, baz.pending), (foo, 2, 0))
+        self.assertEqual(baz.args, ["baz", "c"])
+
+    def test_no_nesting(self):
+        """Tests that a command without nested commands is a single node"""
+        (node,) = build_pipeline(["foo", "a"])
+        self.assertEqual((node.args, node.pending), (["foo", "a"], 0))
+
+
+def test_execute_pipeline(tmp_path, capsys):
+    """Test that a two command pipeline run across two spawned worker
+    processes runs the nested command first and passes its result to the
+    outer command, giving the same result as running the commands in turn."""
+    from improver.cli import SUBCOMMANDS_DISPATCHER
+    from improver.utilities.save import save_netcdf
+
+    cube = set_up_variable_cube(
+        np.arange(27, dtype=np.float32).reshape(3, 3, 3) + 270.0
+    )
+    filepath = str(tmp_path / "input.nc")
+    save_netcdf(cube, filepath)
+    args = [
+        "threshold",
+        ["collapse-realizations", filepath, "--method", "mean"],
+        "--threshold-values",
+        "280",
+    ]
+    result = execute_pipeline("improver", *args, n_workers=2, verbose=True)
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert "improver collapse-realizations" in lines[0]
+    assert "improver threshold" in lines[1]
+    expected = execute_command(SUBCOMMANDS_DISPATCHER, "improver", *args)
+    assert result == expected
+    assert not result.coords("realization")
+    assert result.coord("air_temperature").points == [280.0]
+
+
 def test_import_cli():
     """Test if `import improver.cli` pulls in heavy stuff like numpy.
 
@@ -396,6 +510,51 @@ def test_import_cli():
     subprocess.run([sys.executable, "-c", script], check=True)  # nosec
 
 
+def _run_cli_subprocess(*args):
+    """Run the improver CLI in a fresh interpreter.
+
+    Returns:
+        The names of the improver.cli submodules imported while running the
+        command.
+    """
+    import subprocess  # nosec
+    import sys
+
+    script = "\n".join(
+        [
+            "import sys",
+            "from improver import cli",
+            "try:",
+            "    cli.run_main(['improver', *sys.argv[1:]])",
+            "except SystemExit:",
+            "    pass",
+            "print(sorted(m for m in sys.modules if m.startswith('improver.cli.')))",
+        ]
+    )
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", script, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_startup_command_help():
+    """Test that command help only imports the module for that command."""
+    imported = _run_cli_subprocess("threshold", "--help")
+    assert imported == "['improver.cli.threshold']"
+
+
+def test_startup_trivial_run():
+    """Test that a trivial run (a dry run of a command pipeline) does not
+    import any command modules."""
+    imported = _run_cli_subprocess(
+        "--dry-run", "threshold", "[", "nbhood", "input.nc", "]", "--output", "o.nc"
+    )
+    assert imported == "[]"
+
+
 def test_help_no_stderr():
     """Test if help writes to sys.stderr."""
     import contextlib
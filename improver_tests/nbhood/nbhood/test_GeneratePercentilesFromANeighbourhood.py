@@ -4,7 +4,11 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the nbhood.nbhood.GeneratePercentilesFromANeighbourhood plugin."""
 
+import importlib
 import unittest
+import warnings
+from unittest import skipIf
+from unittest.mock import patch
 
 import iris
 import numpy as np
@@ -12,7 +16,10 @@ from iris.cube import Cube
 from iris.tests import IrisTest
 
 from improver.constants import DEFAULT_PERCENTILES
-from improver.nbhood.nbhood import GeneratePercentilesFromANeighbourhood
+from improver.nbhood.nbhood import (
+    GeneratePercentilesFromANeighbourhood,
+    circular_kernel,
+)
 from improver.synthetic_data.set_up_test_cubes import (
     add_coordinate,
     set_up_variable_cube,
@@ -299,6 +306,65 @@ class Test_pad_and_unpad_cube(IrisTest):
         self.assertArrayAlmostEqual(result.data, expected)
 
 
+numba_installed = importlib.util.find_spec("numba") is not None
+
+
+class Test__sliding_percentiles(IrisTest):
+    """Test the sliding window percentiles match those from gathering every
+    neighbourhood."""
+
+    def setUp(self):
+        """Set up random data with some repeated values."""
+        rng = np.random.default_rng(0)
+        self.data = rng.random((13, 11)).astype(np.float32)
+        self.data[3:6, 2:9] = 0.5
+        self.percentiles = np.array([0, 10, 33.3, 50, 90, 100], dtype=np.float32)
+
+    def expected(self, kernel):
+        """Calculate the percentiles by gathering every neighbourhood."""
+        result = np.empty((len(self.percentiles),) + self.data.shape, np.float32)
+        GeneratePercentilesFromANeighbourhood._window_percentiles(
+            self.data, kernel, self.percentiles, result
+        )
+        return result
+
+    @skipIf(not numba_installed, "numba not installed")
+    def test_circular_kernel(self):
+        """Test circular kernels of several sizes."""
+        for ranges in [1, 3, 5]:
+            kernel = circular_kernel(ranges, weighted_mode=False)
+            result = GeneratePercentilesFromANeighbourhood._sliding_percentiles(
+                self.data, kernel, self.percentiles
+            )
+            self.assertArrayAlmostEqual(result, self.expected(kernel))
+
+    @skipIf(not numba_installed, "numba not installed")
+    def test_irregular_kernel(self):
+        """Test a kernel with more than one run of ones in a row and an
+        empty row."""
+        kernel = np.array([[1.0, 0.0, 1.0], [0.0, 1.0, 1.0], [0.0, 0.0, 0.0]])
+        result = GeneratePercentilesFromANeighbourhood._sliding_percentiles(
+            self.data, kernel, self.percentiles
+        )
+        self.assertArrayAlmostEqual(result, self.expected(kernel))
+
+    @patch.dict("sys.modules", numba=None)
+    @patch.object(GeneratePercentilesFromANeighbourhood, "_window_percentiles")
+    def test_window_percentiles_called(self, window_percentiles):
+        """Test that the neighbourhoods are gathered if numba is not
+        installed, with a single warning for all the slices."""
+        data = np.stack([self.data, self.data])
+        cube = set_up_variable_cube(data, spatial_grid="equalarea")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            GeneratePercentilesFromANeighbourhood(
+                2000, percentiles=self.percentiles
+            ).process(cube)
+        messages = [str(item.message) for item in caught]
+        self.assertEqual(sum("numba unavailable" in message for message in messages), 1)
+        self.assertEqual(window_percentiles.call_count, 2)
+
+
 class Test_process(IrisTest):
     """Test the process method within the plugin to calculate percentile values
     from a neighbourhood."""
@@ -446,6 +512,24 @@ class Test_process(IrisTest):
         ).process(cube)
         self.assertArrayAlmostEqual(result.data, expected)
 
+    def test_n_workers(self):
+        """Test the result is the same when slices are processed in threads."""
+        data = np.ones((5, 5), dtype=np.float32)
+        cube = set_up_variable_cube(data, spatial_grid="equalarea")
+        reals_points = np.array([0, 1, 2], dtype=np.int32)
+        cube = add_coordinate(cube, coord_points=reals_points, coord_name="realization")
+        cube.data[0, 2, 2] = 0
+        cube.data[1, 2, 1] = 0
+        cube.data[2, 0, 0] = 0.5
+        percentiles = np.array([10, 50, 90])
+        expected = GeneratePercentilesFromANeighbourhood(
+            2000.0, percentiles=percentiles
+        ).process(cube)
+        result = GeneratePercentilesFromANeighbourhood(
+            2000.0, percentiles=percentiles, n_workers=2
+        ).process(cube)
+        self.assertEqual(result, expected)
+
     def test_multi_point_single_real(self):
         """Test behaviour for points over a single realization."""
 
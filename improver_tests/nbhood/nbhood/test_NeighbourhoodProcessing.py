@@ -5,13 +5,19 @@
 """Unit tests for the nbhood.NeighbourhoodProcessing plugin."""
 
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from iris.coords import CellMethod
 from iris.cube import Cube
 from iris.tests import IrisTest
+from scipy.ndimage import correlate
 
-from improver.nbhood.nbhood import NeighbourhoodProcessing
+from improver.nbhood.nbhood import (
+    FLOAT32_ACCUMULATION_TOLERANCE,
+    NeighbourhoodProcessing,
+    circular_kernel,
+)
 from improver.synthetic_data.set_up_test_cubes import set_up_probability_cube
 
 
@@ -144,6 +150,19 @@ class Test__calculate_neighbourhood(IrisTest):
         result = plugin._calculate_neighbourhood(data)
         self.assertArrayAlmostEqual(result.data, expected_array)
 
+    def test_large_circular(self):
+        """Test the _calculate_neighbourhood method with a circular
+        neighbourhood large enough to be summed along chords matches
+        direct correlation with the kernel."""
+        data = np.random.default_rng(0).random((30, 30)).astype(np.float32)
+        plugin = NeighbourhoodProcessing("circular", self.RADIUS)
+        plugin.kernel = circular_kernel(6, weighted_mode=False)
+        plugin.nb_size = max(plugin.kernel.shape)
+        expected = correlate(data.astype(np.float64), plugin.kernel, mode="nearest")
+        expected /= correlate(np.ones_like(expected), plugin.kernel, mode="nearest")
+        result = plugin._calculate_neighbourhood(data)
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
     def test_basic_weighted_circular(self):
         """Test the _calculate_neighbourhood method with a
         weighted circular neighbourhood."""
@@ -369,6 +388,108 @@ class Test__calculate_neighbourhood(IrisTest):
         self.assertArrayAlmostEqual(result.data, self.expected_array)
         self.assertArrayAlmostEqual(result.mask, self.expected_mask)
 
+    def test_multiple_slices(self):
+        """Test that leading dimensions are processed in one call, giving the
+        same result as processing each x-y slice separately. The slices
+        include ones that are trimmed to different boxes, ones that cannot be
+        trimmed and ones that are entirely zero or one."""
+        zeros = np.zeros((5, 5), dtype=np.float32)
+        corner = zeros.copy()
+        corner[0, 0] = 1
+        data = np.stack(
+            [
+                self.data,
+                self.data_for_masked_tests,
+                corner,
+                zeros,
+                np.ones((5, 5), dtype=np.float32),
+                1 - corner,
+            ]
+        ).reshape((2, 3, 5, 5))
+        for method in ["square", "circular"]:
+            plugin = NeighbourhoodProcessing(method, self.RADIUS)
+            plugin.nb_size = self.nbhood_size
+            plugin.kernel = self.circular_kernel
+            expected = np.ma.stack(
+                [
+                    plugin._calculate_neighbourhood(slice_2d, mask=self.mask)
+                    for slice_2d in data.reshape((6, 5, 5))
+                ]
+            ).reshape(data.shape)
+            result = plugin._calculate_neighbourhood(data, mask=self.mask)
+            self.assertArrayEqual(result.data, expected.data)
+            self.assertArrayEqual(result.mask, expected.mask)
+
+    def test_sparse(self):
+        """Test that sparse data, processed only around each cluster of
+        non-zero values, give the same result as processing the whole
+        array, including where neighbourhoods of clusters overlap."""
+        data = np.zeros((2, 60, 50), dtype=np.float32)
+        data[:, 0, 1] = 1
+        data[0, 30, 20:22] = 1
+        data[0, 34, 24] = 0.5
+        data[1, 59, 49] = 0.25
+        mask = np.ones((60, 50), dtype=np.int32)
+        mask[28:32, 20] = 0
+        kernels = {"square": None, "circular": circular_kernel(6, False)}
+        for method, kernel in kernels.items():
+            plugin = NeighbourhoodProcessing(method, self.RADIUS)
+            plugin.kernel = kernel
+            plugin.nb_size = 13
+            with patch(
+                "improver.nbhood.nbhood.sparse_clusters", return_value=None
+            ) as clusters:
+                expected = plugin._calculate_neighbourhood(data, mask=mask)
+            clusters.assert_called()
+            result = plugin._calculate_neighbourhood(data, mask=mask)
+            self.assertArrayEqual(result.data, expected.data)
+            self.assertArrayEqual(result.mask, expected.mask)
+
+    def test_float32_accumulation(self):
+        """Test that accumulating in float32 gives results within the
+        documented tolerance of those accumulated in float64, for square and
+        chord-summed circular neighbourhoods, including trimmed and masked
+        slices."""
+        rng = np.random.default_rng(0)
+        data = rng.random((3, 60, 50)).astype(np.float32)
+        data[1, :20] = 0
+        data[2, 30:] = 1
+        data = np.ma.masked_where(rng.random(data.shape) < 0.1, data)
+        mask = np.ones((60, 50), dtype=np.int32)
+        mask[:5, :5] = 0
+        kernels = {"square": None, "circular": circular_kernel(6, False)}
+        for method, kernel in kernels.items():
+            results = []
+            for float32_accumulation in [False, True]:
+                plugin = NeighbourhoodProcessing(
+                    method, self.RADIUS, float32_accumulation=float32_accumulation
+                )
+                plugin.kernel = kernel
+                plugin.nb_size = 13
+                results.append(plugin._calculate_neighbourhood(data, mask=mask))
+            expected, result = results
+            self.assertEqual(result.dtype, np.float32)
+            self.assertArrayEqual(result.mask, expected.mask)
+            tolerance = FLOAT32_ACCUMULATION_TOLERANCE * np.abs(data).max()
+            np.testing.assert_allclose(
+                result.data, expected.data, rtol=0, atol=tolerance
+            )
+
+    def test_float32_accumulation_large_grid(self):
+        """Test that accumulating in float32 remains within tolerance for
+        a grid large enough that a float32 summed-area table would not."""
+        data = 1000 + np.random.default_rng(0).random((400, 400)).astype(np.float32)
+        results = []
+        for float32_accumulation in [False, True]:
+            plugin = NeighbourhoodProcessing(
+                "square", self.RADIUS, float32_accumulation=float32_accumulation
+            )
+            plugin.nb_size = 5
+            results.append(plugin._calculate_neighbourhood(data))
+        expected, result = results
+        tolerance = FLOAT32_ACCUMULATION_TOLERANCE * np.abs(data).max()
+        np.testing.assert_allclose(result, expected, rtol=0, atol=tolerance)
+
 
 class Test_process(IrisTest):
     """Test the process method."""
@@ -404,6 +525,128 @@ class Test_process(IrisTest):
         self.assertTupleEqual(result.cell_methods, self.cube.cell_methods)
         self.assertDictEqual(result.attributes, self.cube.attributes)
 
+    def test_dimension_order(self):
+        """Test that a cube without y and x as its last dimensions is
+        returned with y and x last."""
+        expected = NeighbourhoodProcessing("square", 2000)(self.cube)
+        self.cube.transpose([1, 0, 2])
+        result = NeighbourhoodProcessing("square", 2000)(self.cube)
+        self.assertEqual(result.coord_dims("air_temperature"), (0,))
+        self.assertArrayEqual(result.data, expected.data)
+
+    def test_identical_slices(self):
+        """Test that identical x-y slices are processed once, giving the
+        same result as processing every slice."""
+        self.cube.data[1] = 1
+        expected = np.stack(
+            [
+                NeighbourhoodProcessing("square", 2000)(cube_slice).data
+                for cube_slice in self.cube.slices_over("air_temperature")
+            ]
+        )
+        plugin = NeighbourhoodProcessing("square", 2000)
+        with patch.object(
+            plugin,
+            "_calculate_neighbourhood",
+            wraps=plugin._calculate_neighbourhood,
+        ) as calculate:
+            result = plugin(self.cube)
+        (data, _), _ = calculate.call_args
+        self.assertEqual(data.shape, (2, 5, 5))
+        self.assertArrayEqual(result.data, expected)
+
+    def test_n_workers(self):
+        """Test that the result is the same when x-y slices are processed in
+        threads, including with a mask and masked data."""
+        self.cube.data[1, 0, 0] = 0
+        self.cube.data = np.ma.masked_where(self.cube.data == 0, self.cube.data)
+        mask_cube = next(self.cube.slices_over("air_temperature")).copy(
+            data=np.ones((5, 5), dtype=np.float32)
+        )
+        mask_cube.data[4, 4] = 0
+        for method in ["square", "circular"]:
+            expected = NeighbourhoodProcessing(method, 2000)(
+                self.cube, mask_cube=mask_cube
+            )
+            result = NeighbourhoodProcessing(method, 2000, n_workers=2)(
+                self.cube, mask_cube=mask_cube
+            )
+            self.assertEqual(result, expected)
+            self.assertArrayEqual(result.data.mask, expected.data.mask)
+
+    def test_tiles(self):
+        """Test that processing large grids in tiles gives the same result
+        as processing the whole grid, with and without threads, for square
+        and circular neighbourhoods, with a mask and masked data."""
+        rng = np.random.default_rng(0)
+        data = (rng.random((2, 30, 25)) > 0.7).astype(np.float32)
+        self.cube = set_up_probability_cube(
+            np.ma.masked_where(rng.random(data.shape) < 0.05, data),
+            thresholds=np.array([278, 281], dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        mask_cube = next(self.cube.slices_over("air_temperature")).copy(
+            data=np.ones((30, 25), dtype=np.float32)
+        )
+        mask_cube.data[:3, :4] = 0
+        for method, radius in [("square", 6000), ("circular", 12000)]:
+            expected = NeighbourhoodProcessing(method, radius)(
+                self.cube, mask_cube=mask_cube
+            )
+            for n_workers in [1, 2]:
+                plugin = NeighbourhoodProcessing(
+                    method, radius, n_workers=n_workers, tile_size=7
+                )
+                with patch.object(
+                    plugin,
+                    "_calculate_neighbourhoods",
+                    wraps=plugin._calculate_neighbourhoods,
+                ) as calculate:
+                    result = plugin(self.cube, mask_cube=mask_cube)
+                self.assertEqual(calculate.call_count, 20)
+                self.assertEqual(result, expected)
+                self.assertArrayEqual(result.data.mask, expected.data.mask)
+
+    def test_tiles_single_slice(self):
+        """Test that a single x-y slice is processed in tiles, giving results
+        within rounding of processing the whole grid for non-binary data."""
+        data = np.random.default_rng(0).random((20, 20)).astype(np.float32)
+        self.cube = set_up_probability_cube(
+            data[np.newaxis],
+            thresholds=np.array([278], dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        expected = NeighbourhoodProcessing("square", 4000)(self.cube)
+        result = NeighbourhoodProcessing("square", 4000, tile_size=8)(self.cube)
+        tolerance = FLOAT32_ACCUMULATION_TOLERANCE * np.abs(data).max()
+        np.testing.assert_allclose(result.data, expected.data, rtol=0, atol=tolerance)
+
+    def test_tiles_continuous_data(self):
+        """Test that tiled results for continuous data are within the
+        documented tolerance of those for the whole grid, with float64 and
+        float32 accumulation, for square and circular neighbourhoods with
+        masked data and an offset large enough to expose rounding."""
+        rng = np.random.default_rng(0)
+        data = 1000 + rng.random((2, 60, 50)).astype(np.float32)
+        data = np.ma.masked_where(rng.random(data.shape) < 0.1, data)
+        self.cube = set_up_probability_cube(
+            data,
+            thresholds=np.array([278, 281], dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        tolerance = FLOAT32_ACCUMULATION_TOLERANCE * np.abs(data).max()
+        for method, radius in [("square", 6000), ("circular", 12000)]:
+            for float32_accumulation in [False, True]:
+                kwargs = {"float32_accumulation": float32_accumulation}
+                expected = NeighbourhoodProcessing(method, radius, **kwargs)(self.cube)
+                result = NeighbourhoodProcessing(
+                    method, radius, tile_size=16, **kwargs
+                )(self.cube)
+                self.assertArrayEqual(result.data.mask, expected.data.mask)
+                np.testing.assert_allclose(
+                    result.data.data, expected.data.data, rtol=0, atol=tolerance
+                )
+
     def test_cube_metadata(self):
         """Test the result has the correct attributes and cell methods"""
         neighbourhood_method = "square"
@@ -416,5 +659,40 @@ class Test_process(IrisTest):
         self.assertDictEqual(result.attributes, self.cube.attributes)
 
 
+class Test_process_radii(IrisTest):
+    """Test the process_radii method."""
+
+    def setUp(self):
+        """Set up a cube with a different field for each threshold."""
+        data = np.zeros((3, 16, 16), dtype=np.float32)
+        data[0] = 1
+        data[1, 5:10, 6:9] = 1
+        data[2] = np.random.default_rng(0).random((16, 16))
+        self.cube = set_up_probability_cube(
+            data,
+            thresholds=np.array([278, 281, 284], dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        self.radii = [2000, 6000, 10000]
+
+    def test_matches_process(self):
+        """Test the result for each radius matches processing each radius
+        separately, with and without a mask."""
+        mask_cube = self.cube[0].copy(data=np.ones((16, 16), dtype=np.float32))
+        mask_cube.data[:4, :4] = 0
+        for method in ["square", "circular"]:
+            for mask in [None, mask_cube]:
+                results = NeighbourhoodProcessing(method, 2000).process_radii(
+                    self.cube, self.radii, mask_cube=mask
+                )
+                self.assertEqual(len(results), len(self.radii))
+                for result, radius in zip(results, self.radii):
+                    expected = NeighbourhoodProcessing(method, radius)(
+                        self.cube, mask_cube=mask
+                    )
+                    self.assertEqual(result.metadata, expected.metadata)
+                    self.assertArrayEqual(result.data, expected.data)
+
+
 if __name__ == "__main__":
     unittest.main()
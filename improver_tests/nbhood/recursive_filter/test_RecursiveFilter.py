@@ -4,8 +4,11 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the nbhood.RecursiveFilter plugin."""
 
+import importlib
 import unittest
 from datetime import timedelta
+from unittest import skipIf
+from unittest.mock import patch
 
 import iris
 import numpy as np
@@ -362,75 +365,95 @@ class Test__recurse_backward(Test_RecursiveFilter):
         self.assertArrayAlmostEqual(result, expected_result)
 
 
-class Test__run_recursion(Test_RecursiveFilter):
-    """Test the _run_recursion method"""
+numba_installed = importlib.util.find_spec("numba") is not None
 
-    def test_return_type(self):
-        """Test that the _run_recursion method returns an iris.cube.Cube."""
+
+class Test__recurse(IrisTest):
+    """Test the _recurse method filters every slice as the forward and
+    backward recursions do."""
+
+    def setUp(self):
+        """Set up random data and coefficients for several slices."""
+        rng = np.random.default_rng(0)
+        self.grid = rng.random((3, 9, 8)).astype(np.float32)
+        self.coeffs_x = (0.5 * rng.random((3, 9, 7))).astype(np.float32)
+        self.coeffs_y = (0.5 * rng.random((3, 8, 8))).astype(np.float32)
+
+    def expected(self, coeffs_x, coeffs_y, iterations):
+        """Filter each slice in turn along its rows and columns."""
+        result = self.grid.copy()
+        for index, grid in enumerate(result):
+            slice_x = coeffs_x[index % len(coeffs_x)]
+            slice_y = coeffs_y[index % len(coeffs_y)]
+            for _ in range(iterations):
+                RecursiveFilter._recurse_forward(grid, slice_x, 1)
+                RecursiveFilter._recurse_backward(grid, slice_x, 1)
+                RecursiveFilter._recurse_forward(grid, slice_y, 0)
+                RecursiveFilter._recurse_backward(grid, slice_y, 0)
+        return result
+
+    @skipIf(not numba_installed, "numba not installed")
+    def test_coefficients_for_each_slice(self):
+        """Test with different coefficients for each slice."""
+        expected = self.expected(self.coeffs_x, self.coeffs_y, 2)
+        result = RecursiveFilter._recurse(self.grid, self.coeffs_x, self.coeffs_y, 2)
+        self.assertArrayAlmostEqual(result, expected)
+
+    @skipIf(not numba_installed, "numba not installed")
+    def test_shared_coefficients(self):
+        """Test with the same coefficients for every slice."""
+        coeffs_x, coeffs_y = self.coeffs_x[:1], self.coeffs_y[:1]
+        expected = self.expected(coeffs_x, coeffs_y, 3)
+        result = RecursiveFilter._recurse(self.grid, coeffs_x, coeffs_y, 3)
+        self.assertArrayAlmostEqual(result, expected)
+
+    @patch.dict("sys.modules", numba=None)
+    def test_without_numba(self):
+        """Test that all slices are filtered together with NumPy if numba is
+        not installed."""
+        expected = self.expected(self.coeffs_x, self.coeffs_y, 2)
+        result = RecursiveFilter._recurse(self.grid, self.coeffs_x, self.coeffs_y, 2)
+        self.assertArrayAlmostEqual(result, expected)
+
+
+class Test__recurse_padded(Test_RecursiveFilter):
+    """Test the _recurse method on a cube padded with a halo"""
+
+    def recurse(self, smoothing_coefficients, iterations):
+        """Pad the cube and coefficients as in process and filter the
+        padded data."""
         edge_width = 1
         cube = iris.util.squeeze(self.cube)
         smoothing_coefficients_x, smoothing_coefficients_y = RecursiveFilter(
             edge_width=edge_width
-        )._pad_coefficients(*self.smoothing_coefficients)
+        )._pad_coefficients(*smoothing_coefficients)
         padded_cube = pad_cube_with_halo(cube, 2 * edge_width, 2 * edge_width)
-        result = RecursiveFilter(edge_width=1)._run_recursion(
-            padded_cube,
-            smoothing_coefficients_x,
-            smoothing_coefficients_y,
-            self.iterations,
-        )
-        self.assertIsInstance(result, Cube)
+        return RecursiveFilter._recurse(
+            padded_cube.data[np.newaxis],
+            smoothing_coefficients_x.data[np.newaxis],
+            smoothing_coefficients_y.data[np.newaxis],
+            iterations,
+        )[0]
 
     def test_result_basic(self):
-        """Test that the _run_recursion method returns the expected value."""
-        edge_width = 1
-        cube = iris.util.squeeze(self.cube)
-        smoothing_coefficients_x, smoothing_coefficients_y = RecursiveFilter(
-            edge_width=edge_width
-        )._pad_coefficients(*self.smoothing_coefficients)
-        padded_cube = pad_cube_with_halo(cube, 2 * edge_width, 2 * edge_width)
-        result = RecursiveFilter(edge_width=edge_width)._run_recursion(
-            padded_cube,
-            smoothing_coefficients_x,
-            smoothing_coefficients_y,
-            self.iterations,
-        )
+        """Test that the _recurse method returns the expected value."""
+        result = self.recurse(self.smoothing_coefficients, self.iterations)
         expected_result = 0.12302627
-        self.assertAlmostEqual(result.data[4][4], expected_result)
+        self.assertAlmostEqual(result[4][4], expected_result)
 
     def test_result_multiple_iterations(self):
-        """Test that the _run_recursion method returns the expected value after
+        """Test that the _recurse method returns the expected value after
         several iterations."""
-        edge_width = 1
-        cube = iris.util.squeeze(self.cube)
-        smoothing_coefficients_x, smoothing_coefficients_y = RecursiveFilter(
-            edge_width=edge_width
-        )._pad_coefficients(*self.smoothing_coefficients)
-        padded_cube = pad_cube_with_halo(cube, 2 * edge_width, 2 * edge_width)
-
-        result = RecursiveFilter(edge_width=edge_width)._run_recursion(
-            padded_cube,
-            smoothing_coefficients_x,
-            smoothing_coefficients_y,
-            3,
-        )
+        result = self.recurse(self.smoothing_coefficients, 3)
         expected_result = 0.034629755
-        self.assertAlmostEqual(result.data[4][4], expected_result)
+        self.assertAlmostEqual(result[4][4], expected_result)
 
     def test_different_smoothing_coefficients(self):
-        """Test that the _run_recursion method returns expected values when
+        """Test that the _recurse method returns expected values when
         smoothing_coefficient values are different in the x and y directions"""
-        edge_width = 1
-        cube = iris.util.squeeze(self.cube)
-        smoothing_coefficients_x, smoothing_coefficients_y = RecursiveFilter(
-            edge_width=edge_width
-        )._pad_coefficients(*self.smoothing_coefficients_alternative)
-        padded_cube = pad_cube_with_halo(cube, 2 * edge_width, 2 * edge_width)
-        result = RecursiveFilter(edge_width=edge_width)._run_recursion(
-            padded_cube, smoothing_coefficients_x, smoothing_coefficients_y, 1
-        )
+        result = self.recurse(self.smoothing_coefficients_alternative, 1)
         # slice back down to the source grid - easier to visualise!
-        unpadded_result = result.data[2:-2, 2:-2]
+        unpadded_result = result[2:-2, 2:-2]
 
         expected_result = np.array(
             [
@@ -601,6 +624,39 @@ class Test_process(Test_RecursiveFilter):
             self.assertArrayEqual(result.data[i, :, :].mask, mask[i, :, :])
             self.assertAlmostEqual(result.data[i][2][2], expected[i])
 
+    def test_n_workers(self):
+        """Test that the result is the same when slices are filtered in
+        threads."""
+        mask = np.zeros(self.prob_cube.data.shape, dtype=int)
+        mask[1, :, :] = self.prob_cube.data[1, :, :] == 0.00
+        self.prob_cube.data = np.ma.MaskedArray(self.prob_cube.data, mask=mask)
+        expected = RecursiveFilter(iterations=self.iterations)(
+            self.prob_cube.copy(),
+            smoothing_coefficients=self.smoothing_coefficients,
+            variable_mask=True,
+        )
+        result = RecursiveFilter(iterations=self.iterations, n_workers=2)(
+            self.prob_cube,
+            smoothing_coefficients=self.smoothing_coefficients,
+            variable_mask=True,
+        )
+        self.assertEqual(result, expected)
+        self.assertArrayEqual(result.data.mask, expected.data.mask)
+
+    @patch.dict("sys.modules", numba=None)
+    def test_without_numba(self):
+        """Test that a single warning is raised if numba is not installed,
+        even though the slices are shared between threads."""
+        expected = RecursiveFilter(iterations=self.iterations)(
+            self.prob_cube.copy(), smoothing_coefficients=self.smoothing_coefficients
+        )
+        with self.assertWarnsRegex(UserWarning, "numba unavailable") as warning:
+            result = RecursiveFilter(iterations=self.iterations, n_workers=2)(
+                self.prob_cube, smoothing_coefficients=self.smoothing_coefficients
+            )
+        self.assertEqual(len(warning.warnings), 1)
+        self.assertArrayAlmostEqual(result.data, expected.data)
+
     def test_error_different_masks(self):
         """Test that the plugin raises an error when given a masked cube where the mask
         is not the same on each spatial slice and variable_mask is False.
@@ -381,6 +381,41 @@ class Test_process(unittest.TestCase):
         self.assertEqual(result.coords(), expected_coords)
         self.assertEqual(result.metadata, self.cube.metadata)
 
+    def test_no_collapse_multithreshold_different_data(self):
+        """Test process for a cube with 2 thresholds holding different data,
+        one with masked data, gives the same results as processing each
+        threshold separately. The valid area counts for the masks are reused
+        between thresholds only where the data are not masked."""
+        cube = self.multi_threshold_cube.copy()
+        cube.data[0] = 1 - cube.data[0]
+        cube.data = np.ma.masked_array(cube.data, mask=False)
+        cube.data[1, 1, 1] = np.ma.masked
+        plugin = ApplyNeighbourhoodProcessingWithAMask(
+            "topographic_zone", "square", 2000
+        )
+        result = plugin(cube, self.mask_cube)
+        for result_slice, cube_slice in zip(
+            result.slices_over("air_temperature"), cube.slices_over("air_temperature")
+        ):
+            expected = plugin(cube_slice, self.mask_cube)
+            assert_allclose(result_slice.data, expected.data, equal_nan=True)
+
+    def test_identical_mask_bands(self):
+        """Test process gives the same result when mask bands are identical,
+        with each distinct band only processed once."""
+        mask_cube = self.mask_cube.copy()
+        mask_cube.data[2] = mask_cube.data[0]
+        plugin = ApplyNeighbourhoodProcessingWithAMask(
+            "topographic_zone", "square", 2000
+        )
+        expected = self.expected_uncollapsed_result.copy()
+        expected[2] = expected[0]
+        result = plugin(self.cube, mask_cube)
+        assert_allclose(result.data, expected, equal_nan=True)
+        self.assertEqual(
+            result.coord("topographic_zone"), mask_cube.coord("topographic_zone")
+        )
+
     def test_collapse_multithreshold(self):
         """Test process for a cube with 2 thresholds and collapsing the topographic_zones.
         Same data as test_basic_collapse with an extra point in the leading
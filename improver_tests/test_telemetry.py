@@ -0,0 +1,143 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the improver.telemetry module"""
+
+import json
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from improver import BasePlugin
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.telemetry import (
+    TELEMETRY_ENV_VAR,
+    describe,
+    telemetry_count,
+    telemetry_enable,
+)
+
+
+class DummyPlugin(BasePlugin):
+    """Dummy plugin which calls another plugin if given one"""
+
+    def __init__(self, inner=None):
+        self.inner = inner
+
+    def process(self, cube, fail=False):
+        """Return the cube as float64, or raise an error if fail"""
+        telemetry_count("calls")
+        if fail:
+            raise ValueError("failed")
+        if self.inner is not None:
+            cube = self.inner(cube)
+        return cube.copy(data=cube.data.astype(np.float64))
+
+
+@pytest.fixture(name="cube")
+def cube_fixture():
+    return set_up_variable_cube(np.ones((2, 3, 4), dtype=np.float32))
+
+
+@pytest.fixture(name="telemetry_path")
+def telemetry_path_fixture(tmp_path):
+    """Enable telemetry to a temporary file for the duration of a test"""
+    path = tmp_path / "telemetry.jsonl"
+    with telemetry_enable(str(path)):
+        yield path
+
+
+def read_records(path):
+    with open(path) as fin:
+        return [json.loads(line) for line in fin]
+
+
+def test_describe(cube):
+    """Test cubes and arrays are found within nested containers"""
+    result = describe([(cube,), {"mask": np.zeros(3, dtype=bool)}, "a", 1])
+    assert result == [
+        {"name": "air_temperature", "shape": [2, 3, 4], "dtype": "float32"},
+        {"name": None, "shape": [3], "dtype": "bool"},
+    ]
+
+
+def test_disabled(tmp_path, monkeypatch, cube):
+    """Test nothing is recorded when telemetry is not enabled"""
+    monkeypatch.delenv(TELEMETRY_ENV_VAR, raising=False)
+    monkeypatch.chdir(tmp_path)
+    DummyPlugin()(cube)
+    assert not list(tmp_path.iterdir())
+
+
+def test_record(telemetry_path, cube):
+    """Test a record is written for a plugin call"""
+    DummyPlugin()(cube)
+    (record,) = read_records(telemetry_path)
+    assert record["plugin"] == f"{__name__}.DummyPlugin"
+    assert record["depth"] == 0
+    assert record["inputs"] == [
+        {"name": "air_temperature", "shape": [2, 3, 4], "dtype": "float32"}
+    ]
+    assert record["outputs"] == [
+        {"name": "air_temperature", "shape": [2, 3, 4], "dtype": "float64"}
+    ]
+    for key in ("wall_time", "cpu_time", "peak_rss_delta"):
+        assert record[key] >= 0
+    assert record["counters"] == {"calls": 1}
+
+
+def test_nested(telemetry_path, cube):
+    """Test a plugin called by another plugin is recorded with greater depth,
+    and before the outer plugin completes"""
+    DummyPlugin(inner=DummyPlugin())(cube)
+    inner, outer = read_records(telemetry_path)
+    assert (inner["depth"], outer["depth"]) == (1, 0)
+    assert inner["counters"] == outer["counters"] == {"calls": 1}
+    assert outer["wall_time"] >= inner["wall_time"]
+
+
+def test_error(telemetry_path, cube):
+    """Test a failing plugin call is recorded and the error raised"""
+    with pytest.raises(ValueError, match="failed"):
+        DummyPlugin()(cube, fail=True)
+    (record,) = read_records(telemetry_path)
+    assert record["error"] == "ValueError: failed"
+    assert "outputs" not in record
+
+
+def test_count_disabled(monkeypatch):
+    """Test counting does nothing when no plugin call is being recorded"""
+    monkeypatch.delenv(TELEMETRY_ENV_VAR, raising=False)
+    telemetry_count("calls")
+
+
+def test_enable_restores(tmp_path, monkeypatch):
+    """Test the previous telemetry setting is restored on exit"""
+    monkeypatch.delenv(TELEMETRY_ENV_VAR, raising=False)
+    with telemetry_enable(str(tmp_path / "outer.jsonl")):
+        with telemetry_enable(str(tmp_path / "inner.jsonl")):
+            assert os.environ[TELEMETRY_ENV_VAR].endswith("inner.jsonl")
+        assert os.environ[TELEMETRY_ENV_VAR].endswith("outer.jsonl")
+    assert TELEMETRY_ENV_VAR not in os.environ
+
+
+def test_threads(telemetry_path, cube):
+    """Test plugin calls made in another thread during a plugin call are
+    recorded at their own depth, with their own counters"""
+
+    class ThreadPlugin(BasePlugin):
+        def process(self, cube):
+            thread = threading.Thread(target=DummyPlugin(), args=(cube,))
+            thread.start()
+            thread.join()
+            telemetry_count("calls")
+            return cube
+
+    ThreadPlugin()(cube)
+    inner, outer = read_records(telemetry_path)
+    assert inner["plugin"] == f"{__name__}.DummyPlugin"
+    assert (inner["depth"], outer["depth"]) == (0, 0)
+    assert inner["counters"] == outer["counters"] == {"calls": 1}
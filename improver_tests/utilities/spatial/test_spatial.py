@@ -7,6 +7,7 @@ spatial.py."""
 
 from copy import copy
 from datetime import datetime as dt
+from unittest.mock import patch
 
 import cartopy.crs as ccrs
 import cf_units
@@ -777,3 +778,31 @@ def test_maximum_within_vicinity(grid, radius, landmask, expected_result):
     assert result.dtype == np.float64
     if np.ma.is_masked(reference):
         assert_array_equal(reference.mask, result.mask)
+
+
+@pytest.mark.parametrize("with_landmask", (True, False))
+@pytest.mark.parametrize("masked", (True, False))
+def test_maximum_within_vicinity_sparse(with_landmask, masked):
+    """Test that a sparse field, processed only around each cluster of
+    occurrences, gives the same result as processing the whole field, with
+    and without a landmask and masked points."""
+    rng = np.random.default_rng(0)
+    grid = np.zeros((60, 50))
+    grid[0, 0] = 1
+    grid[20, 20:22] = 0.5
+    grid[24, 23] = 1
+    grid[59, 10] = 0.75
+    if masked:
+        grid = np.ma.masked_where(rng.random(grid.shape) < 0.05, grid)
+    landmask = None
+    if with_landmask:
+        landmask = np.zeros(grid.shape, dtype=int)
+        landmask[:, 22:] = 1
+    with patch(
+        "improver.utilities.spatial.sparse_clusters", return_value=None
+    ) as clusters:
+        expected = maximum_within_vicinity(grid, 3, landmask)
+    clusters.assert_called()
+    result = maximum_within_vicinity(grid, 3, landmask)
+    assert_array_equal(result, expected)
+    assert type(result) == type(expected)
@@ -538,3 +538,15 @@ def test_radius_set_correctly(cube, kwargs):
     (expected,) = [value for value in kwargs.values() if value is not None]
     plugin = OccurrenceWithinVicinity(**kwargs)
     assert plugin.radii == expected
+
+
+def test_n_workers(cube_with_realizations):
+    """Test the result is the same when slices are processed in threads."""
+    cube = add_coordinate(
+        cube_with_realizations, TIMESTEPS, "time", order=[1, 0, 2, 3], is_datetime=True
+    )
+    cube.data[0, 0, 2, 1] = 1.0
+    cube.data[1, 1, 1, 3] = 1.0
+    expected = OccurrenceWithinVicinity(radii=[RADIUS, 2 * RADIUS])(cube)
+    result = OccurrenceWithinVicinity(radii=[RADIUS, 2 * RADIUS], n_workers=3)(cube)
+    assert result == expected
@@ -7,7 +7,12 @@
 import unittest
 from unittest.mock import mock_open, patch
 
-from improver.utilities.cli_utilities import load_json_or_none
+from improver.utilities.cli_utilities import (
+    load_json_or_none,
+    read_job_file,
+    run_job,
+    run_jobs,
+)
 
 
 class Test_load_json_or_none(unittest.TestCase):
@@ -30,5 +35,62 @@ class Test_load_json_or_none(unittest.TestCase):
         m.assert_not_called()
 
 
+class Test_read_job_file(unittest.TestCase):
+    """Tests read_job_file to read command lines from a job file."""
+
+    @patch(
+        "builtins.open",
+        new_callable=mock_open,
+        read_data="# comment\nthreshold a.nc -o b.nc\n\n  nbhood b.nc -o c.nc  \n",
+    )
+    def test_basic(self, m):
+        """Tests comments and blank lines are skipped and lines stripped."""
+        result = read_job_file("filename")
+        self.assertEqual(result, ["threshold a.nc -o b.nc", "nbhood b.nc -o c.nc"])
+        m.assert_called_with("filename", "r")
+
+
+class Test_run_job(unittest.TestCase):
+    """Tests run_job to run a single command line."""
+
+    @patch("improver.cli.main")
+    def test_basic(self, m):
+        """Tests the command line is split and run, with timing returned."""
+        command_line, elapsed, error = run_job("threshold 'a b.nc' -o c.nc")
+        m.cli.assert_called_once_with("improver", "threshold", "a b.nc", "-o", "c.nc")
+        self.assertEqual(command_line, "threshold 'a b.nc' -o c.nc")
+        self.assertGreaterEqual(elapsed, 0)
+        self.assertIsNone(error)
+
+    @patch("improver.cli.main")
+    def test_leading_improver(self, m):
+        """Tests a leading improver is removed from the command line."""
+        run_job("improver threshold a.nc")
+        m.cli.assert_called_once_with("improver", "threshold", "a.nc")
+
+    @patch("improver.cli.main")
+    def test_error(self, m):
+        """Tests a failing command is reported rather than raised."""
+        m.cli.side_effect = ValueError("bad input")
+        _, _, error = run_job("threshold a.nc")
+        self.assertEqual(error, "ValueError: bad input")
+
+
+class Test_run_jobs(unittest.TestCase):
+    """Tests run_jobs to run many command lines."""
+
+    @patch("improver.cli.main")
+    def test_sequential(self, m):
+        """Tests results are returned in order when run sequentially."""
+        result = list(run_jobs(["threshold a.nc", "nbhood b.nc"]))
+        self.assertEqual([r[0] for r in result], ["threshold a.nc", "nbhood b.nc"])
+        self.assertEqual(m.cli.call_count, 2)
+
+    def test_invalid_n_workers(self):
+        """Tests an error is raised for fewer than one worker."""
+        with self.assertRaisesRegex(ValueError, "n_workers must be at least 1"):
+            list(run_jobs(["threshold a.nc"], n_workers=0))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,9 +8,12 @@ import os
 import unittest
 from datetime import datetime
 from tempfile import mkdtemp
+from unittest.mock import patch
 
+import dask.array as da
 import iris
 import numpy as np
+import pytest
 from iris.tests import IrisTest
 
 from improver.metadata.probabilistic import find_threshold_coordinate
@@ -18,9 +21,16 @@ from improver.synthetic_data.set_up_test_cubes import (
     add_coordinate,
     set_up_percentile_cube,
     set_up_probability_cube,
+    set_up_spot_variable_cube,
     set_up_variable_cube,
 )
-from improver.utilities.load import load_cube, load_cubelist
+from improver.utilities.load import (
+    CUBE_CACHE,
+    CubeCache,
+    _fast_load,
+    load_cube,
+    load_cubelist,
+)
 from improver.utilities.save import save_netcdf
 
 
@@ -237,6 +247,115 @@ class Test_load_cube(IrisTest):
         result = load_cube([self.filepath, self.filepath2])
         self.assertEqual(len(result.coord("time").points), 2)
 
+    def test_subset(self):
+        """Test a subset selected by index, range and value is loaded
+        lazily with the expected data"""
+        cube = self.cube.copy(data=np.arange(27, dtype=np.float32).reshape(3, 3, 3))
+        os.remove(self.filepath)
+        save_netcdf(cube, self.filepath)
+        latitudes = cube.coord("latitude").points
+        subset = {
+            "realization": [0, 2],
+            "latitude": (latitudes[1], latitudes[2]),
+            "longitude": slice(0, 1),
+        }
+        result = load_cube(self.filepath, subset=subset)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayEqual(result.data, cube.data[[0, 2], 1:, :1])
+        self.assertArrayEqual(result.coord("realization").points, [0, 2])
+
+    def test_subset_no_lazy_load(self):
+        """Test a subset is realised when no_lazy_load is set"""
+        result = load_cube(
+            self.filepath, no_lazy_load=True, subset={"realization": [1]}
+        )
+        self.assertFalse(result.has_lazy_data())
+        self.assertEqual(result.shape, (1, 3, 3))
+
+    def test_subset_no_match(self):
+        """Test an error is raised if no points match a subset"""
+        msg = "No realization points match the subset"
+        with self.assertRaisesRegex(ValueError, msg):
+            load_cube(self.filepath, subset={"realization": [5]})
+
+    def test_subset_inexact_value(self):
+        """Test float values only match integer points that they equal,
+        rather than being truncated to the type of the points"""
+        result = load_cube(self.filepath, subset={"realization": [1.0, 1.5]})
+        self.assertArrayEqual(result.coord("realization").points, [1])
+        msg = "No realization points match the subset"
+        with self.assertRaisesRegex(ValueError, msg):
+            load_cube(self.filepath, subset={"realization": [0.5]})
+
+    def test_subset_scalar_coord_value(self):
+        """Test a scalar coordinate selected by value leaves the cube
+        unchanged if its point matches, and raises an error otherwise"""
+        time = self.cube.coord("time").points[0]
+        result = load_cube(self.filepath, subset={"time": [time]})
+        self.assertEqual(result, load_cube(self.filepath))
+        msg = "No time points match the subset"
+        with self.assertRaisesRegex(ValueError, msg):
+            load_cube(self.filepath, subset={"time": [time + 1]})
+
+    def test_subset_scalar_coord(self):
+        """Test an error is raised when subsetting on a scalar coordinate
+        by index"""
+        msg = "does not describe a single dimension"
+        with self.assertRaisesRegex(ValueError, msg):
+            load_cube(self.filepath, subset={"time": slice(0, 1)})
+
+
+@pytest.mark.parametrize(
+    "cube",
+    [
+        set_up_variable_cube(
+            np.ones((3, 4, 5), dtype=np.float32),
+            attributes={"title": "Test forecast", "source": "IMPROVER"},
+            standard_grid_metadata="uk_ens",
+        ),
+        set_up_variable_cube(
+            np.ma.masked_less(np.arange(20, dtype=np.float32).reshape(4, 5), 5),
+            spatial_grid="equalarea",
+        ),
+        set_up_probability_cube(np.ones((2, 4, 5), dtype=np.float32), [275.0, 280.0]),
+        set_up_percentile_cube(
+            np.ones((3, 4, 5), dtype=np.float32),
+            [10.0, 50.0, 90.0],
+            spatial_grid="equalarea",
+        ),
+    ],
+)
+def test_fast_load(tmp_path, cube):
+    """Test the fast loader loads the same cube as iris from files written
+    by save_netcdf, without calling iris.load"""
+    cube.cell_methods = (iris.coords.CellMethod("mean", coords="time"),)
+    filepath = str(tmp_path / "temp.nc")
+    save_netcdf(cube, filepath)
+    expected = load_cube(filepath)
+    with patch("improver.utilities.load.iris.load") as iris_load:
+        result = load_cube(filepath, fast_load=True)
+    iris_load.assert_not_called()
+    assert result.has_lazy_data()
+    assert result == expected
+
+
+def test_fast_load_fallback(tmp_path):
+    """Test files the fast loader cannot build, such as spot data with
+    string site IDs, are loaded with iris"""
+    cube = set_up_spot_variable_cube(np.ones(4, dtype=np.float32))
+    filepath = str(tmp_path / "temp.nc")
+    save_netcdf(cube, filepath)
+    result = load_cube(filepath, fast_load=True)
+    assert result == load_cube(filepath)
+
+
+def test_fast_load_not_netcdf(tmp_path):
+    """Test the fast loader declines files which are not netCDF, so that
+    they are loaded with iris"""
+    filepath = tmp_path / "temp.nc"
+    filepath.write_text("not netCDF")
+    assert _fast_load(str(filepath)) is None
+
 
 class Test_load_cubelist(IrisTest):
     """Test the load function."""
@@ -411,5 +530,118 @@ class Test_load_cubelist(IrisTest):
         self.assertArrayEqual([True, True], [_.has_lazy_data() for _ in result])
 
 
+class Test_CubeCache(IrisTest):
+    """Test the cache of loaded cubes."""
+
+    def setUp(self):
+        """Set up a cube saved to file and an empty cache."""
+        self.directory = mkdtemp()
+        self.filepath = os.path.join(self.directory, "temp.nc")
+        self.cube = set_up_variable_cube(np.ones((3, 3, 3), dtype=np.float32))
+        save_netcdf(self.cube, self.filepath)
+        self.cache = CubeCache()
+
+    def tearDown(self):
+        """Remove temporary directories created for testing."""
+        os.remove(self.filepath)
+        os.rmdir(self.directory)
+
+    def test_hit(self):
+        """Test that a second load of the same file is a cache hit and
+        returns an equal but independent cube."""
+        first = self.cache.load_cube(self.filepath, no_lazy_load=True)
+        second = self.cache.load_cube(self.filepath, no_lazy_load=True)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        first.data[:] = 0
+        third = self.cache.load_cube(self.filepath, no_lazy_load=True)
+        self.assertArrayEqual(third.data, self.cube.data)
+
+    def test_load_options_in_key(self):
+        """Test that loads with different options are cached separately."""
+        self.cache.load_cube(self.filepath)
+        self.cache.load_cube(self.filepath, no_lazy_load=True)
+        self.cache.load_cubelist(self.filepath)
+        self.cache.load_cube(self.filepath, constraints="air_temperature")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 4))
+
+    def test_modified_file(self):
+        """Test that a file which is rewritten is loaded afresh."""
+        self.cache.load_cube(self.filepath)
+        cube = self.cube.copy(data=np.zeros((3, 3, 3), dtype=np.float32))
+        save_netcdf(cube, self.filepath)
+        os.utime(self.filepath, ns=(0, 0))
+        result = self.cache.load_cube(self.filepath)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.assertArrayEqual(result.data, cube.data)
+
+    def test_wildcard_not_cached(self):
+        """Test that a wildcard path is passed through to the loader."""
+        self.cache.load_cube(os.path.join(self.directory, "*.nc"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_byte_budget(self):
+        """Test that least recently used entries are discarded to keep
+        within the byte budget."""
+        self.cache.max_bytes = self.cube.data.nbytes
+        self.cache.load_cube(self.filepath)
+        self.cache.load_cube(self.filepath, no_lazy_load=True)
+        self.cache.load_cube(self.filepath)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 3))
+        self.cache.max_bytes = 0
+        self.cache.clear()
+        self.cache.load_cube(self.filepath)
+        self.cache.load_cube(self.filepath)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+
+    def test_subset(self):
+        """Test that loads of a subset are cached separately from loads of
+        the whole file and of other subsets."""
+        subset = {"realization": [0, 2], "latitude": slice(0, 2)}
+        first = self.cache.load_cube(self.filepath, subset=subset)
+        second = self.cache.load_cube(self.filepath, subset=dict(subset))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(first, second)
+        self.assertEqual(first.shape, (2, 2, 3))
+        self.cache.load_cube(self.filepath, subset={"realization": (0, 2)})
+        self.cache.load_cube(self.filepath)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+    def test_lazy_entry_size(self):
+        """Test that a cube with lazy data is counted at the size of its
+        coordinates rather than of its data."""
+        cube = set_up_variable_cube(np.ones((3, 20, 20), dtype=np.float32))
+        lazy_cube = cube.copy(data=da.from_array(cube.data))
+        coord_nbytes = CubeCache._cube_nbytes(lazy_cube)
+        self.assertGreater(coord_nbytes, 0)
+        self.assertEqual(CubeCache._cube_nbytes(cube), coord_nbytes + cube.data.nbytes)
+
+    def test_returns_copy_of_loaded_cube(self):
+        """Test that the loaded cube is cached and a copy returned, so that
+        modifying the first result does not modify the cache."""
+        first = self.cache.load_cube(self.filepath, no_lazy_load=True)
+        ((cached, _),) = self.cache._entries.values()
+        self.assertIsNot(first, cached)
+        self.assertIsNot(first.data, cached.data)
+
+    def test_disabled(self):
+        """Test that loads are passed straight through to the loader while
+        the cache is disabled, and use the cache within enable()."""
+        self.cache.enabled = False
+        self.cache.load_cube(self.filepath)
+        self.cache.load_cube(self.filepath)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+        with self.cache.enable():
+            self.cache.load_cube(self.filepath)
+            self.cache.load_cube(self.filepath)
+        self.assertFalse(self.cache.enabled)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_shared_cache_disabled(self):
+        """Test that the cache shared by CLI calls is disabled by default."""
+        self.assertFalse(CUBE_CACHE.enabled)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the "memo" module"""
+
+import json
+
+import numpy as np
+import pytest
+
+from improver import BasePlugin
+from improver.telemetry import telemetry_enable
+from improver.utilities.memo import SliceMemo, array_digest
+
+
+def test_array_digest():
+    """Test digests are equal only for arrays with the same shape, dtype,
+    values and mask"""
+    data = np.arange(6, dtype=np.float32).reshape(2, 3)
+    assert array_digest(data) == array_digest(data.copy())
+    assert array_digest(data.T) == array_digest(np.ascontiguousarray(data.T))
+    assert array_digest(data) != array_digest(data.reshape(3, 2))
+    assert array_digest(data) != array_digest(data.astype(np.float64))
+    assert array_digest(data) != array_digest(data + 1)
+    masked = np.ma.masked_array(data, mask=False)
+    assert array_digest(masked) != array_digest(np.ma.masked_less(data, 1))
+    assert array_digest(data, None) != array_digest(data, data)
+
+
+def test_call():
+    """Test a function is called once for each distinct array"""
+    calls = []
+
+    def function(data):
+        calls.append(data)
+        return data.sum()
+
+    memo = SliceMemo("test")
+    zeros = np.zeros((2, 2))
+    results = [memo(function, array) for array in [zeros, np.ones((2, 2)), zeros]]
+    assert results == [0, 4, 0]
+    assert len(calls) == 2
+    assert memo(function, zeros, extra=1) == 0
+    assert len(calls) == 3
+
+
+def test_unique():
+    """Test distinct slices are found along the leading dimension,
+    including the combination of slices of several arrays"""
+    data = np.array([[0, 0], [1, 1], [0, 0], [1, 1]])
+    masks = np.array([[0, 1], [0, 1], [0, 1], [1, 1]])
+    indices, inverse = SliceMemo("test").unique(data)
+    np.testing.assert_array_equal(indices, [0, 1])
+    np.testing.assert_array_equal(data[indices][inverse], data)
+    indices, inverse = SliceMemo("test").unique(data, masks)
+    np.testing.assert_array_equal(indices, [0, 1, 3])
+    np.testing.assert_array_equal(inverse, [0, 1, 0, 2])
+    indices, _ = SliceMemo("test").unique(data, None)
+    np.testing.assert_array_equal(indices, [0, 1])
+
+
+class UniquePlugin(BasePlugin):
+    """Plugin finding the distinct slices of an array"""
+
+    def process(self, data):
+        SliceMemo("slices").unique(data)
+        return data
+
+
+@pytest.fixture(name="telemetry_path")
+def telemetry_path_fixture(tmp_path):
+    """Enable telemetry to a temporary file for the duration of a test"""
+    path = tmp_path / "telemetry.jsonl"
+    with telemetry_enable(str(path)):
+        yield path
+
+
+def test_counters(telemetry_path):
+    """Test the numbers of computed and reused slices are recorded in the
+    telemetry of the plugin call"""
+    UniquePlugin()(np.array([[0, 0], [1, 1], [0, 0]]))
+    with open(telemetry_path) as fin:
+        (record,) = [json.loads(line) for line in fin]
+    assert record["counters"] == {"slices.computed": 2, "slices.reused": 1}
@@ -6,12 +6,19 @@
 
 import numpy as np
 import pytest
+from scipy.ndimage import correlate
 
+from improver.nbhood.nbhood import circular_kernel
 from improver.utilities.neighbourhood_tools import (
+    blocked_boxsum,
+    blocked_cumsums,
     boxsum,
+    boxsums,
+    chordsum,
     pad_and_roll,
     pad_boxsum,
     rolling_window,
+    sparse_clusters,
 )
 
 
@@ -185,3 +192,132 @@ def test_boxsum_exception_not_odd(array_size_5):
     with pytest.raises(ValueError) as exc_info:
         boxsum(array_size_5, (1, 2))
     assert msg in str(exc_info.value)
+
+
+@pytest.mark.parametrize("pad_options", [{}, {"mode": "constant"}, {"mode": "edge"}])
+def test_boxsums(array_size_5, pad_options):
+    """Test boxsums gives the same results as boxsum for each size."""
+    boxsizes = [3, 1, (5, 3)]
+    results = boxsums(array_size_5, boxsizes, **pad_options)
+    for result, boxsize in zip(results, boxsizes):
+        expected = boxsum(array_size_5, boxsize, **pad_options)
+        np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("axis", [0, -1])
+def test_blocked_cumsums(axis):
+    """Test the float64 cumulative sums of each block of float32 data give
+    the totals of the data over every window that ends within the overlap
+    of the block, along either axis."""
+    data = np.random.default_rng(0).random((25, 3)).astype(np.float32)
+    data = np.moveaxis(data, 0, axis)
+    overlap = 4
+    blocks = list(blocked_cumsums(data, axis, overlap, block_size=8))
+    assert [block for block, _ in blocks] == [slice(0, 8), slice(8, 16), slice(16, 21)]
+    for block, cumulative in blocks:
+        assert cumulative.dtype == np.float64
+        assert cumulative.shape[axis] == block.stop - block.start + overlap + 1
+        expected = np.cumsum(
+            np.take(data, range(block.start, block.stop + overlap), axis=axis),
+            axis=axis,
+            dtype=np.float64,
+        )
+        np.testing.assert_allclose(
+            np.take(cumulative, range(1, cumulative.shape[axis]), axis=axis),
+            expected,
+        )
+        np.testing.assert_array_equal(np.take(cumulative, 0, axis=axis), 0)
+
+
+@pytest.mark.parametrize("boxsize", [1, 3, (5, 3)])
+@pytest.mark.parametrize("pad_options", [{}, {"mode": "constant"}, {"mode": "edge"}])
+def test_blocked_boxsum(boxsize, pad_options):
+    """Test blocked_boxsum of float32 data matches boxsum of the same
+    data in float64, for a grid large enough that totals from a float32
+    summed-area table would be inaccurate."""
+    data = 1000 + np.random.default_rng(0).random((2, 300, 200)).astype(np.float32)
+    expected = boxsum(data.astype(np.float64), boxsize, **pad_options)
+    result = blocked_boxsum(data, boxsize, **pad_options)
+    assert result.dtype == np.float32
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+def test_blocked_boxsum_exception_not_odd(array_size_5):
+    """Test that an exception is raised if the neighbourhood size is not
+    an odd number."""
+    with pytest.raises(ValueError, match="must be an odd number"):
+        blocked_boxsum(array_size_5.astype(np.float32), 4)
+
+
+@pytest.mark.parametrize("ranges", [1, 2, 5])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_chordsum_matches_correlate(ranges, dtype):
+    """Test chordsum gives the same totals as correlation over a circular
+    kernel, including near the edges, for each slice of a 3D array."""
+    data = np.random.default_rng(0).random((2, 15, 12)).astype(dtype)
+    kernel = circular_kernel(ranges, weighted_mode=False)
+    result = chordsum(data, kernel)
+    assert result.dtype == dtype
+    for result_slice, data_slice in zip(result, data):
+        np.testing.assert_allclose(
+            result_slice, correlate(data_slice, kernel, mode="nearest"), rtol=1e-5
+        )
+
+
+def test_chordsum_blocked():
+    """Test blocked chordsum of float32 data matches correlation of the
+    same data in float64 over a large kernel."""
+    data = 1000 + np.random.default_rng(0).random((2, 200, 150)).astype(np.float32)
+    kernel = circular_kernel(10, weighted_mode=False)
+    result = chordsum(data, kernel, blocked=True)
+    assert result.dtype == np.float32
+    for result_slice, data_slice in zip(result, data.astype(np.float64)):
+        np.testing.assert_allclose(
+            result_slice, correlate(data_slice, kernel, mode="nearest"), rtol=1e-6
+        )
+
+
+def test_chordsum_split_chords(array_size_5):
+    """Test a kernel with more than one chord in a row."""
+    kernel = np.array([[1, 0, 1], [0, 1, 0], [1, 1, 0]])
+    result = chordsum(array_size_5, kernel)
+    expected = correlate(array_size_5, kernel, mode="nearest")
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_chordsum_exception_weighted(array_size_5):
+    """Test an exception is raised for a weighted kernel."""
+    kernel = np.array([[0, 0.5, 0], [0.5, 1, 0.5], [0, 0.5, 0]])
+    with pytest.raises(ValueError, match="only contain zeros and ones"):
+        chordsum(array_size_5, kernel)
+
+
+def test_sparse_clusters():
+    """Test events are grouped into clusters where their neighbourhoods
+    touch, with bounding boxes of the extended events clipped to the grid."""
+    events = np.zeros((50, 40), dtype=np.float32)
+    events[0, 0] = 1
+    events[20, 20] = events[24, 20] = 0.5
+    events[49, 39] = 1
+    labels, boxes = sparse_clusters(events, 2)
+    assert boxes == [
+        (slice(0, 3), slice(0, 3)),
+        (slice(18, 27), slice(18, 23)),
+        (slice(47, 50), slice(37, 40)),
+    ]
+    for number, box in enumerate(boxes, start=1):
+        assert np.all(labels[box] == number)
+    assert np.count_nonzero(labels) == 9 + 45 + 9
+
+
+@pytest.mark.parametrize("radius", [0, 20])
+def test_sparse_clusters_not_sparse(radius):
+    """Test None is returned if too many points are events, or if the
+    clusters cover most of the grid."""
+    events = np.zeros((50, 40), dtype=bool)
+    if radius:
+        events[25, 20] = True
+    else:
+        events[:5] = True
+    assert sparse_clusters(events, radius) is None
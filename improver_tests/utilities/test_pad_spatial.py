@@ -19,6 +19,7 @@ from improver.utilities.pad_spatial import (
     pad_cube_with_halo,
     remove_cube_halo,
     remove_halo_from_cube,
+    tiles_with_halo,
 )
 
 
@@ -541,5 +542,32 @@ class Test_remove_halo_from_cube(IrisTest):
         self.assertArrayAlmostEqual(padded_cube.data, expected)
 
 
+class Test_tiles_with_halo(IrisTest):
+    """Test a grid is split into tiles with halos."""
+
+    def test_basic(self):
+        """Test the tiles cover the grid once, and each halo extends its tile
+        by the requested widths within the grid."""
+        shape = (10, 7)
+        covered = np.zeros(shape, dtype=int)
+        data = np.arange(70).reshape(shape)
+        tiles = list(tiles_with_halo(shape, 4, width_x=1, width_y=2))
+        self.assertEqual(len(tiles), 6)
+        for tile, halo, core in tiles:
+            covered[tile] += 1
+            self.assertArrayEqual(data[halo][core], data[tile])
+            for tile_slice, halo_slice, width, length in zip(tile, halo, (2, 1), shape):
+                self.assertEqual(halo_slice.start, max(tile_slice.start - width, 0))
+                self.assertEqual(halo_slice.stop, min(tile_slice.stop + width, length))
+        self.assertArrayEqual(covered, np.ones(shape))
+
+    def test_single_tile(self):
+        """Test a grid no larger than a tile gives a single tile, with a halo
+        covering the whole grid."""
+        tiles = list(tiles_with_halo((3, 4), 4, width_x=2, width_y=2))
+        whole = (slice(0, 3), slice(0, 4))
+        self.assertEqual(tiles, [(whole, whole, whole)])
+
+
 if __name__ == "__main__":
     unittest.main()
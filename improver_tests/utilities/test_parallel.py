@@ -0,0 +1,117 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the "parallel" module"""
+
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+from improver.utilities.parallel import (
+    SharedArrays,
+    attach_shared_arrays,
+    process_map,
+    shared_memory_available,
+    thread_map,
+)
+
+requires_shared_memory = pytest.mark.skipif(
+    not shared_memory_available(), reason="shared memory requires Python 3.8"
+)
+
+# Arrays attached by _attach in each worker process.
+_ARRAYS = {}
+
+
+def _attach(handles):
+    """Attach to shared arrays in a worker process."""
+    _ARRAYS["blocks"], _ARRAYS["arrays"] = attach_shared_arrays(handles)
+
+
+def _row_sum(index):
+    """Sum a row of the shared array named "data"."""
+    return _ARRAYS["arrays"]["data"][index].sum()
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+def test_order(n_workers):
+    """Test results are returned in the order of the items"""
+    result = list(thread_map(lambda x: x * x, range(20), n_workers=n_workers))
+    assert result == [x * x for x in range(20)]
+
+
+def test_serial_in_calling_thread():
+    """Test items are processed in the calling thread with one worker"""
+    threads = set(thread_map(lambda _: threading.get_ident(), range(3)))
+    assert threads == {threading.get_ident()}
+
+
+def test_max_in_flight():
+    """Test no more than max_in_flight items are taken from the iterable
+    before their results are consumed"""
+    taken = []
+
+    def items():
+        for item in range(10):
+            taken.append(item)
+            yield item
+
+    results = thread_map(lambda x: x, items(), n_workers=2, max_in_flight=3)
+    assert next(results) == 0
+    assert len(taken) <= 4
+    assert list(results) == list(range(1, 10))
+
+
+def test_error():
+    """Test an error raised by the function is raised to the caller"""
+
+    def fail(x):
+        if x == 2:
+            raise ValueError("failed")
+        return x
+
+    with pytest.raises(ValueError, match="failed"):
+        list(thread_map(fail, range(5), n_workers=2))
+
+
+@requires_shared_memory
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_process_map_shared_arrays(n_workers):
+    """Test process_map returns results in order, with the workers reading
+    arrays from shared memory"""
+    data = np.arange(20, dtype=np.float64).reshape(10, 2)
+    with SharedArrays({"data": data}) as shared:
+        result = list(
+            process_map(
+                _row_sum,
+                range(10),
+                n_workers=n_workers,
+                initializer=_attach,
+                initargs=(shared.handles,),
+            )
+        )
+    assert result == list(data.sum(axis=1))
+
+
+def test_shared_memory_available():
+    """Test shared memory is reported as available from Python 3.8"""
+    assert shared_memory_available() == (sys.version_info >= (3, 8))
+
+
+@requires_shared_memory
+def test_shared_arrays_masked():
+    """Test masked arrays are shared with their mask"""
+    data = np.ma.masked_less(np.arange(6, dtype=np.float32).reshape(2, 3), 2)
+    with SharedArrays({"data": data, "plain": data.data}) as shared:
+        blocks, arrays = attach_shared_arrays(shared.handles)
+        assert isinstance(arrays["data"], np.ma.MaskedArray)
+        np.testing.assert_array_equal(arrays["data"].mask, data.mask)
+        np.testing.assert_array_equal(arrays["data"].data, data.data)
+        assert not np.ma.isMaskedArray(arrays["plain"])
+        assert arrays["plain"].dtype == np.float32
+        del arrays
+        for block in blocks:
+            block.close()
@@ -9,6 +9,7 @@ import os
 import unittest
 from tempfile import mkdtemp
 
+import dask.array as da
 import iris
 import numpy as np
 import pytest
@@ -16,7 +17,10 @@ from iris.coords import CellMethod
 from iris.tests import IrisTest
 from netCDF4 import Dataset
 
-from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.synthetic_data.set_up_test_cubes import (
+    add_coordinate,
+    set_up_variable_cube,
+)
 from improver.utilities.load import load_cube
 from improver.utilities.save import _order_cell_methods, save_netcdf
 
@@ -121,6 +125,44 @@ class Test_save_netcdf(IrisTest):
         with self.assertRaises(ValueError):
             save_netcdf(self.cube, self.filepath, compression_level=10)
 
+    def test_lazy_data(self):
+        """Test lazy data is saved in x-y slices, matching the netCDF
+        chunking, without realising or rechunking the data of the input
+        cube"""
+        cube = add_coordinate(self.cube[0], [0, 1, 2], "height", coord_units="m")
+        cube.data = da.from_array(cube.data, chunks=(2, 3, 3))
+        save_netcdf(cube, self.filepath)
+        self.assertTrue(cube.has_lazy_data())
+        self.assertEqual(cube.lazy_data().chunks, ((2, 1), (3,), (3,)))
+        data = Dataset(self.filepath).variables["air_temperature"]
+        self.assertEqual(data.chunking(), [1, 3, 3])
+        self.assertArrayEqual(data[:], cube.data)
+
+    def test_chunking(self):
+        """Test the chunk shape of the saved data for each chunking option"""
+        cube = add_coordinate(self.cube[0], [0, 1, 2], "height", coord_units="m")
+        for chunking, target_bytes, expected in [
+            ("field", 4, [1, 3, 3]),
+            ("series", 4, [3, 1, 1]),
+            ("series", 24, [3, 1, 2]),
+            ("balanced", 24, [1, 2, 2]),
+        ]:
+            save_netcdf(
+                cube,
+                self.filepath,
+                chunking=chunking,
+                chunk_target_bytes=target_bytes,
+            )
+            with Dataset(self.filepath) as dataset:
+                result = dataset.variables["air_temperature"].chunking()
+            self.assertEqual(result, expected, msg=chunking)
+
+    def test_chunking_invalid(self):
+        """Test an unknown chunking option raises an error"""
+        msg = "Chunking must be one of"
+        with self.assertRaisesRegex(ValueError, msg):
+            save_netcdf(self.cube, self.filepath, chunking="rows")
+
     def test_basic_cube_list(self):
         """
         Test functionality for saving iris.cube.CubeList